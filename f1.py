@@ -1,24 +1,47 @@
 import os
 import sys
 import time
+LAUNCH_CLOCK = time.perf_counter()  # Start of the stopwatch for the startup budget
 import random
-import psutil
-import platform
+import re
+import heapq
+import itertools
+import fnmatch
+import functools
+from array import array
+import importlib
+import json
+import io
+import calendar
+import bisect
+import mmap
+import shlex
+import codecs
+import select
+import tempfile
+import threading
+import unicodedata
+import warnings
 import shutil # Added for robust argument handling
-from rich.console import Console
+from collections import OrderedDict, deque
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from rich.live import Live
 from rich.text import Text
 from rich.align import Align
+from rich.columns import Columns
+from rich.markup import escape
 from datetime import datetime
-import feedparser
-import speedtest
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 import subprocess
 
+# Heavy parts are only bolted on when a command needs them (see LAZY PARTS BIN)
+psutil = platform = feedparser = speedtest = None
+Live = Progress = SpinnerColumn = BarColumn = TextColumn = None
+ThreadPoolExecutor = ProcessPoolExecutor = as_completed = None
+asyncio = numpy = None
+
 # --- WINDOWS TERMINAL FORCE LAUNCHER ---
-if sys.platform == "win32":
+if sys.platform == "win32" and __name__ == "__main__":  # Not in strategy worker processes
     # Check if we are already in Windows Terminal
     if "WT_SESSION" not in os.environ:
         try:
@@ -39,44 +62,2676 @@ if sys.platform == "win32":
 # --- CONFIGURATION ---
 DRIVER_NAME = "JOE"   
 TYRE_STRATEGY = ["SOFT", "MEDIUM", "HARD", "INTER"]
+TYRE_COLORS = {"SOFT": "red", "MEDIUM": "yellow", "HARD": "white", "INTER": "green"}
+CACHE_DIR = os.environ.get("F1_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".f1_os"))
+# Paddock news sources. Override with F1_NEWS_FEEDS (comma separated) or
+# one URL per line in ~/.f1_os/feeds.txt
+NEWS_FEEDS = [
+    "https://news.google.com/rss/search?q=Formula+1+racing&hl=en-US&gl=US&ceid=US:en",
+    "https://www.formula1.com/en/latest/all.xml",
+    "https://www.autosport.com/rss/f1/news/",
+    "https://www.motorsport.com/rss/f1/news/",
+]
+NEWS_TTL = 10 * 60     # seconds before cached headlines get revalidated
+NEWS_TIMEOUT = 8       # seconds each feed gets before it's left behind
+# Start sequence: "full" (lights + logo), "fast" (a quick one) or "off".
+# Override with F1_BOOT or --fast-boot / --no-boot. Any key skips it.
+BOOT_MODES = ("full", "fast", "off")
+BOOT_MODE = os.environ.get("F1_BOOT", "full").lower()
+STARTUP_BUDGET = 1.0   # seconds from process start to first prompt with --no-boot
 
 # Initialize Rich Console
 console = Console()
 
-class PitWallOS:
+# Data files ship next to the script (or inside the bundle when frozen)
+APP_DIR = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+TRACKS_FILE = os.path.join(APP_DIR, "tracks.txt")
+CHAMPIONS_FILE = os.path.join(APP_DIR, "champions.csv")
+CALENDAR_FILE = os.path.join(APP_DIR, "f1_calendar.txt")
+
+# --- LAZY PARTS BIN ---
+# Most sessions only use grid/box and the system passthrough, so the heavy
+# libraries (speedtest, feedparser, psutil...) are imported the first time a
+# command that needs them runs, instead of on every launch.
+COMMAND_DEPS = {}   # cmd_* name -> parts it pulls in
+PARTS_FITTED = {}   # part spec -> seconds spent importing it
+
+def load_part(spec):
+    """Imports a part into module globals. Spec is 'module' or 'module:Attr,Attr'."""
+    if spec in PARTS_FITTED:
+        return
+    module_name, _, attrs = spec.partition(":")
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    if attrs:
+        for attr in attrs.split(","):
+            globals()[attr] = getattr(module, attr)
+    else:
+        globals()[module_name.split(".")[0]] = importlib.import_module(module_name.split(".")[0])
+    PARTS_FITTED[spec] = time.perf_counter() - start
+
+def fit_parts(*specs):
+    """Decorator: loads the listed parts the first time the command is called."""
+    def decorator(func):
+        COMMAND_DEPS[func.__qualname__] = specs
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for spec in specs:
+                load_part(spec)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# --- COMMAND REGISTRY ---
+# Every command, with its aliases, is one entry in a dict, so dispatch is a
+# single lookup. Builtins register with @command on PitWallOS methods. Other
+# packages can add commands through the "f1_os.commands" entry point group:
+#     [project.entry-points."f1_os.commands"]
+#     pitstop = "my_package.f1:pitstop"    # pitstop(pit_wall, arg_string)
+# Plugins are only listed (never imported) until one is actually run.
+PLUGIN_GROUP = "f1_os.commands"
+
+class CommandSpec:
+    __slots__ = ("name", "aliases", "handler", "usage", "summary", "options", "takes_arg",
+                 "entry_point", "background")
+
+    def __init__(self, name, aliases=(), handler=None, usage=None, summary="", options=None,
+                 takes_arg=True, entry_point=None, background=True):
+        self.name = name
+        self.background = background
+        self.aliases = aliases
+        self.handler = handler
+        self.usage = usage or name
+        self.summary = summary
+        self.options = options
+        self.takes_arg = takes_arg
+        self.entry_point = entry_point
+
+class CommandRegistry:
+    """Name/alias -> CommandSpec, plus lazily discovered plugin commands."""
+    def __init__(self, group=PLUGIN_GROUP):
+        self.group = group
+        self.commands = {}
+        self.order = []
+        self._plugins_listed = False
+
+    def register(self, spec):
+        for name in (spec.name,) + tuple(spec.aliases):
+            if name in self.commands:
+                raise ValueError(f"command '{name}' is already registered")
+        for name in (spec.name,) + tuple(spec.aliases):
+            self.commands[name] = spec
+        self.order.append(spec)
+
+    def lookup(self, name):
+        """The command for a name or alias, or None (-> system shell)."""
+        spec = self.commands.get(name)
+        if spec is None and not self._plugins_listed:
+            self.list_plugins()
+            spec = self.commands.get(name)
+        return spec
+
+    def list_plugins(self):
+        """Reads the entry point table once. Nothing is imported here."""
+        self._plugins_listed = True
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:
+            return
+        try:
+            found = entry_points(group=self.group)
+        except TypeError:  # Python < 3.10
+            found = entry_points().get(self.group, ())
+        for entry_point in found:
+            name = entry_point.name.lower()
+            if name in self.commands:
+                continue  # Builtins (and the first plugin to claim a name) win
+            dist = getattr(entry_point, "dist", None)
+            self.register(CommandSpec(name, summary=f"Plugin ({dist.name})" if dist else "Plugin",
+                                      entry_point=entry_point))
+
+    def resolve(self, spec):
+        """The handler to call, importing a plugin the first time it's used."""
+        if spec.handler is None:
+            spec.handler = spec.entry_point.load()
+            if spec.handler.__doc__:
+                spec.summary = spec.handler.__doc__.strip().splitlines()[0]
+        return spec.handler
+
+    def help_entries(self):
+        """Builtins then plugins, each alphabetical."""
+        if not self._plugins_listed:
+            self.list_plugins()
+        return sorted(self.order, key=lambda spec: (spec.entry_point is not None, spec.name))
+
+COMMANDS = CommandRegistry()
+
+# A handler returns None when it did its job. When it couldn't (bad usage,
+# no data, a failed fetch...) it prints why and returns an exit status -
+# COMMAND_FAILED, or a relayed command's own - which batch mode reports.
+COMMAND_FAILED = 1
+
+def command(name, *aliases, usage=None, summary="", options=None, background=True):
+    """Decorator: registers a PitWallOS method as a command under name + aliases.
+    background=False for commands that only make sense at the prompt (cd, fg...)."""
+    def decorator(func):
+        target = func
+        while hasattr(target, "__wrapped__"):  # Look through @fit_parts
+            target = target.__wrapped__
+        COMMANDS.register(CommandSpec(name, aliases, func, usage, summary, options,
+                                      takes_arg=target.__code__.co_argcount > 1, background=background))
+        return func
+    return decorator
+
+# --- HELPERS ---
+GRID_PAGE_SIZE = 20
+DIR_SIZE_CACHE_LIMIT = 50000   # directories remembered in dirsizes.json
+GRID_SORTS = ("size", "mtime", "name")
+
+def format_size(size):
+    if size > 1024*1024: return f"{round(size/(1024*1024), 1)} MB"
+    elif size > 1024: return f"{round(size/1024, 1)} KB"
+    else: return f"{size} B"
+
+def parse_flags(arg_string, switches=(), options=()):
+    """Pulls --switches and --option values out of a raw argument string.
+
+    Returns (flags, rest). The rest keeps its spacing, so
+    "--all My Folder" -> ({"--all": True}, "My Folder").
+    """
+    flags = {name: False for name in switches}
+    flags.update({name: None for name in options})
+    if not arg_string:
+        return flags, arg_string
+
+    kept = []
+    tokens = iter(arg_string.split(" "))
+    for token in tokens:
+        name, eq, value = token.partition("=")
+        if token in switches:
+            flags[token] = True
+        elif name in options:
+            flags[name] = value if eq else next(tokens, None)
+        else:
+            kept.append(token)
+    rest = " ".join(kept).strip()
+    return flags, rest or None
+
+def format_ms(ms):
+    return f"{ms:.1f} ms" if ms >= 1 else f"{ms:.3f} ms"
+
+def race_time(ms):
+    """81345 -> '1:21.345', 5523897 -> '1:32:03.897'."""
+    seconds, ms = divmod(ms, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}.{ms:03d}"
+    return f"{minutes}:{seconds:02d}.{ms:03d}"
+
+def parse_address(text, default_host="127.0.0.1", default_port=None):
+    """'host:port', 'host', ':port' or '[v6]:port' -> (host, port). Port is an int or None."""
+    host, port = text.strip(), default_port
+    if host.startswith("["):
+        host, _, rest = host[1:].partition("]")
+        if rest.startswith(":"):
+            port = int(rest[1:])
+    elif host.count(":") == 1:
+        host, _, port_text = host.partition(":")
+        port = int(port_text)
+    return host or default_host, port
+
+def write_json_atomic(path, data):
+    """Writes JSON next to `path` and swaps it in, so readers never see half a file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        fh.write(data if isinstance(data, str) else json.dumps(data))
+    os.replace(tmp_path, path)
+
+def name_filter(glob=None, regex=None):
+    """Compiles --glob/--regex into one name check (None when there's nothing to filter)."""
+    checks = []
+    if glob:
+        glob_match = re.compile(fnmatch.translate(os.path.normcase(glob))).match
+        checks.append(lambda name: glob_match(os.path.normcase(name)) is not None)
+    if regex:
+        regex_search = re.compile(regex).search
+        checks.append(lambda name: regex_search(name) is not None)
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    return lambda name: all(check(name) for check in checks)
+
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)")
+
+def split_commands(script):
+    """Splits a batch script into command lines on newlines and unquoted ';'.
+    Blank lines and '#' comment lines are dropped."""
+    commands, current, quote = [], [], None
+    for char in script + "\n":
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in ";\n":
+            line = "".join(current).strip()
+            if line and not line.startswith("#"):
+                commands.append(line)
+            current = []
+            continue
+        current.append(char)
+    return commands
+
+# --- TRACK DATABASE ---
+class TrackStore:
+    """Memory-mapped track database built from tracks.txt.
+
+    The file holds `name/alias = <triple-quoted art>` blocks. Opening the store only
+    scans for the block headers and records byte offsets - the art itself is
+    decoded when a circuit is actually requested.
+    """
+    HEADER = b' = """'
+    FOOTER = b'"""'
+    SPECS = re.compile(r"([\d.]+) km \| (\d+) Laps")
+
+    def __init__(self, path=TRACKS_FILE):
+        self.path = path
+        self._map = None
+        self._index = None   # normalized alias -> (start, end) byte offsets
+        self._names = []     # primary names, in file order
+        self._primary = {}   # normalized alias -> primary name
+
+    @staticmethod
+    def normalize(name):
+        """'Abu Dhabi', 'abu_dhabi' and 'abudhabi' all hit the same entry."""
+        return name.lower().replace(" ", "").replace("_", "").replace("-", "")
+
+    def _open(self):
+        if self._index is not None:
+            return
+        with open(self.path, "rb") as fh:
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        index, names = {}, []
+        pos = 0
+        while True:
+            header = self._map.find(self.HEADER, pos)
+            if header == -1:
+                break
+            line_start = self._map.rfind(b"\n", 0, header) + 1
+            start = header + len(self.HEADER)
+            end = self._map.find(self.FOOTER, start)
+            if end == -1:
+                break
+            aliases = self._map[line_start:header].decode("utf-8").strip().split("/")
+            names.append(aliases[0])
+            for alias in aliases:
+                index[self.normalize(alias)] = (start, end)
+                self._primary[self.normalize(alias)] = aliases[0]
+            pos = end + len(self.FOOTER)
+
+        self._index, self._names = index, names
+
+    def names(self):
+        self._open()
+        return list(self._names)
+
+    def get(self, track_name):
+        """Returns the art for a circuit (or any of its aliases), None if unknown."""
+        self._open()
+        offsets = self._index.get(self.normalize(track_name))
+        if offsets is None:
+            return None
+        start, end = offsets
+        return self._map[start:end].decode("utf-8").replace("\r\n", "\n")
+
+    def specs(self, track_name):
+        """(primary name, km, laps) from the circuit's caption, None if unknown."""
+        art = self.get(track_name)
+        found = self.SPECS.search(art) if art else None
+        if not found:
+            return None
+        return self._primary[self.normalize(track_name)], float(found.group(1)), int(found.group(2))
+
+TRACKS = TrackStore()
+
+# --- RACE CALENDAR ---
+class RaceWeekend:
+    """One event: its sessions as (name, epoch seconds), in running order.
+    `estimated` names the sessions whose time isn't published yet."""
+    __slots__ = ("season", "round", "event", "circuit", "timezone", "tz", "sessions", "estimated")
+
+    def __init__(self, season, round_number, event, circuit, timezone, tz):
+        self.season = season
+        self.round = round_number
+        self.event = event
+        self.circuit = circuit
+        self.timezone = timezone  # IANA name, for display
+        self.tz = tz              # Fixed UTC offset the start times were given in
+        self.sessions = []
+        self.estimated = set()
+
+    @property
+    def race_start(self):
+        return self.sessions[-1][1]
+
+    @property
+    def sprint(self):
+        return any(name == "Sprint" for name, _ in self.sessions)
+
+    def track_time(self, ts):
+        return datetime.fromtimestamp(ts, self.tz)
+
+class RaceCalendar:
+    """Every weekend in f1_calendar.txt (all seasons), parsed once.
+
+    The file has one session per CSV row with its local start and UTC offset,
+    and whether that time is published or estimated.
+    Race starts and session starts end up as epoch seconds in sorted arrays,
+    so "what's next" is a bisect and a season is a slice of the weekend list.
+    """
+    def __init__(self, path=CALENDAR_FILE):
+        import csv
+        weekends = {}
+        with open(path, newline="", encoding="utf-8") as fh:
+            for row in csv.DictReader(line for line in fh if not line.startswith("#")):
+                start = datetime.fromisoformat(row["start"])
+                key = (int(row["season"]), int(row["round"]))
+                weekend = weekends.get(key)
+                if weekend is None:
+                    weekend = weekends[key] = RaceWeekend(*key, row["event"], row["circuit"],
+                                                          row["timezone"], start.tzinfo)
+                weekend.sessions.append((row["session"], start.timestamp()))
+                if row["status"] == "estimated":
+                    weekend.estimated.add(row["session"])
+
+        for weekend in weekends.values():
+            weekend.sessions.sort(key=lambda session: session[1])
+        self.weekends = sorted(weekends.values(), key=lambda weekend: weekend.race_start)
+        self.race_starts = array("d", (weekend.race_start for weekend in self.weekends))
+
+        sessions = sorted((ts, i, name) for i, weekend in enumerate(self.weekends) for name, ts in weekend.sessions)
+        self.session_starts = array("d", (ts for ts, _, _ in sessions))
+        self.session_refs = [(self.weekends[i], name) for _, i, name in sessions]
+
+        self.seasons = {}  # season -> range() into weekends
+        for i, weekend in enumerate(self.weekends):
+            first = self.seasons.get(weekend.season, range(i, i)).start
+            self.seasons[weekend.season] = range(first, i + 1)
+
+    def upcoming(self, count=None, now=None):
+        """Weekends whose race hasn't started yet, soonest first."""
+        i = bisect.bisect_right(self.race_starts, time.time() if now is None else now)
+        return self.weekends[i:] if count is None else self.weekends[i:i + count]
+
+    def next_session(self, now=None):
+        """(weekend, session name, start) of the next session, or None."""
+        i = bisect.bisect_right(self.session_starts, time.time() if now is None else now)
+        if i == len(self.session_starts):
+            return None
+        return self.session_refs[i] + (self.session_starts[i],)
+
+    def season(self, year):
+        rows = self.seasons.get(year)
+        return self.weekends[rows.start:rows.stop] if rows else []
+
+    def find(self, text):
+        """The latest weekend whose event or circuit contains `text`."""
+        needle = text.lower()
+        return next((w for w in reversed(self.weekends)
+                     if needle in w.event.lower() or needle in w.circuit.lower()), None)
+
+@functools.lru_cache(maxsize=None)
+def race_calendar():
+    """Loaded on first use, then shared."""
+    return RaceCalendar()
+
+def countdown(seconds):
+    """Seconds -> '12d 4h' / '3h 20m' / '45m'."""
+    minutes = int(seconds // 60)
+    days, minutes = divmod(minutes, 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    if days:
+        return f"{days}d {hours}h"
+    return f"{hours}h {minutes:02d}m" if hours else f"{minutes}m"
+
+# --- RECORD BOOK (COLUMNAR STORE) ---
+def fold_accents(text):
+    """'Räikkönen' -> 'raikkonen', for typing names on a plain keyboard."""
+    return "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c)).casefold()
+
+class StringPool:
+    """Interns strings: each distinct value is stored once, rows hold its code.
+
+    search() goes through a suffix index of the folded values (every suffix,
+    sorted, with the code it came from), so a name filter is a bisect plus
+    the matches rather than folding every value on every query. It is built
+    on the first search and kept until a new value is interned.
+    """
+    def __init__(self, values=()):
+        self.values = list(values)
+        self.codes = {value: code for code, value in enumerate(self.values)}
+        self._suffixes = None
+        self._owners = None
+
+    def intern(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+            self._suffixes = None
+        return code
+
+    def __getitem__(self, code):
+        return self.values[code]
+
+    def __len__(self):
+        return len(self.values)
+
+    def search(self, text):
+        """Codes of every value containing `text` (ignoring case and accents), in code order."""
+        if self._suffixes is None:
+            suffixes = sorted((folded[start:], code) for code, folded in enumerate(map(fold_accents, self.values))
+                              for start in range(len(folded) + 1))
+            self._suffixes = [suffix for suffix, _ in suffixes]
+            self._owners = array("I", (code for _, code in suffixes))
+        needle = fold_accents(text)
+        lo = bisect.bisect_left(self._suffixes, needle)
+        hi = bisect.bisect_left(self._suffixes, needle + "\U0010ffff", lo)  # Every suffix starting with it
+        return sorted(set(self._owners[lo:hi]))
+
+class CsrIndex:
+    """A text-column index packed flat: row ids grouped by code in `order`,
+    with code c's rows at order[offsets[c]:offsets[c + 1]]. It is just two
+    int arrays, so it can be written out and mapped back as-is."""
+    def __init__(self, offsets, order):
+        self.offsets = offsets
+        self.order = order
+
+    @classmethod
+    def from_groups(cls, groups, size):
+        offsets, order = array("I", [0]), array("I")
+        for code in range(size):
+            order.extend(groups.get(code, ()))
+            offsets.append(len(order))
+        return cls(offsets, order)
+
+    def __contains__(self, code):
+        return 0 <= code < len(self.offsets) - 1 and self.offsets[code] != self.offsets[code + 1]
+
+    def __getitem__(self, code):
+        return self.order[self.offsets[code]:self.offsets[code + 1]]
+
+    def items(self):
+        return ((code, self[code]) for code in range(len(self.offsets) - 1) if code in self)
+
+class ColumnTable:
+    """Rows stored column by column: one typed array per column, with text
+    columns holding StringPool codes. Indexes map a key to the sorted row ids
+    that have it, so a lookup costs O(rows returned), not O(table).
+
+    dump() writes the columns and text indexes into one file; load() maps
+    that file back, with every column a zero-copy memoryview over it.
+    """
+    def __init__(self, schema):
+        self.schema = dict(schema)  # column -> array typecode, or "str"
+        self.columns = {name: array("I" if code == "str" else code) for name, code in self.schema.items()}
+        self.pools = {name: StringPool() for name, code in self.schema.items() if code == "str"}
+        self.indexes = {}
+        self._map = None
+        self._views = []
+
+    def take(self, row_ids):
+        """A new table with these rows in this order (same string pools)."""
+        table = ColumnTable(self.schema)
+        table.pools = self.pools
+        for name, column in self.columns.items():
+            table.columns[name] = array(column.typecode, [column[i] for i in row_ids])
+        return table
+
+    def dump(self, path):
+        """Writes every column plus the text-column indexes to `path` and
+        returns the layout (JSON-able) that load() needs to map it back."""
+        layout = {"rows": len(self), "schema": self.schema, "columns": {}, "indexes": {},
+                  "pools": {name: pool.values for name, pool in self.pools.items()}}
+        with open(path, "wb") as fh:
+            def put(values):
+                fh.write(b"\0" * (-fh.tell() % 8))  # Keep every column 8-byte aligned
+                start = fh.tell()
+                values.tofile(fh)
+                return [values.typecode, start, len(values)]
+            for name, column in self.columns.items():
+                layout["columns"][name] = put(column)
+            for name, index in self.indexes.items():
+                if name in self.pools:
+                    if not isinstance(index, CsrIndex):
+                        index = CsrIndex.from_groups(index, len(self.pools[name]))
+                    layout["indexes"][name] = {"offsets": put(index.offsets), "order": put(index.order)}
+        return layout
+
+    @classmethod
+    def load(cls, path, layout):
+        table = cls.__new__(cls)
+        table.schema = layout["schema"]
+        table.pools = {name: StringPool(values) for name, values in layout["pools"].items()}
+        with open(path, "rb") as fh:
+            table._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(table._map)
+        table._views = [view]
+
+        def get(entry):
+            typecode, start, count = entry
+            raw = view[start:start + count * array(typecode).itemsize]
+            table._views += [raw, raw.cast(typecode)]
+            return table._views[-1]
+        table.columns = {name: get(entry) for name, entry in layout["columns"].items()}
+        table.indexes = {name: CsrIndex(get(entry["offsets"]), get(entry["order"]))
+                         for name, entry in layout["indexes"].items()}
+        return table
+
+    def close(self):
+        """Unmaps a load()ed table; its columns are gone afterwards."""
+        if self._map is None:
+            return
+        self.columns, self.indexes = {}, {}
+        for view in reversed(self._views):
+            try:
+                view.release()
+            except BufferError:
+                pass  # Still exported (a numpy array over a column) - the GC frees it
+        self._views = []
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._map = None
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def append(self, row):
+        for name, value in zip(self.schema, row):
+            pool = self.pools.get(name)
+            self.columns[name].append(pool.intern(value) if pool is not None else value)
+
+    def value(self, name, row_id):
+        raw = self.columns[name][row_id]
+        pool = self.pools.get(name)
+        return pool[raw] if pool is not None else raw
+
+    def row(self, row_id):
+        return tuple(self.value(name, row_id) for name in self.schema)
+
+    def build_index(self, name, key=None, column=None):
+        """Groups row ids under `key(raw value)` (the raw value itself by default)."""
+        groups = {}
+        for row_id, raw in enumerate(self.columns[column or name]):
+            groups.setdefault(raw if key is None else key(raw), array("I")).append(row_id)
+        self.indexes[name] = groups
+        return groups
+
+    def lookup(self, index, *keys):
+        """Row ids under any of `keys` in an index, in row order."""
+        groups = self.indexes[index]
+        hits = [groups[key] for key in keys if key in groups]
+        if len(hits) == 1:
+            return hits[0]
+        return sorted(row_id for hit in hits for row_id in hit)
+
+    def span(self, column, value, lo=0, hi=None):
+        """range() of rows equal to `value` in a column sorted over [lo, hi)."""
+        values = self.columns[column]
+        hi = len(values) if hi is None else hi
+        return range(bisect.bisect_left(values, value, lo, hi), bisect.bisect_right(values, value, lo, hi))
+
+    def search(self, name, text):
+        """Row ids whose text column `name` contains `text`, via its index."""
+        return self.lookup(name, *self.pools[name].search(text))
+
+@functools.lru_cache(maxsize=None)
+def champions_db():
+    """Loaded on first use, then shared."""
+    return ChampionsDB()
+
+def longest_streak(seasons):
+    """(length, first, last) of the longest run of consecutive seasons."""
+    best = (0, None, None)
+    start = previous = None
+    for season in seasons:
+        if previous is None or season != previous + 1:
+            start = season
+        previous = season
+        if season - start + 1 > best[0]:
+            best = (season - start + 1, start, season)
+    return best
+
+def season_ranges(seasons):
+    """[2014, 2015, 2017] -> '2014-2015, 2017'"""
+    spans = []
+    for season in seasons:
+        if spans and season == spans[-1][1] + 1:
+            spans[-1][1] = season
+        else:
+            spans.append([season, season])
+    return ", ".join(str(a) if a == b else f"{a}-{b}" for a, b in spans)
+
+# Hall of Fame colours for the all-time greats
+CHAMPION_STYLES = {
+    "Michael Schumacher": "bold magenta",
+    "Lewis Hamilton": "bold red",
+    "Juan Manuel Fangio": "bold green",
+    "Max Verstappen": "bold yellow",
+    "Sebastian Vettel": "bold yellow",
+    "Ayrton Senna": "bold yellow",
+    "Niki Lauda": "bold yellow",
+}
+
+class ChampionsDB:
+    """World Drivers' Champions from champions.csv, season-ordered, indexed by
+    driver, constructor and decade. Seasons are sorted, so --since is a bisect."""
+    def __init__(self, path=CHAMPIONS_FILE):
+        import csv
+        with open(path, newline="", encoding="utf-8") as fh:
+            rows = sorted((int(r["season"]), r["driver"], r["constructor"]) for r in csv.DictReader(fh))
+        self.table = ColumnTable({"season": "H", "driver": "str", "constructor": "str"})
+        for row in rows:
+            self.table.append(row)
+        self.table.build_index("driver")
+        self.table.build_index("constructor")
+        self.table.build_index("decade", key=lambda season: season // 10 * 10, column="season")
+        drivers = self.table.pools["driver"]
+        self.styles = [CHAMPION_STYLES.get(name, "bold cyan") for name in drivers.values]
+
+    def __len__(self):
+        return len(self.table)
+
+    def since(self, season):
+        return range(bisect.bisect_left(self.table.columns["season"], season), len(self.table))
+
+    def query(self, driver=None, team=None, since=None, decade=None):
+        """Row ids (oldest first) matching every filter given."""
+        candidates = []
+        if driver:
+            candidates.append(self.table.search("driver", driver))
+        if team:
+            candidates.append(self.table.search("constructor", team))
+        if decade is not None:
+            candidates.append(self.table.lookup("decade", decade // 10 * 10))
+        if since is not None:
+            candidates.append(self.since(since))
+        if not candidates:
+            return range(len(self.table))
+        candidates.sort(key=len)
+        rows = candidates[0]
+        for other in candidates[1:]:
+            keep = set(other) if not isinstance(other, range) else other
+            rows = [row_id for row_id in rows if row_id in keep]
+        return rows
+
+    def titles(self, index, row_ids=None):
+        """[(name, seasons)] per driver/constructor, most titles first."""
+        seasons = self.table.columns["season"]
+        pool = self.table.pools[index]
+        column = self.table.columns[index]
+        if row_ids is None:
+            groups = self.table.indexes[index].items()
+        else:
+            grouped = {}
+            for row_id in row_ids:
+                grouped.setdefault(column[row_id], []).append(row_id)
+            groups = grouped.items()
+        ranked = [(pool[code], [seasons[r] for r in ids]) for code, ids in groups]
+        ranked.sort(key=lambda entry: (-len(entry[1]), entry[1][0]))
+        return ranked
+
+# --- RESULTS ARCHIVE (ERGAST DUMPS) ---
+# `results --import <dir|file.json>` reads an Ergast-style dump once (the
+# f1db CSV files, or saved Ergast API JSON responses) into columnar files
+# under ~/.f1_os/archive. Later launches map those files instead of
+# parsing anything. Rows are sorted by season and round, so a season or a
+# race is a bisect; per-driver lookups go through a stored index.
+ARCHIVE_DIR = os.path.join(CACHE_DIR, "archive")
+ARCHIVE_VERSION = 1
+RESULT_SCHEMA = {
+    "season": "H", "round": "B", "race": "str", "circuit": "str", "driver": "str",
+    "constructor": "str", "grid": "h", "position": "h", "points": "f", "laps": "H",
+    "millis": "i", "status": "str",
+}   # position 0 = not classified, millis -1 = no time
+LAP_SCHEMA = {"season": "H", "round": "B", "driver": "str", "lap": "H", "position": "h", "millis": "i"}
+
+def lap_millis(text):
+    """'1:21.345' / '81.345' -> 81345 (None if it isn't a time)."""
+    try:
+        minutes, _, seconds = text.rpartition(":")
+        return int(round((int(minutes or 0) * 60 + float(seconds)) * 1000))
+    except (AttributeError, ValueError):
+        return None
+
+def read_ergast_csv(directory):
+    """(results rows, lap rows) from the f1db CSV files. Laps are streamed -
+    lap_times.csv is the big one - and are None if the dump has none."""
+    import csv
+
+    def rows(name):
+        with open(os.path.join(directory, name), newline="", encoding="utf-8") as fh:
+            yield from csv.DictReader(fh)
+
+    def number(text, default, cast=int):
+        return default if text in ("\\N", "", None) else cast(text)
+
+    def optional(name, key, value):
+        if not os.path.exists(os.path.join(directory, name)):
+            return {}
+        return {r[key]: value(r) for r in rows(name)}
+
+    circuits = optional("circuits.csv", "circuitId", lambda r: r["name"])
+    status = optional("status.csv", "statusId", lambda r: r["status"])
+    races = {r["raceId"]: (int(r["year"]), int(r["round"]), r["name"], circuits.get(r["circuitId"], ""))
+             for r in rows("races.csv")}
+    drivers = {r["driverId"]: f"{r['forename']} {r['surname']}" for r in rows("drivers.csv")}
+    constructors = {r["constructorId"]: r["name"] for r in rows("constructors.csv")}
+
+    results = [
+        races[r["raceId"]] + (
+            drivers[r["driverId"]], constructors[r["constructorId"]],
+            number(r["grid"], 0), number(r["position"], 0), number(r["points"], 0.0, float),
+            number(r["laps"], 0), number(r["milliseconds"], -1), status.get(r["statusId"], ""),
+        )
+        for r in rows("results.csv")
+    ]
+    laps = None
+    if os.path.exists(os.path.join(directory, "lap_times.csv")):
+        laps = (races[r["raceId"]][:2] + (drivers[r["driverId"]], int(r["lap"]),
+                                          number(r["position"], 0), number(r["milliseconds"], -1))
+                for r in rows("lap_times.csv"))
+    return results, laps
+
+def read_ergast_json(paths):
+    """(results rows, lap rows) from saved Ergast API responses
+    (MRData.RaceTable.Races with Results and/or Laps)."""
+    results, laps, names = [], [], {}
+    for path in paths:
+        with open(path, encoding="utf-8") as fh:
+            races = json.load(fh)["MRData"]["RaceTable"]["Races"]
+        for race in races:
+            key = (int(race["season"]), int(race["round"]), race["raceName"],
+                   race.get("Circuit", {}).get("circuitName", ""))
+            for r in race.get("Results", ()):
+                driver = r["Driver"]
+                name = names[driver["driverId"]] = f"{driver['givenName']} {driver['familyName']}"
+                position = int(r["position"]) if r.get("positionText", r["position"]).isdigit() else 0
+                results.append(key + (
+                    name, r["Constructor"]["name"], int(r.get("grid", 0)), position,
+                    float(r.get("points", 0)), int(r.get("laps", 0)),
+                    int(r.get("Time", {}).get("millis", -1)), r.get("status", ""),
+                ))
+            for lap in race.get("Laps", ()):
+                for timing in lap["Timings"]:
+                    millis = lap_millis(timing["time"])
+                    laps.append(key[:2] + (timing["driverId"], int(lap["number"]),
+                                           int(timing["position"]), -1 if millis is None else millis))
+    # Lap timings only carry the driverId - use the full name where Results gave us one
+    laps = [row[:2] + (names.get(row[2], row[2]),) + row[3:] for row in laps]
+    return results, laps or None
+
+class ResultsArchive:
+    """The mapped results (and lap time) tables, or nothing until an import."""
+    def __init__(self, directory=ARCHIVE_DIR):
+        self.directory = directory
+        self.tables = {}
+        self.manifest = None
+        self.open()
+
+    @property
+    def ready(self):
+        return "results" in self.tables
+
+    def open(self):
+        try:
+            with open(os.path.join(self.directory, "manifest.json"), encoding="utf-8") as fh:
+                manifest = json.load(fh)
+        except (OSError, ValueError):
+            return
+        if manifest.get("version") != ARCHIVE_VERSION or manifest.get("byteorder") != sys.byteorder:
+            return  # Stale or foreign cache - needs a fresh import
+        self.tables = {name: ColumnTable.load(os.path.join(self.directory, f"{name}.bin"), layout)
+                       for name, layout in manifest["tables"].items()}
+        self.manifest = manifest
+
+    def close(self):
+        for table in self.tables.values():
+            table.close()
+        self.tables, self.manifest = {}, None
+
+    def import_dump(self, source):
+        """Reads a dump directory (CSV) or JSON file(s) and rewrites the cache.
+        Returns {table: rows}."""
+        if os.path.isdir(source) and os.path.exists(os.path.join(source, "results.csv")):
+            results, laps = read_ergast_csv(source)
+        else:
+            paths = sorted(os.path.join(source, n) for n in os.listdir(source) if n.endswith(".json")) \
+                if os.path.isdir(source) else [source]
+            if not paths:
+                raise FileNotFoundError(f"no results.csv or *.json in {source}")
+            results, laps = read_ergast_json(paths)
+
+        tables = {"results": (RESULT_SCHEMA, results, ("season", "round", "position"))}
+        if laps is not None:
+            tables["laps"] = (LAP_SCHEMA, laps, ("season", "round", "lap", "position"))
+
+        os.makedirs(self.directory, exist_ok=True)
+        # The old maps must go before their files are replaced, and the new
+        # files are written aside first: another f1 still mapping the old
+        # ones keeps its copy rather than reading a truncated file (SIGBUS).
+        self.close()
+        layouts = {}
+        try:
+            for name, (schema, rows, order) in tables.items():
+                table = ColumnTable(schema)
+                for row in rows:
+                    table.append(row)
+                if not len(table):
+                    continue
+                # Unclassified (position 0) sorts after the finishers
+                keys = list(zip(*(table.columns[column] if column != "position" else
+                                  [p or 0x7fff for p in table.columns[column]] for column in order)))
+                table = table.take(sorted(range(len(table)), key=keys.__getitem__))
+                table.build_index("driver")
+                if "constructor" in schema:
+                    table.build_index("constructor")
+                layouts[name] = table.dump(os.path.join(self.directory, f"{name}.bin.tmp"))
+        except BaseException:
+            self.open()  # The old files are untouched until every new one is written
+            raise
+
+        manifest = os.path.join(self.directory, "manifest.json")
+        if os.path.exists(manifest):
+            os.remove(manifest)  # Never pair the old layouts with the new files
+        for name in layouts:
+            path = os.path.join(self.directory, f"{name}.bin")
+            os.replace(path + ".tmp", path)
+        write_json_atomic(manifest, {
+            "version": ARCHIVE_VERSION, "byteorder": sys.byteorder, "source": os.path.abspath(source),
+            "built": time.time(), "tables": layouts,
+        })
+        self.open()
+        return {name: layout["rows"] for name, layout in layouts.items()}
+
+    def seasons(self):
+        seasons = self.tables["results"].columns["season"]
+        return (seasons[0], seasons[len(seasons) - 1]) if len(seasons) else (None, None)
+
+    def race(self, table, season, round_number=None):
+        """range() of rows for a season, or one race of it."""
+        t = self.tables[table]
+        rows = t.span("season", season)
+        if round_number is not None:
+            rows = t.span("round", round_number, rows.start, rows.stop)
+        return rows
+
+    def find_round(self, season, text):
+        """Round number for '7' or part of a race/circuit name in that season."""
+        if text.isdigit():
+            return int(text)
+        t = self.tables["results"]
+        needle = text.casefold()
+        for row_id in self.race("results", season):
+            if needle in t.value("race", row_id).casefold() or needle in t.value("circuit", row_id).casefold():
+                return t.columns["round"][row_id]
+        return None
+
+    def driver_rows(self, table, name, rows=None):
+        """Row ids for drivers matching `name`, optionally only inside `rows` (a range)."""
+        t = self.tables[table]
+        codes = t.pools["driver"].search(name)
+        if rows is None:
+            return t.lookup("driver", *codes)
+        hits = []
+        for code in codes:
+            if code in t.indexes["driver"]:
+                ids = t.indexes["driver"][code]
+                hits.extend(ids[bisect.bisect_left(ids, rows.start):bisect.bisect_left(ids, rows.stop)])
+        return sorted(hits)
+
+@functools.lru_cache(maxsize=None)
+def results_archive():
+    """Mapped on first use, then shared."""
+    return ResultsArchive()
+
+# --- PACE ANALYSIS (LAP ARRAYS) ---
+# Lap analytics over the archive's lap columns with numpy: the columns are
+# viewed as arrays (no copy) and every statistic is computed for the whole
+# field at once - no per-lap Python loops. Ergast data has no tyre info, so
+# pit stops are inferred from slow laps and compounds from how fast a stint
+# wore (see estimate_compound).
+PIT_SLOW = 1.10       # lap vs the field's median for that lap: in/out lap
+NEUTRAL_SLOW = 1.15   # field median vs its race median: safety car / VSC lap
+CLEAN_WINDOW = 1.07   # season view: within 7% of the lap's best counts as racing
+FUEL_EFFECT = 0.035   # seconds a lap of fuel burn is worth
+COMPOUND_WEAR = (("SOFT", 0.08), ("MEDIUM", 0.04), ("HARD", float("-inf")))  # s/lap, fuel corrected
+INTER_SLOW = 1.08     # field pace during the stint vs the race's dry pace
+
+def estimate_compound(slope, conditions):
+    """Best guess at a stint's tyre from its wear rate (s/lap) and how slow
+    the whole field was meanwhile (conditions, 1.0 = dry race pace)."""
+    if conditions > INTER_SLOW:
+        return "INTER"
+    return next(name for name, wear in COMPOUND_WEAR if slope > wear)
+
+def column_array(table, name, rows):
+    """A column slice as a numpy array - a view over the mapped file."""
+    return numpy.asarray(table.columns[name][rows.start:rows.stop])
+
+class RacePace:
+    """One race as drivers x laps matrices (seconds, positions; NaN/0 where a
+    driver didn't run the lap), plus the stints every driver ran."""
+    def __init__(self, archive, season, round_number):
+        t = archive.tables["laps"]
+        rows = archive.race("laps", season, round_number)
+        self.names = t.pools["driver"]
+        self.codes, row = numpy.unique(column_array(t, "driver", rows), return_inverse=True)
+        lap = column_array(t, "lap", rows).astype(numpy.intp) - 1
+        millis = column_array(t, "millis", rows)
+        shape = (len(self.codes), int(lap.max()) + 1 if len(lap) else 0)
+        self.times = numpy.full(shape, numpy.nan)
+        self.times[row, lap] = numpy.where(millis >= 0, millis / 1000, numpy.nan)
+        self.positions = numpy.zeros(shape, dtype=numpy.int16)
+        self.positions[row, lap] = column_array(t, "position", rows)
+        if not len(lap):
+            return
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # Laps nobody (or one car) ran
+            self.field = numpy.nanmedian(self.times, axis=0)
+            self.neutral = self.field > numpy.nanmedian(self.field) * NEUTRAL_SLOW
+            slow = self.times > self.field * PIT_SLOW
+            # The out-lap is the one that clearly shows a stop (pit lane plus
+            # cold tyres); the lap before it is the in-lap. Lap 1 is neither.
+            pit = slow & ~self.neutral
+            pit[:, 0] = False
+            before = numpy.pad(pit, ((0, 0), (1, 0)))[:, :-1]
+            in_lap = numpy.pad(pit, ((0, 0), (0, 1)))[:, 1:]
+            self.stint = numpy.cumsum(pit & ~before, axis=1)
+            self.clean = numpy.isfinite(self.times) & ~slow & ~in_lap & ~self.neutral
+            self.clean[:, 0] = False
+            self.cumulative = numpy.cumsum(self.times, axis=1)
+            self.leader = numpy.nanmin(self.cumulative, axis=0)
+            self._fit_stints()
+
+    def _fit_stints(self):
+        """Least-squares wear slope for every (driver, stint) in one pass,
+        from bincount sums over the clean laps."""
+        drivers, laps = self.times.shape
+        width = int(self.stint.max()) + 1
+        key = (numpy.arange(drivers)[:, None] * width + self.stint)
+        x = numpy.broadcast_to(numpy.arange(laps, dtype=float), (drivers, laps))
+        y = self.times + FUEL_EFFECT * x  # Put back what the burnt fuel gave
+        clean = self.clean
+        sums = [numpy.bincount(key[clean], weights=w[clean], minlength=drivers * width)
+                for w in (numpy.ones_like(y), x, y, x * x, x * y)]
+        n, sx, sy, sxx, sxy = (a.reshape(drivers, width) for a in sums)
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            self.stint_slope = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+            self.stint_mean = (sy - FUEL_EFFECT * sx) / n
+            # How slow the whole field was while each stint ran
+            present = numpy.isfinite(self.times) & ~self.neutral
+            ran = numpy.bincount(key[present], minlength=drivers * width).reshape(drivers, width)
+            field_sum = numpy.bincount(key[present], weights=numpy.broadcast_to(self.field, y.shape)[present],
+                                       minlength=drivers * width).reshape(drivers, width)
+            self.stint_conditions = field_sum / ran / numpy.nanpercentile(self.field[~self.neutral], 25)
+        self.stint_laps = ran
+        self.stint_clean = n
+
+    @property
+    def laps(self):
+        return self.times.shape[1]
+
+    def rows_for(self, name):
+        """Matrix rows of drivers in this race whose name contains `name`."""
+        wanted = numpy.asarray(self.names.search(name), dtype=self.codes.dtype)
+        return numpy.flatnonzero(numpy.isin(self.codes, wanted))
+
+    def stints(self, row):
+        """[(first lap, last lap, clean laps, mean s, slope s/lap, compound)] for
+        a driver, laps 1-based. Slope and compound are None under 3 clean laps."""
+        ran = numpy.isfinite(self.times[row])
+        stint_of = self.stint[row]
+        out = []
+        for stint in numpy.unique(stint_of[ran]):
+            laps = numpy.flatnonzero(ran & (stint_of == stint))
+            clean = int(self.stint_clean[row, stint])
+            slope = float(self.stint_slope[row, stint]) if clean > 2 else None
+            conditions = self.stint_conditions[row, stint]
+            compound = estimate_compound(slope, conditions) if slope is not None else \
+                "INTER" if conditions > INTER_SLOW else None
+            out.append((laps[0] + 1, laps[-1] + 1, clean, self.stint_mean[row, stint], slope, compound))
+        return out
+
+    def percentiles(self, row, qs=(10, 50, 90)):
+        """The driver's clean-lap percentiles, and the share (0-100) of the
+        field whose median clean lap was slower."""
+        clean = numpy.where(self.clean, self.times, numpy.nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            medians = numpy.nanmedian(clean, axis=1)
+            own = numpy.nanpercentile(clean[row], qs)
+        others = numpy.delete(medians, row)
+        others = others[numpy.isfinite(others)]
+        beaten = 100.0 * numpy.count_nonzero(others > medians[row]) / len(others) if len(others) else 0.0
+        return own, beaten
+
+    def gaps(self, row):
+        """Seconds behind the leader at the end of each lap (NaN once out)."""
+        return self.cumulative[row] - self.leader
+
+def season_pace(archive, season, name):
+    """Per round: (round, clean laps, driver's pace vs lap best in %,
+    share of the field beaten). All rounds in one vectorized pass."""
+    t = archive.tables["laps"]
+    rows = archive.race("laps", season)
+    if not rows:
+        return []
+    rounds = column_array(t, "round", rows)
+    laps = column_array(t, "lap", rows)
+    drivers = column_array(t, "driver", rows)
+    millis = column_array(t, "millis", rows).astype(float)
+    millis[millis < 0] = numpy.inf
+
+    # Rows are sorted by round then lap, so every (round, lap) is one run
+    change = numpy.r_[True, (rounds[1:] != rounds[:-1]) | (laps[1:] != laps[:-1])]
+    best = numpy.minimum.reduceat(millis, numpy.flatnonzero(change))
+    ratio = millis / best[numpy.cumsum(change) - 1]
+    clean = (ratio < CLEAN_WINDOW) & (laps > 1)
+
+    round_ids, round_of = numpy.unique(rounds, return_inverse=True)
+    codes, driver_of = numpy.unique(drivers, return_inverse=True)
+    cell = round_of * len(codes) + driver_of
+    size = len(round_ids) * len(codes)
+    count = numpy.bincount(cell[clean], minlength=size).reshape(len(round_ids), len(codes))
+    total = numpy.bincount(cell[clean], weights=ratio[clean], minlength=size).reshape(count.shape)
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+
+    mine = numpy.isin(codes, numpy.asarray(t.pools["driver"].search(name), dtype=codes.dtype))
+    if not mine.any():
+        return []
+    own_count = count[:, mine].sum(axis=1)
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        own = total[:, mine].sum(axis=1) / own_count
+        rivals = numpy.where(mine, numpy.nan, mean)
+        beaten = 100.0 * (rivals > own[:, None]).sum(axis=1) / numpy.isfinite(rivals).sum(axis=1)
+    ran = own_count > 0
+    return [(int(r), int(n), (o - 1) * 100, float(b))
+            for r, n, o, b in zip(round_ids[ran], own_count[ran], own[ran], beaten[ran])]
+
+# --- STRATEGY SIMULATOR (MONTE CARLO) ---
+# `strategy <circuit>` races every one- and two-stop plan over thousands of
+# random races (tyre wear that varies race to race, safety cars that make a
+# stop cheap) and reports which plans win and where the stops should go.
+# Each batch is a fixed number of races with its own child seed, so results
+# depend only on --seed, not on how many worker processes ran them.
+STRATEGY_SIMS = 20000
+STRATEGY_BATCH = 1000
+STRATEGY_SEED = 1950
+DRY_COMPOUNDS = ("SOFT", "MEDIUM", "HARD")
+TYRE_MODEL = {            # pace offset s, wear s/lap, laps before the cliff, out-lap warm-up s
+    "SOFT": (0.0, 0.080, 16, 0.3),
+    "MEDIUM": (0.6, 0.045, 28, 0.8),
+    "HARD": (1.1, 0.025, 42, 1.6),
+}
+CLIFF_RATE = 0.02         # s/lap^2 once a tyre is past its life
+WEAR_SPREAD = 0.15        # race-to-race spread of wear (lognormal sigma)
+SC_PIT_FACTOR = 0.5       # a stop under the safety car costs this much of the usual loss
+MIN_STINT = 5
+LAP_SPEED = 215.0         # km/h, for the headline race time only
+# Pit lane loss (s), chance of a safety car, how hard the track is on tyres
+CIRCUIT_PROFILES = {
+    "yas_marina": (22, 0.35, 1.0), "monza": (24, 0.40, 0.8), "silverstone": (20, 0.45, 1.2),
+    "spa": (19, 0.50, 1.0), "monaco": (19, 0.60, 0.5), "mexico": (22, 0.45, 0.9),
+    "imola": (28, 0.45, 0.9), "interlagos": (21, 0.60, 1.0), "sakhir": (23, 0.40, 1.3),
+    "baku": (20, 0.70, 0.8), "buddh": (22, 0.30, 1.0), "barcelona": (22, 0.30, 1.3),
+    "montreal": (18, 0.70, 0.9), "miami": (20, 0.50, 1.0), "lusail": (25, 0.30, 1.3),
+    "las_vegas": (20, 0.50, 0.8), "suzuka": (22, 0.45, 1.2), "singapore": (28, 0.90, 0.9),
+}
+DEFAULT_PROFILE = (22, 0.45, 1.0)
+
+def strategy_plans():
+    """Compound sequences: one or two stops, at least two dry compounds used."""
+    plans = [tuple(p) for stops in (1, 2) for p in itertools.product(DRY_COMPOUNDS, repeat=stops + 1)]
+    return [plan for plan in plans if len(set(plan)) > 1]
+
+def best_stop(head, tail, laps):
+    """Two stints with a stop between: for every lap the pair could finish on,
+    the cheapest lap to stop at and what it costs. `head[:, s]` is the first
+    stint plus the stop after lap s, `tail[:, n]` an n-lap second stint.
+    Loops over laps, each step vectorized across the whole batch."""
+    sims = head.shape[0]
+    cost = numpy.full((sims, laps + 1), numpy.inf, dtype=numpy.float32)
+    stop = numpy.zeros((sims, laps + 1), dtype=numpy.intp)
+    every = numpy.arange(sims)
+    for end in range(2 * MIN_STINT, laps + 1):
+        # Stopping after lap s leaves end - s laps: s = MIN..end-MIN pairs with tail n = end-MIN..MIN
+        options = head[:, MIN_STINT:end - MIN_STINT + 1] + tail[:, MIN_STINT:end - MIN_STINT + 1][:, ::-1]
+        pick = options.argmin(axis=1)
+        cost[:, end] = options[every, pick]
+        stop[:, end] = pick + MIN_STINT
+    return cost, stop
+
+def simulate_strategies(laps, profile, seed, sims):
+    """One batch of races. Returns per plan: summed best time, wins, a
+    histogram of the best lap for each stop, and `cross` - its row of the
+    summed products of every plan's per-race gap to that race's winner,
+    which is what a paired comparison of any two plans needs."""
+    load_part("numpy")
+    pit_loss, sc_chance, track_wear = profile
+    rng = numpy.random.default_rng(seed)
+    plans = strategy_plans()
+    stint_laps = numpy.arange(laps + 1)
+
+    # Cumulative cost of a stint of n laps on each compound, per race: pace
+    # offset, linear wear and the cliff, with the wear scaled per race
+    wear_mult = rng.lognormal(0.0, WEAR_SPREAD, size=(sims, len(DRY_COMPOUNDS))) * track_wear
+    stint_cost, warm_up = {}, {}
+    for i, compound in enumerate(DRY_COMPOUNDS):
+        offset, wear, life, warm_up[compound] = TYRE_MODEL[compound]
+        age = numpy.arange(laps, dtype=float)
+        per_lap = wear * age + CLIFF_RATE * numpy.maximum(0.0, age - life / track_wear) ** 2
+        cum = numpy.r_[0.0, numpy.cumsum(per_lap)]
+        # float32 halves the memory traffic; sub-millisecond error is plenty here
+        stint_cost[compound] = (offset * stint_laps + wear_mult[:, i, None] * cum).astype(numpy.float32)
+
+    # Pit loss for stopping at the end of each lap, cheaper under a safety car
+    sc = rng.random(sims) < sc_chance
+    sc_start = rng.integers(2, max(3, laps - 3), size=sims)
+    sc_end = sc_start + rng.integers(3, 6, size=sims)
+    lap = numpy.arange(laps + 1)
+    under_sc = sc[:, None] & (lap >= sc_start[:, None]) & (lap < sc_end[:, None])
+    stop_cost = numpy.where(under_sc, pit_loss * SC_PIT_FACTOR, pit_loss).astype(numpy.float32)  # (sims, laps + 1)
+
+    # Best first stop for every (first, second compound) pair and finishing
+    # lap; a two-stop plan is one of these plus a third stint
+    pairs = {(a, b): best_stop(stint_cost[a] + stop_cost + warm_up[b], stint_cost[b], laps)
+             for a in DRY_COMPOUNDS for b in DRY_COMPOUNDS}
+    every = numpy.arange(sims)
+    second = numpy.arange(2 * MIN_STINT, laps - MIN_STINT + 1)
+
+    results, best_times = [], []
+    for plan in plans:
+        cost, first = pairs[plan[:2]]
+        if len(plan) == 2:
+            best = cost[:, laps]
+            stops = (first[:, laps],)
+        else:
+            total = cost[:, second] + stop_cost[:, second] + warm_up[plan[2]] + stint_cost[plan[2]][:, laps - second]
+            pick = total.argmin(axis=1)
+            best = total[every, pick]
+            stops = (first[every, second[pick]], second[pick])
+        best = best.astype(float)
+        best_times.append(best)
+        results.append({"sum": float(best.sum()), "stops": [numpy.bincount(s, minlength=laps + 1) for s in stops]})
+
+    times = numpy.stack(best_times, axis=1)  # (sims, plans)
+    winners = numpy.bincount(numpy.argmin(times, axis=1), minlength=len(plans))
+    gaps = times - times.min(axis=1, keepdims=True)  # Small numbers, so the squares stay precise
+    cross = gaps.T @ gaps
+    for result, wins, row in zip(results, winners, cross):
+        result["wins"] = int(wins)
+        result["cross"] = row
+    return results
+
+@fit_parts("numpy", "concurrent.futures:ProcessPoolExecutor")
+def run_strategy(laps, profile, sims=STRATEGY_SIMS, seed=STRATEGY_SEED, workers=None):
+    """Runs the batches across a process pool and merges them.
+    Returns (plans, merged results, races simulated, worker processes)."""
+    batches = -(-sims // STRATEGY_BATCH)
+    seeds = numpy.random.SeedSequence(seed).spawn(batches)
+    workers = max(1, min(workers or os.cpu_count() or 1, batches))
+    jobs = [(laps, profile, child, STRATEGY_BATCH) for child in seeds]
+    if workers == 1:
+        batch_results = [simulate_strategies(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            batch_results = list(pool.map(simulate_strategies, *zip(*jobs)))
+
+    merged = batch_results[0]
+    for batch in batch_results[1:]:
+        for total, part in zip(merged, batch):
+            total["sum"] += part["sum"]
+            total["cross"] = total["cross"] + part["cross"]
+            total["wins"] += part["wins"]
+            total["stops"] = [a + b for a, b in zip(total["stops"], part["stops"])]
+    return strategy_plans(), merged, batches * STRATEGY_BATCH, workers
+
+def paired_gaps(results, races):
+    """(mean gap, 95% CI half-width) of every plan behind the best one. Both
+    are over the per-race difference - the plans ran the same races - so
+    the CI is on the gap itself, not on either plan's own mean."""
+    means = [result["sum"] / races for result in results]
+    top = min(range(len(results)), key=means.__getitem__)
+    gaps = []
+    for i, result in enumerate(results):
+        gap = means[i] - means[top]
+        squares = (result["cross"][i] + results[top]["cross"][top] - 2 * result["cross"][top]) / races
+        spread = (max(0.0, squares - gap * gap) * races / max(races - 1, 1)) ** 0.5
+        gaps.append((gap, 1.96 * spread / races ** 0.5))
+    return gaps
+
+def histogram_percentiles(counts, qs=(5, 50, 95)):
+    """Values at the given percentiles of a histogram (index = value)."""
+    cum = numpy.cumsum(counts)
+    return [int(numpy.searchsorted(cum, q / 100 * cum[-1])) for q in qs]
+
+# --- RENDER CACHE ---
+class RenderCache:
+    """LRU cache of fully rendered static screens (map, champions, radio).
+
+    Entries are the final ANSI output, keyed by command, argument, terminal
+    width and color system, so a repeat call is a single buffered write.
+    A terminal resize drops everything.
+    """
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._size = None
+
+    def clear(self):
+        self._entries.clear()
+
+    def show(self, command, arg, build):
+        """Prints the cached screen, rendering it with build() on a miss.
+        build() may return None (nothing to show) - that is not cached."""
+        size = tuple(console.size)
+        if size != self._size:
+            self.clear()
+            self._size = size
+
+        key = (command, arg, console.width, console.color_system)
+        output = self._entries.get(key)
+        if output is None:
+            renderable = build()
+            if renderable is None:
+                return False
+            with console.capture() as capture:
+                console.print(renderable)
+            output = capture.get()
+            self._entries[key] = output
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+
+        console.file.write(output)
+        console.file.flush()
+        return True
+
+RENDER_CACHE = RenderCache()
+
+# --- DIRECTORY SIZE ENGINE ---
+class DirSizeEngine:
+    """Recursive directory sizes for the grid 'Load (Size)' column.
+
+    Sizes are worked out on a thread pool. Every directory visited is kept
+    in an on-disk cache as path -> [mtime_ns, bytes of its files, subdirs],
+    so a directory whose mtime hasn't moved is not listed again - only its
+    subdirectories get a stat to check whether they changed.
+
+    The cache is an LRU of at most `limit` directories: entries are kept in
+    last-used order (which the file preserves) and save() drops the oldest,
+    so deleted or long-unvisited trees age out instead of piling up.
+    """
+    def __init__(self, path=None, workers=8, limit=DIR_SIZE_CACHE_LIMIT):
+        self.path = path or os.path.join(CACHE_DIR, "dirsizes.json")
+        self.workers = workers
+        self.limit = limit
+        self._entries = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                self._entries = json.load(fh)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def submit(self, path, stop):
+        """Starts measuring `path` in the background. Returns a Future."""
+        self._load()
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="dirsize")
+        return self._pool.submit(self.size_of, path, stop)
+
+    def size_of(self, path, stop):
+        """Total bytes below `path`, or None if `stop` was set on the way."""
+        total = 0
+        stack = [path]
+        while stack:
+            if stop.is_set():
+                return None
+            current = stack.pop()
+            try:
+                mtime = os.stat(current).st_mtime_ns
+            except OSError:
+                continue
+
+            with self._lock:
+                cached = self._entries.pop(current, None)
+                if cached is not None:
+                    self._entries[current] = cached  # Now the most recently used
+            if cached and cached[0] == mtime:
+                files_bytes, subdirs = cached[1], cached[2]
+            else:
+                files_bytes, subdirs = 0, []
+                try:
+                    with os.scandir(current) as entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    subdirs.append(entry.name)
+                                else:
+                                    files_bytes += entry.stat(follow_symlinks=False).st_size
+                            except OSError:
+                                continue
+                except OSError:
+                    continue
+                with self._lock:
+                    self._entries[current] = [mtime, files_bytes, subdirs]
+                    self._dirty = True
+
+            total += files_bytes
+            stack.extend(os.path.join(current, name) for name in subdirs)
+        return total
+
+    def save(self):
+        """Writes the cache back to disk if anything new was measured,
+        least recently used entries past the limit left out."""
+        with self._lock:
+            if not self._dirty:
+                return
+            for path in list(itertools.islice(self._entries, max(0, len(self._entries) - self.limit))):
+                del self._entries[path]
+            data = json.dumps(self._entries)
+            self._dirty = False
+        try:
+            write_json_atomic(self.path, data)
+        except OSError:
+            pass  # A cold cache next session is fine
+
+DIR_SIZES = DirSizeEngine()
+
+# --- PADDOCK NEWS CACHE ---
+class NewsCache:
+    """On-disk cache of parsed RSS feeds.
+
+    Each feed keeps its entries plus the ETag/Last-Modified it was served
+    with. Within the TTL the cache answers on its own; after that the
+    stale entries are returned straight away while a background thread
+    revalidates with a conditional GET (a 304 costs no download and no
+    parse). If the paddock is unreachable the last headlines still show.
+    """
+    def __init__(self, path=None, ttl=NEWS_TTL, timeout=NEWS_TIMEOUT, clock=time.time):
+        self.path = path or os.path.join(CACHE_DIR, "news.json")
+        self.ttl = ttl
+        self.timeout = timeout
+        self.clock = clock      # Wall-clock seconds; the TTL is measured on it
+        self.errors = {}        # url -> message from the last failed refresh
+        self._records = None
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._records is not None:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                self._records = json.load(fh)
+        except (OSError, ValueError):
+            self._records = {}
+
+    def get(self, url, background=True):
+        """Returns (record, state). State is 'fresh' (within the TTL), 'stale'
+        (a background refresh is on its way), 'live' (fetched just now) or
+        'cached' (old entries, the refresh failed - see self.errors).
+
+        Without `background` an expired feed is revalidated right here: a
+        one-shot process (batch mode, a garage job) would exit before a
+        daemon refresh thread could finish.
+        Raises if nothing is cached and the fetch fails."""
+        self._load()
+        with self._lock:
+            record = self._records.get(url)
+        if record and record.get("entries"):
+            if self.clock() - record["fetched"] < self.ttl:
+                return record, "fresh"
+            if background:
+                self.refresh_in_background(url)
+                return record, "stale"
+            try:
+                return self.fetch(url), "live"
+            except Exception as e:
+                self.errors[url] = str(e)
+                return record, "cached"
+        return self.fetch(url), "live"
+
+    def refresh_in_background(self, url):
+        with self._lock:
+            if url in self._refreshing:
+                return
+            self._refreshing.add(url)
+
+        def refresh():
+            try:
+                self.fetch(url)
+            except Exception as e:
+                self.errors[url] = str(e)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(url)
+
+        threading.Thread(target=refresh, name="news-refresh", daemon=True).start()
+
+    @fit_parts("feedparser", "urllib.request")
+    def fetch(self, url):
+        """Conditional GET + parse for one feed. Returns the updated record."""
+        self._load()
+        with self._lock:
+            record = dict(self._records.get(url) or {})
+
+        headers = {"User-Agent": "Formula1_OS"}
+        if record.get("etag"):
+            headers["If-None-Match"] = record["etag"]
+        if record.get("modified"):
+            headers["If-Modified-Since"] = record["modified"]
+
+        try:
+            request = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = response.read()
+                etag = response.headers.get("ETag")
+                modified = response.headers.get("Last-Modified")
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or not record.get("entries"):
+                raise
+            record["fetched"] = self.clock()  # Not Modified - same headlines, new clock
+        else:
+            feed = feedparser.parse(body)
+            if not feed.entries and feed.bozo:
+                raise ValueError(f"unreadable feed ({feed.bozo_exception})")
+            source = feed.feed.get("title", "Unknown")
+            entries = [self.pack(entry, source) for entry in feed.entries]
+            entries.sort(key=lambda entry: entry["published"] or 0, reverse=True)
+            record.update(etag=etag, modified=modified, fetched=self.clock(), entries=entries[:50])
+
+        self.errors.pop(url, None)
+        with self._lock:
+            self._records[url] = record
+            data = json.dumps(self._records)
+        try:
+            write_json_atomic(self.path, data)
+        except OSError:
+            pass
+        return record
+
+    @staticmethod
+    def pack(entry, source="Unknown"):
+        """The bits of a feedparser entry we keep (JSON friendly)."""
+        published = entry.get("published_parsed") or entry.get("updated_parsed")
+        return {
+            "title": entry.get("title", ""),
+            "link": entry.get("link", ""),
+            "source": entry.get("source", {}).get("title", source),
+            "published": calendar.timegm(published) if published else None,
+        }
+
+NEWS = NewsCache()
+
+def news_feeds():
+    """The configured feed URLs (env var, then feeds.txt, then NEWS_FEEDS)."""
+    if os.environ.get("F1_NEWS_FEEDS"):
+        return [url.strip() for url in os.environ["F1_NEWS_FEEDS"].split(",") if url.strip()]
+    try:
+        with open(os.path.join(CACHE_DIR, "feeds.txt"), encoding="utf-8") as fh:
+            feeds = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+        if feeds:
+            return feeds
+    except OSError:
+        pass
+    return list(NEWS_FEEDS)
+
+def headline_key(entry):
+    """Normalized title, so the same story from two feeds counts once.
+    Google News appends " - <publisher>" to titles, that goes too."""
+    title = entry["title"]
+    suffix = f" - {entry['source']}"
+    if title.endswith(suffix):
+        title = title[:-len(suffix)]
+    return " ".join(re.sub(r"[\W_]+", " ", title.lower()).split())
+
+def merge_headlines(entry_lists, limit=10):
+    """Streams a k-way merge of per-feed entry lists (each newest first),
+    dropping repeats by link or normalized title, until `limit` are out."""
+    seen = set()
+    merged = heapq.merge(*entry_lists, key=lambda entry: entry["published"] or 0, reverse=True)
+    for entry in merged:
+        keys = {key for key in (entry["link"], headline_key(entry)) if key}
+        if keys & seen:
+            continue
+        seen |= keys
+        yield entry
+        limit -= 1
+        if limit <= 0:
+            return
+
+# --- TELEMETRY ---
+TELEMETRY_RATE = 2.0     # samples per second for telemetry --live
+TELEMETRY_FPS = 2.0      # dashboard redraws per second, at most
+SLOW_SENSOR_EVERY = 5    # battery/temperature are only read every Nth sample
+TELEMETRY_HISTORY = 60 * 60   # seconds of samples kept for sparklines/percentiles
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+TOP_PROCESSES = 5             # rows in the process table
+PROCESS_SCAN_INTERVAL = 2.0   # seconds between process scans in live mode
+
+def read_slow_sensors():
+    """Battery and temperature. These go through sysfs/ACPI, so sample sparingly."""
+    try:
+        battery = psutil.sensors_battery()
+    except Exception:
+        battery = None
+    temp = None
+    if hasattr(psutil, "sensors_temperatures"):
+        try:
+            temps = psutil.sensors_temperatures()
+            if temps:
+                first_key = next(iter(temps))
+                temp = temps[first_key][0].current
+        except Exception: pass
+    return {
+        "battery": battery.percent if battery else None,
+        "plugged": bool(battery and battery.power_plugged),
+        "temp": temp,
+    }
+
+def read_telemetry(cpu_interval=None, slow=None):
+    """One telemetry snapshot. With cpu_interval=None the CPU figures are the
+    delta since the previous call, so nothing blocks."""
+    if cpu_interval:
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        time.sleep(cpu_interval)
+    ram = psutil.virtual_memory()
+    snapshot = {
+        "time": time.time(),
+        "cpu": psutil.cpu_percent(interval=None),
+        "cores": psutil.cpu_percent(interval=None, percpu=True),
+        "ram_percent": ram.percent,
+        "ram_used": ram.used,
+    }
+    snapshot.update(slow if slow is not None else read_slow_sensors())
+    return snapshot
+
+def parse_duration(text):
+    """'90', '90s', '30m', '2h' -> seconds."""
+    units = {"s": 1, "m": 60, "h": 3600}
+    text = text.strip().lower()
+    if text and text[-1] in units:
+        return float(text[:-1]) * units[text[-1]]
+    return float(text)
+
+class RingSeries:
+    """Fixed-size ring of samples in an array('f') - no Python object per sample.
+
+    A histogram of the values in the ring (bucketed at `resolution` between
+    lo and hi, with each bucket's count and sum) is kept up to date on every
+    append, so p50/p95/p99 are a walk over the buckets instead of a sort of
+    the whole history.
+    """
+    def __init__(self, capacity, lo=0.0, hi=100.0, resolution=0.1, histogram=True):
+        self.capacity = capacity
+        self.values = array("f", bytes(4 * capacity))
+        self.count = 0
+        self.head = 0   # next slot to write
+        self.lo = lo
+        self.resolution = resolution
+        self.buckets = array("L", [0]) * (int((hi - lo) / resolution) + 1) if histogram else None
+        self.sums = array("d", [0.0]) * len(self.buckets) if histogram else None
+
+    def _bucket(self, value):
+        return min(max(int((value - self.lo) / self.resolution), 0), len(self.buckets) - 1)
+
+    def append(self, value):
+        if self.buckets is not None and self.count == self.capacity:
+            old = self.values[self.head]
+            bucket = self._bucket(old)
+            self.buckets[bucket] -= 1
+            self.sums[bucket] = self.sums[bucket] - old if self.buckets[bucket] else 0.0  # No drift
+        self.values[self.head] = value
+        if self.buckets is not None:
+            stored = self.values[self.head]  # As rounded to float32, so removal cancels it exactly
+            bucket = self._bucket(stored)
+            self.buckets[bucket] += 1
+            self.sums[bucket] += stored
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def tail(self, n):
+        """The last n samples, oldest first."""
+        n = min(n, self.count)
+        start = (self.head - n) % self.capacity
+        if start + n <= self.capacity:
+            return self.values[start:start + n]
+        return self.values[start:] + self.values[:self.head]
+
+    def percentiles(self, qs=(50, 95, 99)):
+        """Percentiles of everything in the ring, interpolated between the two
+        nearest samples as numpy.percentile does. Each sample reads as the
+        mean of its bucket: exact when the bucket holds a single value,
+        otherwise to within `resolution`."""
+        if not self.count:
+            return [None for _ in qs]
+        ranks = [q / 100 * (self.count - 1) for q in qs]
+        wanted = sorted({int(rank) for rank in ranks} | {min(int(rank) + 1, self.count - 1) for rank in ranks})
+        samples = {}  # rank -> value
+        seen = 0
+        for bucket, hits in enumerate(self.buckets):
+            if not hits:
+                continue
+            seen += hits
+            while wanted and wanted[0] < seen:
+                samples[wanted.pop(0)] = self.sums[bucket] / hits
+            if not wanted:
+                break
+        results = []
+        for rank in ranks:
+            below, above = samples[int(rank)], samples[min(int(rank) + 1, self.count - 1)]
+            results.append(below + (above - below) * (rank - int(rank)))
+        return results
+
+    def sparkline(self, width, step=1):
+        """`width` characters, each the average of `step` consecutive samples."""
+        samples = self.tail(width * step)
+        if not samples:
+            return ""
+        scale = len(SPARK_BLOCKS) - 1
+        span = max(len(self.buckets) * self.resolution if self.buckets is not None else 100.0, 1e-9)
+        chars = []
+        for i in range(0, len(samples), step):
+            chunk = samples[i:i + step]
+            level = (sum(chunk) / len(chunk) - self.lo) / span
+            chars.append(SPARK_BLOCKS[min(max(int(level * scale + 0.5), 0), scale)])
+        return "".join(chars)
+
+class TelemetryHistory:
+    """Ring buffers for everything the live dashboard plots."""
+    def __init__(self, capacity, cores):
+        self.cpu = RingSeries(capacity)
+        self.ram = RingSeries(capacity)
+        self.temp = RingSeries(capacity, hi=150.0)
+        self.cores = [RingSeries(capacity, histogram=False) for _ in range(cores)]
+
+    def record(self, snapshot):
+        self.cpu.append(snapshot["cpu"])
+        self.ram.append(snapshot["ram_percent"])
+        if snapshot["temp"] is not None:
+            self.temp.append(snapshot["temp"])
+        for series, load in zip(self.cores, snapshot["cores"]):
+            series.append(load)
+
+class ProcessScanner:
+    """Top-N processes by CPU, worked out from cpu_times deltas between scans.
+
+    process_iter is asked for pid/name/cpu_times only, and the ranking runs
+    on a bounded heap - so a box with thousands of PIDs costs one pass and
+    N rows, not a sort. The first scan only sets the baseline.
+    """
+    ATTRS = ["pid", "name", "cpu_times"]
+
+    def __init__(self, top=TOP_PROCESSES):
+        self.top = top
+        self._last = {}          # pid -> cpu seconds at the previous scan
+        self._last_time = None
+
+    def scan(self):
+        """[(cpu %, pid, name)] for the busiest processes since the last scan."""
+        now = time.monotonic()
+        elapsed = now - self._last_time if self._last_time is not None else None
+        current = {}
+
+        def loads():
+            for proc in psutil.process_iter(self.ATTRS):
+                info = proc.info
+                times = info["cpu_times"]
+                if times is None:
+                    continue  # Access denied
+                used = times.user + times.system
+                current[info["pid"]] = used
+                previous = self._last.get(info["pid"])
+                if previous is None or elapsed is None or used < previous:
+                    continue  # New (or recycled) PID - no delta yet
+                yield (used - previous) / elapsed * 100, info["pid"], info["name"] or "?"
+
+        top = heapq.nlargest(self.top, loads())
+        self._last, self._last_time = current, now
+        return top
+
+class TelemetrySampler:
+    """Takes telemetry snapshots on a background thread at a fixed rate.
+    Readers just look at `latest` (and `history`) - they never wait on psutil."""
+    def __init__(self, rate=TELEMETRY_RATE, history=TELEMETRY_HISTORY, top=TOP_PROCESSES):
+        self.rate = rate
+        self.interval = 1.0 / rate
+        self.latest = None
+        self.ticks = 0
+        self.history = TelemetryHistory(max(int(history * rate), 1), psutil.cpu_count() or 1)
+        self.processes = ProcessScanner(top)
+        self._top = []
+        self._last_scan = None
+        self._slow = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def tick(self):
+        if self._slow is None or self.ticks % SLOW_SENSOR_EVERY == 0:
+            self._slow = read_slow_sensors()
+        snapshot = read_telemetry(slow=self._slow)
+        if self._last_scan is None or time.monotonic() - self._last_scan >= PROCESS_SCAN_INTERVAL:
+            self._top = self.processes.scan()
+            self._last_scan = time.monotonic()
+        snapshot["top"] = self._top
+        self.history.record(snapshot)
+        self.latest = snapshot
+        self.ticks += 1
+        return snapshot
+
+    def start(self):
+        psutil.cpu_percent(interval=None)  # Prime the delta counters
+        psutil.cpu_percent(interval=None, percpu=True)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        next_tick = time.monotonic() + self.interval
+        while not self._stop.wait(max(0.0, next_tick - time.monotonic())):
+            self.tick()
+            next_tick += self.interval
+            if next_tick < time.monotonic():
+                next_tick = time.monotonic() + self.interval  # Fell behind, don't burst
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+# --- TELEMETRY EXPORTER (HEADLESS) ---
+class TelemetryExporter:
+    """Serves the sampler's snapshots to machines instead of a panel.
+
+    Prometheus/OpenMetrics text on /metrics and the raw snapshot on
+    /snapshot.json, from a small asyncio HTTP server, and/or one JSON line
+    per sample appended to a file. Response bodies are rendered once per
+    sample and reused, so a scrape storm never triggers extra psutil work.
+    """
+    def __init__(self, sampler, jsonl_path=None):
+        self.sampler = sampler
+        self.jsonl_path = jsonl_path
+        self._rendered_for = None
+        self._bodies = {}
+
+    def bodies(self):
+        """{'metrics': bytes, 'openmetrics': bytes, 'json': bytes} for the latest sample."""
+        snapshot = self.sampler.latest
+        if snapshot is not self._rendered_for:
+            self._bodies = {
+                "metrics": self.render_metrics(snapshot).encode(),
+                "openmetrics": (self.render_metrics(snapshot, openmetrics=True) + "# EOF\n").encode(),
+                "json": json.dumps(snapshot).encode(),
+            }
+            self._rendered_for = snapshot
+        return self._bodies
+
+    def render_metrics(self, snapshot, openmetrics=False):
+        """Prometheus text (0.0.4), or OpenMetrics - they differ only in how a
+        counter is declared: 0.0.4 names it as sampled (f1os_samples_total),
+        OpenMetrics by its family (f1os_samples)."""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            sample_name = f"f1os_{name}_total" if kind == "counter" else f"f1os_{name}"
+            family = f"f1os_{name}" if openmetrics else sample_name
+            lines.append(f"# HELP {family} {help_text}")
+            lines.append(f"# TYPE {family} {kind}")
+            for labels, value in samples:
+                label_str = ",".join(f'{key}="{escape_label(val)}"' for key, val in labels.items())
+                lines.append(f"{sample_name}{{{label_str}}} {value}" if label_str else f"{sample_name} {value}")
+
+        history = self.sampler.history
+        metric("samples", "counter", "Telemetry samples taken.", [({}, self.sampler.ticks)])
+        metric("cpu_percent", "gauge", "Engine Map: total CPU load.", [({}, snapshot["cpu"])])
+        metric("cpu_core_percent", "gauge", "Engine Map: CPU load per core.",
+               [({"core": number}, load) for number, load in enumerate(snapshot["cores"])])
+        metric("cpu_percent_quantile", "gauge", "CPU load percentiles over the kept history.",
+               [({"quantile": q / 100}, round(value, 2))
+                for q, value in zip((50, 95, 99), history.cpu.percentiles()) if value is not None])
+        metric("ram_percent", "gauge", "ERS Store: memory in use.", [({}, snapshot["ram_percent"])])
+        metric("ram_used_bytes", "gauge", "ERS Store: memory in use.", [({}, snapshot["ram_used"])])
+        if snapshot["battery"] is not None:
+            metric("battery_percent", "gauge", "Fuel Cell charge.", [({}, snapshot["battery"])])
+            metric("battery_plugged", "gauge", "Fuel Cell on charge (1) or not (0).", [({}, int(snapshot["plugged"]))])
+        if snapshot["temp"] is not None:
+            metric("temperature_celsius", "gauge", "Oil Temp (first sensor).", [({}, snapshot["temp"])])
+        metric("process_cpu_percent", "gauge", "Busiest processes by CPU since the last scan.",
+               [({"pid": pid, "name": name}, round(load, 2)) for load, pid, name in snapshot.get("top", [])])
+        return "\n".join(lines) + "\n"
+
+    async def handle(self, reader, writer):
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+
+        request_line, _, header_block = request.decode("latin-1").partition("\r\n")
+        parts = request_line.split()
+        method, path = (parts[0], parts[1].split("?", 1)[0]) if len(parts) >= 2 else ("", "")
+        accept = ""
+        for header in header_block.split("\r\n"):
+            name, _, value = header.partition(":")
+            if name.strip().lower() == "accept":
+                accept = value
+
+        status, content_type, body = "404 Not Found", "text/plain", b"Not on the track map.\n"
+        if method not in ("GET", "HEAD"):
+            status, body = "405 Method Not Allowed", b"GET only.\n"
+        elif self.sampler.latest is None:
+            status, body = "503 Service Unavailable", b"Still on the formation lap.\n"
+        elif path == "/metrics":
+            bodies = self.bodies()
+            if "application/openmetrics-text" in accept:
+                status, content_type, body = "200 OK", "application/openmetrics-text; version=1.0.0; charset=utf-8", bodies["openmetrics"]
+            else:
+                status, content_type, body = "200 OK", "text/plain; version=0.0.4; charset=utf-8", bodies["metrics"]
+        elif path == "/snapshot.json":
+            status, content_type, body = "200 OK", "application/json", self.bodies()["json"]
+
+        head = (f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n").encode()
+        try:
+            writer.write(head if method == "HEAD" else head + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def write_jsonl(self):
+        """Appends every new sample as one JSON line ('-' is stdout)."""
+        out = sys.stdout if self.jsonl_path == "-" else open(self.jsonl_path, "a", encoding="utf-8")
+        written = None
+        try:
+            while True:
+                snapshot = self.sampler.latest
+                if snapshot is not None and snapshot is not written:
+                    out.write(json.dumps(snapshot) + "\n")
+                    out.flush()
+                    written = snapshot
+                await asyncio.sleep(self.sampler.interval / 2)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+    async def serve(self, host=None, port=None):
+        tasks = []
+        server = None
+        if port is not None:
+            server = await asyncio.start_server(self.handle, host, port)
+            bound = server.sockets[0].getsockname()
+            console.print(f"[bold green]TELEMETRY UPLINK:[/] http://{bound[0]}:{bound[1]}/metrics", highlight=False)
+            tasks.append(asyncio.ensure_future(server.serve_forever()))
+        if self.jsonl_path:
+            tasks.append(asyncio.ensure_future(self.write_jsonl()))
+
+        stop = asyncio.get_running_loop().create_future()
+        if sys.platform != "win32":
+            import signal
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set_result, None)
+        try:
+            await asyncio.wait(tasks + [stop], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if server is not None:
+                server.close()
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+@fit_parts("psutil", "asyncio")
+def serve_telemetry(address=None, jsonl_path=None, rate=TELEMETRY_RATE):
+    """Headless mode: no boot sequence, no REPL, no TTY needed."""
+    host, port = None, None
+    if address:
+        host, port = parse_address(address)
+        if port is None:
+            raise ValueError(f"no port in '{address}'")
+
+    sampler = TelemetrySampler(rate)
+    sampler.start()
+    exporter = TelemetryExporter(sampler, jsonl_path)
+    try:
+        asyncio.run(exporter.serve(host, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sampler.stop()
+
+# --- SPEED TRAP (DRS ENGINE) ---
+DRS_THREADS = 4          # parallel connections per direction
+DRS_DURATION = 8.0       # seconds per direction
+DRS_REPORT_EVERY = 0.2   # seconds between progress callbacks
+DRS_CHUNK = 64 * 1024
+DRS_DOWNLOAD_FILE = "random4000x4000.jpg"  # speedtest.net servers' biggest image
+DRS_UPLOAD_SIZE = 1024 * 1024               # bytes per upload POST
+
+class UploadBody:
+    """File-like request body that serves `size` bytes from one shared buffer
+    and counts them as http.client pulls them off."""
+    def __init__(self, payload, size, on_read):
+        self.payload = payload
+        self.remaining = size
+        self.on_read = on_read
+
+    def read(self, amount=-1):
+        if self.remaining <= 0:
+            return b""
+        if amount is None or amount < 0:
+            amount = self.remaining
+        chunk = self.payload[:min(amount, self.remaining, len(self.payload))]
+        self.remaining -= len(chunk)
+        self.on_read(len(chunk))
+        return chunk
+
+class SpeedTrap:
+    """Chunked download/upload test against a speedtest.net-style HTTP server
+    (random*.jpg, upload.php and latency.txt under one base URL).
+
+    Every worker thread counts the bytes it moves; while a phase runs,
+    on_progress(phase, transferred_bytes, elapsed_seconds) is called every
+    DRS_REPORT_EVERY seconds with the real totals. A phase ends after
+    `duration` seconds and the rate is what moved in that window.
+    """
+    def __init__(self, base_url, threads=DRS_THREADS, duration=DRS_DURATION, timeout=10):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.threads = max(1, threads)
+        self.duration = duration
+        self.timeout = timeout
+        self.payload = memoryview(os.urandom(DRS_CHUNK))
+
+    @classmethod
+    def from_server_url(cls, url, **kwargs):
+        """speedtest.net lists servers by their upload.php URL."""
+        return cls(url.rsplit("/", 1)[0], **kwargs)
+
+    def latency(self, samples=3):
+        """Best round trip to latency.txt, in ms."""
+        import urllib.request
+        best = None
+        for i in range(samples):
+            started = time.perf_counter()
+            with urllib.request.urlopen(f"{self.base_url}latency.txt?x={time.time()}.{i}", timeout=self.timeout) as response:
+                response.read()
+            elapsed = (time.perf_counter() - started) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    def download(self, on_progress=None):
+        """Bits per second, pulling the big test image on every thread."""
+        import urllib.request
+        def worker(number, count, stop):
+            while not stop.is_set():
+                url = f"{self.base_url}{DRS_DOWNLOAD_FILE}?x={time.time()}.{number}"
+                with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                    while not stop.is_set():
+                        chunk = response.read(DRS_CHUNK)
+                        if not chunk:
+                            break
+                        count(len(chunk))
+        return self._run("download", worker, on_progress)
+
+    def upload(self, on_progress=None):
+        """Bits per second, POSTing DRS_UPLOAD_SIZE bodies to upload.php on every thread."""
+        import urllib.request
+        def worker(number, count, stop):
+            while not stop.is_set():
+                body = UploadBody(self.payload, DRS_UPLOAD_SIZE, count)
+                request = urllib.request.Request(
+                    f"{self.base_url}upload.php?x={time.time()}.{number}", data=body, method="POST",
+                    headers={"Content-Length": str(DRS_UPLOAD_SIZE), "Content-Type": "application/octet-stream"})
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    response.read()
+        return self._run("upload", worker, on_progress)
+
+    def _run(self, phase, worker, on_progress):
+        totals = [0] * self.threads  # One slot per thread - no lock needed
+        errors = []
+        stop = threading.Event()
+
+        def runner(number):
+            def count(amount):
+                totals[number] += amount
+            try:
+                worker(number, count, stop)
+            except Exception as e:
+                if not stop.is_set():
+                    errors.append(e)
+
+        workers = [threading.Thread(target=runner, args=(n,), name=f"drs-{phase}-{n}", daemon=True)
+                   for n in range(self.threads)]
+        started = time.perf_counter()
+        for thread in workers:
+            thread.start()
+
+        elapsed = 0.0
+        while elapsed < self.duration and any(thread.is_alive() for thread in workers):
+            stop.wait(min(DRS_REPORT_EVERY, self.duration - elapsed))
+            elapsed = time.perf_counter() - started
+            if on_progress:
+                on_progress(phase, sum(totals), min(elapsed, self.duration))
+        transferred = sum(totals)
+        stop.set()
+        for thread in workers:
+            thread.join(timeout=0.5)
+
+        if errors and not transferred:
+            raise errors[0]
+        return transferred * 8 / max(elapsed, 1e-6)
+
+# DRS over the LAN: "drs --serve" on one machine, "drs --target host" on the
+# other. Each connection opens with one line naming its mode:
+#   PING           - echo; the client times small round trips
+#   DOWN <seconds> - the server streams a blob with sendfile() until then
+#   UP             - the client streams, the server counts and replies with the total
+DRS_PORT = 5201
+DRS_PING_SAMPLES = 50
+DRS_BLOB_SIZE = 4 * 1024 * 1024
+
+class DrsLink:
+    """Server side of one benchmark connection (a socketserver request handler)."""
+    def __init__(self, sock, address, server):
+        import socket
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        header = b""
+        while not header.endswith(b"\n") and len(header) < 64:
+            data = sock.recv(1)
+            if not data:
+                return
+            header += data
+        mode, _, arg = header.strip().partition(b" ")
+        try:
+            if mode == b"PING":
+                while True:
+                    data = sock.recv(256)
+                    if not data:
+                        break
+                    sock.sendall(data)
+            elif mode == b"DOWN":
+                deadline = time.monotonic() + min(float(arg or DRS_DURATION), 300.0)
+                with open(server.blob_path, "rb") as blob:
+                    while time.monotonic() < deadline:
+                        sock.sendfile(blob, offset=0)  # Zero-copy where the OS has it
+            elif mode == b"UP":
+                view = memoryview(bytearray(DRS_CHUNK * 4))
+                total = 0
+                while True:
+                    received = sock.recv_into(view)
+                    if not received:
+                        break
+                    total += received
+                sock.sendall(f"{total}\n".encode())
+        except (OSError, ValueError):
+            pass  # The client hung up - that's how every run ends
+
+@fit_parts("socketserver")
+def serve_drs(host="0.0.0.0", port=DRS_PORT, on_ready=None):
+    """Runs the DRS benchmark server until Ctrl-C (or its shutdown()).
+    on_ready(server) is called once it listens - server.server_address has
+    the port it got, which matters with port 0."""
+    class DrsServer(socketserver.ThreadingTCPServer):
+        allow_reuse_address = True
+        daemon_threads = True
+
+    server = DrsServer((host, port), DrsLink)
+    fd, server.blob_path = tempfile.mkstemp(prefix="f1_drs_", suffix=".bin")
+    with os.fdopen(fd, "wb") as blob:
+        blob.write(os.urandom(DRS_BLOB_SIZE))
+    bound = server.server_address
+    console.print(f"[bold green]DRS ZONE OPEN:[/] listening on {bound[0]}:{bound[1]} "
+                  f"[dim](drs --target <this host>:{bound[1]} from the other machine, Ctrl-C to close)[/]")
+    try:
+        if on_ready:
+            on_ready(server)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("[yellow]DRS ZONE CLOSED.[/]")
+    finally:
+        server.server_close()
+        os.remove(server.blob_path)
+
+class LanTrap(SpeedTrap):
+    """drs --target: raw TCP throughput, latency and jitter against drs --serve.
+    Same phases and progress callbacks as SpeedTrap, over parallel streams."""
+    def __init__(self, host, port=DRS_PORT, threads=DRS_THREADS, duration=DRS_DURATION, timeout=10):
+        super().__init__(f"tcp://{host}:{port}", threads=threads, duration=duration, timeout=timeout)
+        self.host = host
+        self.port = port
+        self.rtts = []
+
+    def _connect(self, header):
+        import socket
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.sendall(header.encode() + b"\n")
+        return sock
+
+    def latency(self, samples=DRS_PING_SAMPLES):
+        """Median round trip in ms; every sample is kept in self.rtts."""
+        probe = b"\xf1" * 32
+        self.rtts = []
+        with self._connect("PING") as sock:
+            for _ in range(samples):
+                started = time.perf_counter()
+                sock.sendall(probe)
+                received = 0
+                while received < len(probe):
+                    data = sock.recv(len(probe) - received)
+                    if not data:
+                        raise ConnectionError("DRS server hung up mid-ping")
+                    received += len(data)
+                self.rtts.append((time.perf_counter() - started) * 1000)
+        return self.latency_percentiles((50,))[0]
+
+    def latency_percentiles(self, qs=(0, 50, 95, 100)):
+        ordered = sorted(self.rtts)
+        return [ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))] for q in qs]
+
+    def jitter(self):
+        """Mean change between consecutive round trips, in ms."""
+        steps = [abs(b - a) for a, b in zip(self.rtts, self.rtts[1:])]
+        return sum(steps) / len(steps) if steps else 0.0
+
+    def download(self, on_progress=None):
+        def worker(number, count, stop):
+            with self._connect(f"DOWN {self.duration + 1:g}") as sock:
+                view = memoryview(bytearray(DRS_CHUNK * 4))
+                while not stop.is_set():
+                    received = sock.recv_into(view)
+                    if not received:
+                        break
+                    count(received)
+        return self._run("download", worker, on_progress)
+
+    def upload(self, on_progress=None):
+        def worker(number, count, stop):
+            import socket
+            with self._connect("UP") as sock:
+                while not stop.is_set():
+                    count(sock.send(self.payload))
+                sock.shutdown(socket.SHUT_WR)
+                sock.recv(64)  # The server's tally - lets it finish cleanly
+        return self._run("upload", worker, on_progress)
+
+# --- START LIGHTS (KEYPRESS SKIP) ---
+class KeyWatch:
+    """Puts the terminal in cbreak mode so a single keypress can be noticed
+    (and swallowed) while an animation sleeps. Does nothing without a TTY."""
     def __init__(self):
+        self.fd = None
+        self._saved = None
+
+    def __enter__(self):
+        if sys.platform != "win32" and sys.stdin.isatty():
+            import termios, tty
+            self.fd = sys.stdin.fileno()
+            self._saved = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)
+        return self
+
+    def __exit__(self, *exc):
+        if self._saved is not None:
+            import termios
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self._saved)
+            self._saved = None
+
+    def wait(self, seconds):
+        """Sleeps up to `seconds`. Returns True if a key was pressed."""
+        if sys.platform == "win32":
+            import msvcrt
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                if msvcrt.kbhit():
+                    while msvcrt.kbhit():
+                        msvcrt.getwch()
+                    return True
+                time.sleep(0.02)
+            return False
+        if self.fd is None:
+            time.sleep(seconds)
+            return False
+        ready, _, _ = select.select([self.fd], [], [], seconds)
+        if ready:
+            os.read(self.fd, 1024)
+            return True
+        return False
+
+# --- RACE CONTROL (SYSTEM SHELL) ---
+class ShellCoprocess:
+    """One long-lived shell for passthrough commands.
+
+    Command lines go in on the shell's stdin and are eval'ed in that same
+    shell, so export, alias and cd stick between laps. Output goes straight
+    to the terminal (or, for captured runs, to a capture pipe); when a
+    command is done the shell reports "status\\0pwd\\0" on a separate pipe.
+    /dev/fd paths are used so plain sh (only fds 0-9) copes with whatever
+    descriptors we hand over.
+    """
+    SCRIPT = (
+        "shopt -s expand_aliases 2>/dev/null\n"
+        "trap : INT\n"
+        "while IFS= read -r __f1_line; do\n"
+        "  __f1_cmd=${{__f1_line#?}}\n"
+        "  case $__f1_line in\n"
+        "    C*) eval \"$__f1_cmd\" < /dev/fd/{stdin} > /dev/fd/{capture} 2>&1 ;;\n"
+        "    *) eval \"$__f1_cmd\" < /dev/fd/{stdin} ;;\n"
+        "  esac\n"
+        "  printf '%s\\0%s\\0' \"$?\" \"$PWD\" > /dev/fd/{status}\n"
+        "done\n"
+    )
+
+    def __init__(self):
+        self.proc = None
+        self.cwd = None
+        self.detached = False  # Batch runs: commands get /dev/null, not our stdin
+        self._commands = None
+        self._status = None
+        self._capture = None
+        self._buffer = b""
+
+    @property
+    def alive(self):
+        return self.proc is not None and self.proc.poll() is None
+
+    def start(self, cwd):
+        shell = shutil.which("bash") or "/bin/sh"
+        try:
+            if self.detached:
+                raise ValueError
+            stdin = os.dup(sys.stdin.fileno())
+        except (OSError, ValueError):
+            stdin = os.open(os.devnull, os.O_RDONLY)
+        cmd_r, cmd_w = os.pipe()
+        status_r, status_w = os.pipe()
+        capture_r, capture_w = os.pipe()
+        try:
+            self.proc = subprocess.Popen(
+                [shell, "-c", self.SCRIPT.format(stdin=stdin, status=status_w, capture=capture_w)],
+                stdin=cmd_r, pass_fds=(stdin, status_w, capture_w), cwd=cwd,
+            )
+        except OSError:
+            for fd in (cmd_w, status_r, capture_r):
+                os.close(fd)
+            raise
+        finally:
+            for fd in (stdin, cmd_r, status_w, capture_w):
+                os.close(fd)
+        os.set_blocking(capture_r, False)
+        self._commands = os.fdopen(cmd_w, "wb", buffering=0)
+        self._status = status_r
+        self._capture = capture_r
+        self._buffer = b""
+        self.cwd = cwd
+
+    def run(self, command, cwd, on_output=None):
+        """Runs a command line in `cwd`. Returns (exit status, the shell's
+        directory afterwards); status is None if the shell went away.
+
+        With `on_output`, stdout/stderr are captured and handed over in
+        chunks as they arrive instead of going to the terminal.
+        """
+        if not self.alive:
+            self.close()
+            self.start(cwd)
+
+        status = None
+        if cwd != self.cwd:
+            self._send("R", f"cd -- {shlex.quote(cwd)}")
+            status, self.cwd = self._wait()
+        if on_output:
+            self._drain(lambda chunk: None)  # Leftovers from a stray background job
+        for line in command.splitlines() or [""]:
+            if not self.alive:
+                return None, self.cwd
+            self._send("C" if on_output else "R", line)
+            status, self.cwd = self._wait(on_output)
+        return status, self.cwd
+
+    def _send(self, mode, line):
+        try:
+            self._commands.write(mode.encode() + os.fsencode(line) + b"\n")
+        except BrokenPipeError:
+            pass  # The shell died - _wait() sees EOF and reports it
+
+    def _drain(self, on_output):
+        while True:
+            try:
+                chunk = os.read(self._capture, 65536)
+            except BlockingIOError:
+                return
+            if not chunk:
+                return
+            on_output(chunk)
+
+    def _wait(self, on_output=None):
+        interrupts = 0
+        while self._buffer.count(b"\0") < 2:
+            try:
+                if on_output:
+                    ready, _, _ = select.select([self._status, self._capture], [], [])
+                    if self._capture in ready:
+                        self._drain(on_output)
+                    if self._status not in ready:
+                        continue
+                chunk = os.read(self._status, 4096)
+            except KeyboardInterrupt:
+                # The first Ctrl-C belongs to the command (the shell traps it),
+                # a second one means the command won't let go - pull the shell.
+                interrupts += 1
+                if interrupts > 1:
+                    self.close(kill=True)
+                    raise
+                continue
+            if not chunk:
+                if on_output:
+                    self._drain(on_output)
+                self.close()
+                return None, self.cwd
+            self._buffer += chunk
+        if on_output:
+            self._drain(on_output)  # Everything the command wrote is in the pipe by now
+        status, pwd, self._buffer = self._buffer.split(b"\0", 2)
+        return int(status), os.fsdecode(pwd)
+
+    def close(self, kill=False):
+        """Ends the shell (EOF on its stdin, or SIGKILL if `kill`)."""
+        if self.proc is None:
+            return
+        if kill and self.proc.poll() is None:
+            self.proc.kill()
+        try:
+            self._commands.close()
+        except OSError:
+            pass
+        os.close(self._status)
+        os.close(self._capture)
+        try:
+            self.proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+        self.proc = None
+
+# --- ONBOARD CAMERA (CAPTURED OUTPUT) ---
+ONBOARD_FPS = 10
+ONBOARD_TAIL_LINES = 500
+ONBOARD_SPILL_BYTES = 1024 * 1024
+
+class OnboardCapture:
+    """Bounded sink for captured command output.
+
+    Keeps only the last ONBOARD_TAIL_LINES lines in a ring buffer for the
+    live view. The full output stays in memory until it passes
+    ONBOARD_SPILL_BYTES, after which it is spilled to a temp file that can
+    be paged or searched later - so memory stays flat however much the
+    command prints.
+    """
+    def __init__(self, command):
+        self.command = command
+        self.tail = deque(maxlen=ONBOARD_TAIL_LINES)
+        self.bytes = 0
+        self.lines = 0
+        self.started = time.monotonic()
+        self.spill_path = None
+        self._memory = bytearray()
+        self._spill = None
+        self._partial = ""
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+
+    def feed(self, chunk):
+        self.bytes += len(chunk)
+        self.lines += chunk.count(b"\n")
+
+        if self._spill is not None:
+            self._spill.write(chunk)
+        else:
+            self._memory += chunk
+            if len(self._memory) > ONBOARD_SPILL_BYTES:
+                fd, self.spill_path = tempfile.mkstemp(prefix="f1_onboard_", suffix=".log")
+                self._spill = os.fdopen(fd, "wb")
+                self._spill.write(self._memory)
+                self._memory = None
+
+        text = self._partial + self._decoder.decode(chunk)
+        *complete, self._partial = text.split("\n")
+        self.tail.extend(complete)
+        if len(self._partial) > 65536:
+            # No newline in sight (progress bars, binary) - don't let it grow
+            self.tail.append(self._partial)
+            self._partial = ""
+
+    def finish(self):
+        if self._partial:
+            self.tail.append(self._partial)
+            self._partial = ""
+        if self._spill is not None:
+            self._spill.close()
+
+    def sync(self):
+        """Pushes spilled output to disk so open() sees all of it."""
+        if self._spill is not None and not self._spill.closed:
+            self._spill.flush()
+
+    def discard(self):
+        if self.spill_path:
+            try: os.remove(self.spill_path)
+            except OSError: pass
+
+    @property
+    def in_memory(self):
+        return self._memory is not None
+
+    def open(self):
+        """Binary file object over the whole capture."""
+        if self.in_memory:
+            return io.BytesIO(bytes(self._memory))
+        return open(self.spill_path, "rb")
+
+    def render(self, height):
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        tail = list(self.tail)[-max(height, 1):]
+        return Panel(
+            Text.from_ansi("\n".join(tail)),
+            title=f"[bold]ONBOARD CAMERA[/] [dim]{self.command}[/]",
+            subtitle=f"{self.lines} lines | {format_size(self.bytes)} | {format_size(int(self.bytes / elapsed))}/s",
+            border_style="cyan",
+        )
+
+# --- GARAGE (BACKGROUND JOBS) ---
+# "drs &", "news &" or "make &" leave the prompt free. Each job is a child
+# process (f1 itself in batch mode, or the shell) driven by an asyncio loop on
+# its own thread, so a job never draws over the prompt and kill really stops
+# the work. Output is kept in an OnboardCapture until someone runs fg.
+class Job:
+    def __init__(self, number, command, argv):
+        self.number = number
+        self.command = command
+        self.argv = argv
+        self.capture = OnboardCapture(command)
+        self.started = time.time()
+        self.finished = None
+        self.state = "Running"
+        self.proc = None
+        self.future = None
+        self.reported = False
+        self._watcher = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self.finished is None
+
+    def feed(self, chunk):
+        with self._lock:
+            self.capture.feed(chunk)
+            if self._watcher:
+                self._watcher(chunk)
+
+    def attach(self, watcher):
+        """Hands the output so far to `watcher`, then every new chunk until detach()."""
+        with self._lock:
+            self.capture.sync()
+            with self.capture.open() as fh:
+                for chunk in iter(lambda: fh.read(65536), b""):
+                    watcher(chunk)
+            self._watcher = watcher
+
+    def detach(self):
+        with self._lock:
+            self._watcher = None
+
+class Garage:
+    """Job table plus the event loop that runs the jobs."""
+    def __init__(self):
+        self.jobs = OrderedDict()
+        self.loop = None
+        self._next_number = 1
+
+    def launch(self, command, argv, cwd):
+        if self.loop is None:
+            load_part("asyncio")
+            self.loop = asyncio.new_event_loop()
+            threading.Thread(target=self.loop.run_forever, name="garage", daemon=True).start()
+        job = Job(self._next_number, command, argv)
+        self._next_number += 1
+        self.jobs[job.number] = job
+        job.future = asyncio.run_coroutine_threadsafe(self._drive(job, cwd), self.loop)
+        return job
+
+    async def _drive(self, job, cwd):
+        env = dict(os.environ, COLUMNS=str(console.width), F1_BOOT="off")
+        try:
+            job.proc = await asyncio.create_subprocess_exec(
+                *job.argv, cwd=cwd, env=env, stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                start_new_session=sys.platform != "win32",
+            )
+        except OSError as e:
+            job.feed(f"{e}\n".encode())
+            job.state = "Failed"
+        else:
+            if job.state == "Killed":  # kill landed while it was starting
+                self._terminate(job)
+            while True:
+                chunk = await job.proc.stdout.read(65536)
+                if not chunk:
+                    break
+                job.feed(chunk)
+            status = await job.proc.wait()
+            if job.state != "Killed":
+                job.state = "Done" if status == 0 else f"Exit {status}"
+        job.capture.finish()
+        job.finished = time.time()
+
+    def _terminate(self, job):
+        if job.proc is None or job.proc.returncode is not None:
+            return
+        try:
+            if sys.platform == "win32":
+                job.proc.terminate()
+            else:
+                import signal
+                os.killpg(job.proc.pid, signal.SIGTERM)  # The job and anything it started
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def kill(self, job):
+        if job.running:
+            job.state = "Killed"
+            self.loop.call_soon_threadsafe(self._terminate, job)
+
+    def running(self):
+        return [job for job in self.jobs.values() if job.running]
+
+    def newly_finished(self):
+        """Finished jobs that haven't been announced yet (marks them announced)."""
+        done = [job for job in self.jobs.values() if not job.running and not job.reported]
+        for job in done:
+            job.reported = True
+        return done
+
+    def find(self, ref=None):
+        """Job by number ('2' or '%2'), or the latest one. None if there's no such job."""
+        if not ref:
+            return next(reversed(self.jobs.values()), None)
+        ref = ref.strip().lstrip("%")
+        return self.jobs.get(int(ref)) if ref.isdigit() else None
+
+    def remove(self, job):
+        self.jobs.pop(job.number, None)
+        job.capture.discard()
+
+    def shutdown(self):
+        for job in self.running():
+            self.kill(job)
+        for job in list(self.jobs.values()):
+            if job.future is not None:
+                try:
+                    job.future.result(timeout=2)
+                except Exception:
+                    pass
+            job.capture.discard()
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+def job_argv(command, builtin):
+    """What a background job actually runs: f1 in batch mode for our own
+    commands, the user's shell for everything else."""
+    if builtin:
+        app = [sys.executable] if getattr(sys, 'frozen', False) else [sys.executable, os.path.abspath(__file__)]
+        return app + ["--no-boot", "-c", command]
+    if sys.platform == "win32":
+        return [os.environ.get("COMSPEC", "cmd.exe"), "/c", command]
+    return [shutil.which("bash") or "/bin/sh", "-c", command]
+
+BACKGROUND_MARK = re.compile(r"(?<![&>|])&\s*$")
+
+class PitWallOS:
+    def __init__(self, boot_mode=BOOT_MODE):
+        self.boot_mode = boot_mode if boot_mode in BOOT_MODES else "full"
+        self.running = True
+        self.interactive = False
+        self.garage = Garage()
         self.current_dir = os.getcwd()
         self.user = DRIVER_NAME 
         self.tyre_compound = "SOFT"
         self.lap_count = 1
-        self.platform_os = platform.system()
-
-        self.calendar = [
-            {"date": "2026-03-08", "event": "Australian Grand Prix", "circuit": "Albert Park"},
-            {"date": "2026-03-15", "event": "Chinese Grand Prix", "circuit": "Shanghai"},
-            {"date": "2026-03-29", "event": "Japanese Grand Prix", "circuit": "Suzuka"},
-            {"date": "2026-04-12", "event": "Bahrain Grand Prix", "circuit": "Sakhir"},
-            {"date": "2026-04-19", "event": "Saudi Arabian Grand Prix", "circuit": "Jeddah Corniche"},
-            {"date": "2026-05-03", "event": "Miami Grand Prix", "circuit": "Miami Autodrome"},
-            {"date": "2026-05-24", "event": "Canadian Grand Prix", "circuit": "Montreal"},
-            {"date": "2026-06-07", "event": "Monaco Grand Prix", "circuit": "Monte Carlo"},
-            {"date": "2026-06-14", "event": "Spanish Grand Prix", "circuit": "Barcelona-Catalunya"},
-            {"date": "2026-06-28", "event": "Austrian Grand Prix", "circuit": "Red Bull Ring"},
-            {"date": "2026-07-05", "event": "British Grand Prix", "circuit": "Silverstone"},
-            {"date": "2026-07-19", "event": "Belgian Grand Prix", "circuit": "Spa-Francorchamps"},
-            {"date": "2026-07-26", "event": "Hungarian Grand Prix", "circuit": "Hungaroring"},
-            {"date": "2026-08-23", "event": "Dutch Grand Prix", "circuit": "Zandvoort"},
-            {"date": "2026-09-06", "event": "Italian Grand Prix", "circuit": "Monza"},
-            {"date": "2026-09-13", "event": "Spanish Grand Prix", "circuit": "Madrid"},
-            {"date": "2026-09-26", "event": "Azerbaijan Grand Prix", "circuit": "Baku City"},
-            {"date": "2026-10-11", "event": "Singapore Grand Prix", "circuit": "Marina Bay"},
-            {"date": "2026-10-25", "event": "United States Grand Prix", "circuit": "COTA"},
-            {"date": "2026-11-01", "event": "Mexico City Grand Prix", "circuit": "Hermanos Rodriguez"},
-            {"date": "2026-11-08", "event": "São Paulo Grand Prix", "circuit": "Interlagos"},
-            {"date": "2026-11-21", "event": "Las Vegas Grand Prix", "circuit": "Las Vegas Strip"},
-            {"date": "2026-11-29", "event": "Qatar Grand Prix", "circuit": "Lusail"},
-            {"date": "2026-12-06", "event": "Abu Dhabi Grand Prix", "circuit": "Yas Marina"},
-        ]
+        self.shell = ShellCoprocess()
+        self.last_capture = None
 
         self.quotes = [
             ("Kimi Raikkonen", "Lotus", "Just leave me alone, I know what I'm doing."),
@@ -101,8 +2756,19 @@ class PitWallOS:
             ("Jenson Button", "McLaren", "I'm going to pee in your seat."),
         ]
 
+    @fit_parts("rich.live:Live")
     def boot_sequence(self):
-        """High-Intensity F1 Start Sequence."""
+        """High-Intensity F1 Start Sequence. Any key jumps straight to the grid."""
+        if self.boot_mode == "off" or not (console.is_terminal and sys.stdin.isatty()):
+            console.print("[bold red on black]Type in 'radio' to get started with the F1 commands !")
+            return
+        with KeyWatch() as keys:
+            self.start_lights(keys, pace=0.1 if self.boot_mode == "fast" else 1.0)
+        console.clear()
+        console.print("[bold red on black]Type in 'radio' to get started with the F1 commands !")
+
+    def start_lights(self, keys, pace=1.0):
+        """The lights themselves; `pace` scales every pause. Returns early on a keypress."""
         console.clear()
         
         logo = """
@@ -154,11 +2820,14 @@ class PitWallOS:
             )
 
         with Live(Align.center(get_gantry(0)), refresh_per_second=10) as live:
-            time.sleep(1.0)
+            if keys.wait(1.0 * pace):
+                return
             for i in range(1, 6):
                 live.update(Align.center(get_gantry(i)))
-                time.sleep(0.9) 
-            time.sleep(random.uniform(1.5, 3.5))
+                if keys.wait(0.9 * pace):
+                    return
+            if keys.wait(random.uniform(1.5, 3.5) * pace):
+                return
             
             gantry_out = Table.grid(padding=(0, 2))
             row_out = [Text(light_shape, style="black on black") for _ in range(5)]
@@ -172,13 +2841,12 @@ class PitWallOS:
                 expand=False
             )
             live.update(Align.center(final_panel))
-            time.sleep(0.5)
+            if keys.wait(0.5 * pace):
+                return
 
         console.print("\n")
-        console.print(Align.center("[bold green on black]  LIGHTS OUT AND AWAY WE GO!  [/]"))
-        time.sleep(1)
-        console.clear()
-        console.print("[bold red on black]Type in 'radio' to get started with the F1 commands !")
+        console.print(Align.center("[bold green on black]  LIGHTS OUT AND AWAY WE GO!  [/]"))
+        keys.wait(1.0 * pace)
 
     def make_bar(self, percent, length=15):
         percent = max(0, min(100, percent))
@@ -190,42 +2858,67 @@ class PitWallOS:
         return f"[{color}]{'█' * blocks}{'░' * spaces}[/]"
     
 
-    def cmd_next(self):
-        """Calculates and displays the next upcoming race."""
-        
-        now = datetime.now()
-        upcoming_race = None
-        
-        # Logic: Find the first race in the future
-        for race in self.calendar:
-            race_date = datetime.strptime(race["date"], "%Y-%m-%d")
-            
-            # If this race is in the future
-            if race_date > now:
-                upcoming_race = race
-                break
-        
+    @command("next", usage="next [n]", summary="Next Race Countdown", options="--all")
+    def cmd_next(self, arg_string=None):
+        """The next race weekend; `next <n>` or `next --all` lists what's coming."""
+        flags, rest = parse_flags(arg_string, switches=("--all",))
+        if rest and not rest.isdigit():
+            console.print("[yellow]Engineer:[/ yellow] Usage: next \\[n] | next --all")
+            return COMMAND_FAILED
+        try:
+            schedule = race_calendar()
+        except (OSError, KeyError, ValueError):
+            console.print("[bold red]NO DATA:[/] Race calendar (f1_calendar.txt) is missing or unreadable.")
+            return COMMAND_FAILED
+
+        now = time.time()
+        if flags["--all"] or rest:
+            weekends = schedule.upcoming(None if flags["--all"] else int(rest), now)
+            if weekends:
+                console.print(self.build_calendar_table("UPCOMING RACES", weekends, now))
+                return
+            upcoming_race = None
+        else:
+            upcoming_race = next(iter(schedule.upcoming(1, now)), None)
+
         # Display Logic
         if upcoming_race:
-            race_date = datetime.strptime(upcoming_race["date"], "%Y-%m-%d")
-            delta = race_date - now
-            days_left = delta.days
-            
+            race_date = upcoming_race.track_time(upcoming_race.race_start)
+            yours = datetime.fromtimestamp(upcoming_race.race_start).astimezone()
+
             # Visual Panel
             grid = Table.grid(expand=True, padding=(0, 2))
             grid.add_column(style="bold white", justify="right")
             grid.add_column(style="bold cyan")
-            
-            grid.add_row("NEXT EVENT", f"[bold yellow]{upcoming_race['event'].upper()}[/]")
-            grid.add_row("LOCATION", upcoming_race['circuit'])
+
+            grid.add_row("NEXT EVENT", f"[bold yellow]{upcoming_race.event.upper()}[/]")
+            grid.add_row("LOCATION", f"{upcoming_race.circuit} [dim]({upcoming_race.timezone})[/]")
             grid.add_row("DATE", race_date.strftime("%d %B %Y"))
-            grid.add_row("COUNTDOWN", f"[bold red blink]{days_left} DAYS[/] until Lights Out")
-            
+            grid.add_row("LIGHTS OUT", f"{race_date:%H:%M} local, [dim]{yours:%a %H:%M} yours[/]")
+            grid.add_row("COUNTDOWN", f"[bold red blink]{countdown(upcoming_race.race_start - now).upper()}[/] until Lights Out")
+
+            upcoming_session = schedule.next_session(now)
+            if upcoming_session and upcoming_session[0] is upcoming_race and upcoming_session[1] != "Race":
+                _, name, start = upcoming_session
+                if name in upcoming_race.estimated:
+                    grid.add_row("NEXT SESSION", f"{name} in ~{countdown(start - now)} [yellow](estimated)[/]")
+                else:
+                    grid.add_row("NEXT SESSION", f"{name} in {countdown(start - now)}")
+            grid.add_row("", "")
+            for name, start in upcoming_race.sessions:
+                style = "dim strike" if start <= now else "white"
+                when = f"{upcoming_race.track_time(start):%a %H:%M}"
+                if name in upcoming_race.estimated:
+                    when = f"~{when} [yellow]est.[/]"
+                grid.add_row(f"[{style}]{name.upper()}[/]", f"[{style}]{when}[/]")
+            if upcoming_race.estimated:
+                grid.add_row("", "[dim]est. = usual weekend pattern, timetable not published[/]")
+
             console.print(Panel(
                 grid,
                 title="[bold white]UPCOMING SESSION[/]",
                 border_style="green",
-                width=50
+                width=60
             ))
         else:
             # Fallback if season is over and next year isn't in list yet
@@ -234,633 +2927,128 @@ class PitWallOS:
                 title="OFF SEASON",
                 border_style="grey50"
             ))
-    
+
+    @command("season", usage="season [year]", summary="Season Calendar")
+    def cmd_season(self, arg_string=None):
+        """Every round of a season (this year's by default)."""
+        arg = (arg_string or "").strip()
+        if arg and not arg.isdigit():
+            console.print("[yellow]Engineer:[/ yellow] Usage: season \\[year]")
+            return COMMAND_FAILED
+        try:
+            schedule = race_calendar()
+        except (OSError, KeyError, ValueError):
+            console.print("[bold red]NO DATA:[/] Race calendar (f1_calendar.txt) is missing or unreadable.")
+            return COMMAND_FAILED
+        year = int(arg) if arg else datetime.now().year
+        weekends = schedule.season(year)
+        if not weekends:
+            seasons = ", ".join(str(season) for season in schedule.seasons)
+            console.print(f"[bold red]NO DATA:[/] No {year} calendar. Seasons on file: {seasons}")
+            return COMMAND_FAILED
+        console.print(self.build_calendar_table(f"{year} FIA FORMULA ONE WORLD CHAMPIONSHIP", weekends, time.time()))
+
+    def build_calendar_table(self, title, weekends, now):
+        table = Table(title=title, border_style="red")
+        table.add_column("Rd", justify="right", style="dim")
+        table.add_column("Grand Prix", style="bold white")
+        table.add_column("Circuit", style="italic white")
+        table.add_column("Date")
+        table.add_column("Lights Out", justify="right")
+        table.add_column("", justify="right")
+        upcoming = next((w for w in weekends if w.race_start > now), None)
+        for weekend in weekends:
+            start = weekend.track_time(weekend.race_start)
+            if weekend.race_start <= now:
+                status = "[dim]done[/]"
+            elif weekend is upcoming:
+                status = f"[bold red]NEXT - {countdown(weekend.race_start - now)}[/]"
+            else:
+                status = f"[dim]{countdown(weekend.race_start - now)}[/]"
+            sprint = " [magenta]SPRINT[/]" if weekend.sprint else ""
+            table.add_row(str(weekend.round), f"{weekend.event}{sprint}", weekend.circuit,
+                          f"{start:%d %b %Y}", f"{start:%H:%M} [dim]{start:%z}[/]", status)
+        return table
 
     def get_track_ascii(self, track_name):
         """Returns ASCII art for famous circuits."""
-        tracks = {
-            "monza": """
-    [bold red]AUTODROMO NAZIONALE MONZA[/]
-    [dim]Italy | 5.793 km | 53 Laps[/]
-
- &#BBBBYGGGGGGGGG#                                                                                  
-#GGGBBBPB####&&#GGB                                                                                 
-PGG             #GGG                                                                                
-GGG&             &PYP&                                                                              
-&GGG              &GGG#                                                                             
- #P5G               BGG#                                                                            
-  GPG&               BGGB                                                                           
-   GGG                #GGB&                                                                         
-   #GGB                &GGG#                                                                        
-    BGGG#                #GGG#                                                                      
-     &GGG                  #GGG#                                                                    
-      GGG                    BGGB&                                                                  
-      GGG                     &BGGB&                                                                
-      BGG&                      &BGGB&                                                              
-      BGG&                        #GGG#                                                             
-      55B                          #GGGB                                                           
-      &PPB                            #Y5G#                                                         
-       GGG                             &#GGB&                                                       
-       GGG                               &BGGBBGBB#&                                                
-       #GGB                                &#####BGGB&&&&&                                          
-        GGG#                                      &BGGGGGGGGJBBBBBBB####&&&&&&                      
-         GGG#                                         &&&&&#B##BBBBBBGGGGGGGGGGGGGGBBBBBPB###&&&&   
-          BGGB&                                                          &&&&&&####BBBBBYGGGGGGGGGB 
-           &BGGG#&&               &&                                                         &&&#GGG
-             &#BGGGGBBBBPG###BBBGGGGB&&&                                                         GGP
-                 &###BBB5PBBBBBB##BGGGGG5YGGGGBBBBBBB#####&&&&&&                               &GGG#
-                                   &&&&&#######BBBBBBBGGGGGGGGGGGGGGBBBBBPB#####&&&&&&&&&###BBGGGB& 
-                                                          &&&&&&####BBBBBYGGGGGGGGGGGGGGGGGGGBB#&  
-            """,
-
-            "silverstone": """
-    [bold blue]SILVERSTONE CIRCUIT[/]
-    [dim]UK | 5.891 km | 52 Laps[/]
-
-                                    &&&       &####&                                                
-                        &&&&&&&&&#BGGGGGB####BGGBGGGB                                               
-             &&##BBBGGGGG55GGGGGGGB#&&&#BBBBGB#&  &GGG&                                             
-          #BGGGGBBB###&&&&&&&&&&     &######&       BGGB#&                                          
-        &GGG#&&                    &BGGGBB55GGB#     &#BGYPB#&                                      
-        #GG&                     &BGGB&  &#BGGGG&        ##BGGGB#&                                  
-        #GG&                   &BGGB&   BGGGB##&             &#BGGGB#&                              
-        &GG#                 &BGGB&     BGGB&                    &#BGGGB#&                          
-         PPB               &BGGB&        &BGPG                       &#BGGGGB&                      
-         PPG              #GGB&            #55G#                         &#PPGGB#&                  
-         BGG            #GGB&                #GGB                            &#GGGB#&               
-         #GG&         BPGB&                   BGG&                              &#BGGB              
-         &GG#       #GPP#                     #GG&                                 &GGB             
-          GGB     #GGG#                       GGG                                  #GGB             
-          BGG&   BGG#                         GGB                              &BBGGG#              
-           BGG#     ###&&                     GGG#                          #BGGGB#&                
-            #GGGB     GGGG&                    #BGGB&                    &#GGG#&                    
-              &BGGG    #GGB                      &#GGGB&               &BY5B#                       
-                 &&G    GB&                         &BGGGB&          #GGGB#                         
-                    &&&&                               &BGGG##       #GGG                           
-                                                          #BY5B#&    &GGG#                          
-                                                            &#BGGBBBYPGB&                           
-                                                               &#BB#B#                              
-
-            """,
-
-            "spa": """
-    [bold yellow]CIRCUIT DE SPA-FRANCORCHAMPS[/]
-    [dim]Belgium | 7.004 km | 44 Laps[/]
-    
-                                                                      &&###&                        
-                                                               &&BBBBGGGGGGG#&#GBBB#                
-                                                       &&##BBGGGGYPB##&&  #GGGGYBBGGG&              
-                                               &&&#BBGGGGGGBB##&&                  BPYG             
-                                         &##BBGGGGGBB##&&                        && #PGG#           
-                                      #BGGGGBB#&&                         &&##BBGGGGB&#GGB          
-                                  &BGGGGB&&                    &&&##BBB55GGGGGBB#&&BPYB&GGG&        
-                              &&BGG5P#&                      BGGGGGGBBBBB&&&        BPGB#GGG        
-                         #BBGGGGGB#                         GGG#&                    &BGGBB&        
-                       &GGGB#&&&                           &GGB                                     
-                     &BGGB&                                &GGB                                     
-                   BPGGB&                                   BGGB&                                   
-                &BGG5B&                                      #BGGGB#&&                              
-             &#GGGB&                        &#BBGGGGB#&&       &##BGGY5B##&                         
-           &BGGG#       &#BBB#       &&##BGGGGBB####BGYYBB#&        &##BGGGGB#&                     
-          #GGG#     &#BGGGGGGGBBGGG55GGGGB##&         &#BBGGG#            &#BGG#                    
-        &PGG#   &#BY5GGB#& &B########&&                   &#GGG#            #GG#                    
-       &G55& &BGGGGGG&                                       BGG#          #GGB                     
-      &GGGGBGGGB#&                                            BGGB         #GGB&                    
-     &GGGGGGB#&                                                #GGB         #BGGGB#                 
-      #BB#&                                                     #GGG&          #BYPGB#              
-                                                                 &BG5G&           &#GGB             
-                                                                   #PGGB&          GGGB             
-                                                                     &BGGGB#&    #G55&              
-                                                                        #BGGGGBBGGG#                
-                                                                           &&##B##&                 
-            """,
-
-            "monaco": """
-    [bold red]CIRCUIT DE MONACO[/]
-    [dim]Monaco | 3.337 km | 78 Laps[/]
-
-                                                                #BBB&                               
-                                                             &BGG##PG&#G##&                         
-                                                           &BP5#  &5PGBPBGG                         
-                                                         #GGB&     GGG  #GB                         
-                                                        GG#&       &B#  PG&                         
-                                                       &GG             BYB                          
-                                                        &GG&          GG#                           
-                                                         #GG        &GG#                            
-                                               &&&&##&&#BGG#      &BGB&                             
-                          &BGBBBBBBBBGPBBBBBBBGGBBBPGBBB#&    &#BGGB&                               
-                         #GG                               BBGGB#&                                  
-                        BGB  &BBBBBG5BBBBB###GGGBBBBBBBBPB##&&                                      
-                       BGB  #PG&&&&&&&&&&######                                                     
-                      #GG   G5#                                                                     
-                      GG&  #GB                                                                      
-                      55   &GG&                                                                     
-                     &GG    G5#                                                                     
-                     &GG    G5#                                                                     
-                     &GG   #GG&                                                                     
-                      GG   GG&                                                                      
-                      BPB  BGB&                                                                     
-                       BGB  &5PB&                                                                   
-                        BP#   &BGGB                                                                 
-                        #GGB    BGG&                                                                
-                          &&&B####&                                                                 
-
-            """,
-            
-            "abudhabi": """
-    [bold cyan]YAS MARINA CIRCUIT[/]
-    [dim]Abu Dhabi | 5.281 km | 58 Laps[/]
-
-                                        ~^                                                          
-                                       :PPYJ!^:                                                     
-                                 ^~!77?JB!:~7JYJ7~:                                                 
-                            ^77JYY?              JYYJ!^:                                            
-                          :?5Y7^:   ~7JYYY?77P5^:  :~7JYY?!^:                                       
-                        ^JP?^     :P57^: :  :5P         ^!?JYJ7~:                                   
-                      ~Y57:       ~#^^:     :YY             :^7JYY?!^                               
-           :        75Y~          ^#^   :   :55~:                ^!?YYJ!^:              :           
-                 :7PJ~~77????~    ^#^   :   :PP~:            :       :~?YYJ7~:                      
-               :?PJ^?PY?!~77PP    ^#~       :PP^:                        :~7JYY?~^                  
-              7PJ:!PJ:::    5P    !#^       :PP                               ^!?YYJ!^              
-            ^5P^ YG!:     :~7YYJJJPJ^       :PP               :~!!!~:             :~?YYJ7~:         
-           ?G7  ~#^^^      :  ::^^::^       :PP       :     ~5YJY77JYYJ7~^::::::::    :~7JG!:       
-         ^P5^   5P                          :PP      :^:^^^YG!  :    :~7YJJJJJJJJJJJJJJJJJ5~^       
-        !G?    ^#!                          :P5          ^5G:           :          :::::::          
-        #?     YP                           :YG~!!7??JJJY55^                                        
-        7P?!~!JG^                           :^JJ??77!~~~^:^:                                        
-         !77??!:                                                                                    
-
-            """,
-
-
-            "mexico": """
-    [bold cyan]Autódromo Hermanos Rodríguez[/]
-    [dim]Mexico City | 4.304 km | 71 Laps[/]
-
-   :?5PBGGGGGGGGGBGPP5YJ?7!~^:                                                                      
-  Y#P7^:         :^^~!7?JY55PPPPPPP55YYJ?77!~~^^:                                                   
-^##^                            ::^^~!77?JJY55PPPPPPPPPPP55YYJ??7!!~^^:                             
-B&:        :^                                        ::^^~~!!7?JJYY5PPPPPPPPP5YYJ?7!~~^::           
-P#55YJ?7^~5# 5                                                            :^^~!7??JY5PPPGGPGP5Y?^   
-  ^~!77YPPJ:P&:                                                                            :^~!Y J  
-            ? !                                                                                ~ J  
-            ^ Y                                                                                ? J  
-             &G                                                                                 ?P#P
-             5&5J??7!~^^:                                                                         G 
-              ^!7??JY55PGPGGPP55YJ?7!~^:                                                          ##
-                           ::^~!!7?JY5PPGGPJ~                                                    ? 7
-                                         :~JPGGJ!:                                              ~ 5 
-                                              ~?PGG7                                           ~&G  
-                                                  ? 5                                         ! P   
-                                                   ? J                                       J Y    
-                                                    ?#GYJ?77!~^:                            5 7     
-                                                      ~!7?JJY5PPGGY^                      :B&~      
-                                                                 ^P 7                    ~&B:       
-                                                                   Y J                  7 5         
-                                                                    !GBY~              5 ?          
-                                                                      ^JGB5^         :B&~           
-                                                                         ^ G        !&G:            
-                                                                         ^ Y       J Y              
-                                                                         ? !     :G&7               
-                                                                         5 ^    ~&B^                
-                                                                         B#    ? 5                  
-                                                                        : P   5&7                   
-                                                                        ! ?  ^##7:                  
-                                                                        J ~    ~5 P                 
-                                                                        G :    7G#?                 
-                                                                        ##  !5BP!                   
-                                                                        7BBBG?:                     
-
-            """,
-
-            "imola": """
-    [bold cyan] Autodromo Internazionale Enzo e Dino Ferrari[/]
-    [dim]Imola | 4.909 km | 63 Laps[/]
-
-                                                                :~!~^:                ::^^^:        
-                                                               YBP55PPPP5YJJJYY5575PPPPPP5PG5:      
-                                                             :PBJ    :^~!77777!!~:^^::  :!5B5       
-                                                             5BJ                      ~?JGY~        
-                                                            ^BG:                   ^?PG5~           
-                                                            :GB~                 :5G57:             
-                                                             ?5J                 ^GB~               
-                                                             ~BG:                 5B?               
-                                                              5B?                7BP:               
-                                :^7J5PY!~~~~^^^^:^^^^:::::   ?GG~               7BG^                
-                           :~?5P5?Y?!?555555555P7PPPPPPPPPP5PBY:               ~PG~                 
-                        :75GPY7^:                         ^!7~                ~GP^                  
-                      ~5GP?^                                                 ~GB!                   
-                    7PBY~                                                   ^GB!                    
-                 ^JGGJ^                                                    ^GB7                     
-             :~?5GP7:                                                   :~?GG7                      
-         !J5PP?Y7^                                                   ^JPGPY7:                       
-        !#G7^       :~7J55PPPPPPPP55557Y5YJ7~^:                     ~GB7:                           
-         J5?  :~7J5?5PY?!~^::^^^^^^~~~^~!7?Y5PPPP5YJ??????7!YYY555PPP57                             
-          YGPPPPY?!^                           :~!7??JJJJ?7~77!!~~^:                                
-           :^^                                                                             
-            """,
-
-
-            "interlagos": """
-    [bold cyan]  Autódromo José Carlos Pace [/]
-    [dim] Sao Paulo | 4.309 km | 71 Laps[/]
-
-                                                :^!7??JJYYJJ?7!~^:                                  
-                                        :^!?Y5GB#####BBGGGGGB##&##BGP5Y?7~^:                        
-                                 ^~7J5PB####BP5?!~:       ::: :~!7JY5GBB##&##BGPYJ?!^:              
-                         :^!?YPGB###BG5J7~^:    :~!?J5PGBBBBB5!         :^~!?JY5GBB###GY!:          
-                  :~7J5PB##&#BPY?!^:        ^YG##&##GG5YJ?775&&J            :~!?YP5J7JP#&#5~        
-          :^!?YPG##&#BG5J7!^:              J#&BJ!^:         5#&?       ^?PB##&#BGP##P  :7G&#Y       
-    ^!J5GB####BPY?!~:                     5&#5:           !B&B7      !P#&BY7!^:  7#&B:    J#&G~     
- ^JG#&#G5J7~^                            7&#G            :##G:     !P&&P!     :JB&#Y:      !B&#7    
-J#&G?^                                   5#&?            :#&B^   !P&&P!     ~5#&G?:         ^G##7   
-B##!                                     J&#5             ^G##GG#&#P!     !P&&P!             ^B##~  
-~G&#Y!                                   :G&#J:             ~?YYJ!:      J&&P~                !##B  
-  7P#&B?                                  :Y#&#5!:                      ~&#P                   Y#&J 
-    :B#&^                                   :7P#&#57:                   ?&&?                   :B##~
-    ?#&P                                       :7P#&#P7:                ?&#J                    ?##P
-   Y&#Y                                           :75#&#P?^             :B&B!                   :###
-  7&#5                                               :!5B&#P?^           ^P&&5~                 ^###
-  P##~                                                   !5B&#P?^          !P#&B57:             P##J
-  B#B:                                                      !YB&#G?^         :75B&#GJ~         ?&#P 
-  G##^                                                         !YB&#G?^          ~?P#&#P?^    ^###^ 
-  7&#5                                                            ~YB&#P?           :!YG&&BY!7B&#7  
-   J#&P^                                                             !5#&B7             ^75B##B5~   
-    !G&#5~                                                             ^G&&Y                ::      
-      7P#&B57~:                                                          G#&!                       
-        ^?5B#&#BGPYJ7~^:                                                 J&&Y                       
-            :~7JYPGB####BGPY?7~^:                                        J&&Y                       
-                    :^~7JYPGB####BG5Y?!~:                                P#&?                       
-                             :^!?J5PB#####BP5J7!^:                      :B##^                       
-                                      :~!?Y5GB####BGPYJ7~^:             7&#P                        
-                                              :^~7?YPGB####BGPY?7~^:   ^G#&7                        
-                                                       :^~7JYPGB#&##BGB#&B?                         
-                                                                :^!7JJJ?~                                                                                     
-            """,
-
-
-            "sakhir": """
-    [bold cyan]  Bahrain International Circuit  [/]
-    [dim]Sakhir | 3.543 km | 87 Laps[/]
-
-                          &&&                                                                       
-                        &GGGGGB&                                                                    
-                        BGG##GGG#                         &#BB#&                                    
-                        GGG   BG55#                     &BGGBBGGB                                   
-                       #GGB    &GGGGB&                 &GGG&  #GGB&                                 
-                       BGG&       #BGGGB#&            &PPG&    &GGG#                                
-                       GGG          &&#BGGB           G55#       BGGB                               
-                      #GGB              GGG          #GGB         #GGG&                             
-                      BGG&              GGG          &GGG          &GGG#                            
-                      GGG               BGGB&         #GGG#&         BGGB                           
-                     #YYB                #BGGB#&       &BGGGP5B#&     #GGB&                         
-                     BGG&                  &BBYYB#&       &&GGBGGGB    &GGG#                        
-                     GGG                  #& &#BGGGB&           #GGG&    BGPG                       
-                    #GGB                   GGGBBGGGGB            #GGB     BY5B&                     
-                    BGG&                     BBBBBBB#&&&&&&&&&&&&#GGG      &GGG&                    
-                    BGG&                     GGGGGGG?PGGGGGGGGGGGGGB&        BGG#                   
-                    &GGG                     &&&&&&&&&&&&&&&&&&&&&&           #GGB                  
-                     #GGB                                                      &GGG&                
-                    #BGG#                                                        GGG#               
-                   GGGGB################################GG#####################BBGGG#               
-                   #BBBBGGGGGGGGGGGBBBBBBBBBBBBBBBBBBBBB55BBBBBBBBBBBBBBBBBBBBBBB#& 
-                   #                                                                            
-            """,
-
-
-
-            "baku": """
-    [bold cyan]  Azerbaijan Grand Prix  [/]
-    [dim]Baku | 6.003 km | 51 Laps[/]
-
-                   :^^^^^^^^^^:::                                                                                                 
-               :?PP5555555555555PPPP5Y?:                                       !PPP55555YYJJ??77!!~~^^^::                         
-             ^YB5~                 :^~&5                                      :&5 :::^^^~~!!77??JJYY5555PPPP555YJ??7!~~^^:        
-           ~5BY:                     :&P^                                     7 ~                          ::^~~!7?JJY555PPP7     
-         ^PB?:                        ^?BP^                                   P#                                           7 !    
-        ~&5                              G&:                                  &5                                           ^ 7    
-       ~ Y                               BG                 :7??JJJJJJJJJ???7Y ~                                           7 ~    
-      ~&Y                               ~ 7                :&G777!!!!!!!!777??~                                            ? ^    
-     ~&5                                5&      :^^~!7?JYY5PG^                                                             Y&:    
-    ^&5                                 GB?Y5PPGGBBBBBBBGGGP55P555YJJ??77!~~^^::                                           PB     
-    7 7                                 ~P#BBGPP55YJ?7!~~^^::::^^~~!!7??JJYY555PPPP5555YYYJ??77!~~^^::                     #P     
-     ?&Y                               Y#Y!^::                                     ::^^~~!!77?JJYY555PPPP555YYJJ?77!!~^^^:? !     
-      ^BB^                           7#P^                                                               ::^^~~!77?JJYY555PP7      
-        5&7                   :^~7?YGG!                                                                                           
-         7&5           :!?J55PP5YJ7~:                                                                                             
-          ^GB~      ~JPPY?!~^                                                                                                     
-            J#Y^^!YGP?^                                                                                                           
-             ^Y55Y7:                                                                                                                                                                                                                                             
-                                                                       
-            """,
-
-
-            "buddh": """
-    [bold cyan]  Indian Grand Prix  [/]
-    [dim]Greater Noida | 5.125 km | 60 Laps[/]
-
-                            .^~!!~^                                                                     
-                      ~5Y?7!!7JP~                                                                   
-                     !B~       YG                                                                   
-                     !#~       :B7                                                                  
-                      !YYJ!:    !B7                                                                 
-                        .~?YY?~. :PY.                                                               
-                            :~?YY7~JG~                                                              
-                                :!GJ~PY^.:^~!!:                                                     
-                                  JB. !JJJ?7!7YY?~.                                                 
-                                  :?5Y!:       :!J5J!:                                              
-                                     ^7Y5?~!!:    .^7YY7.                                           
-                                        .~7!?B~       .YG.                                          
-                                             ?B.     ^?5J                                           
-                                             ^#~ .~J5Y!.                                            
-                                          .!J5J!J5J~.                                               
-                                       :7Y5YYYY?^.                                                  
-                                    ^7YY7?5J7:                                                      
-                                 ^?5Y7:  ?G7~~~^^::..                                               
-                             .~J5Y!.      :!!77??JJJJJJJJJ??77!!~^^::..                             
-                          .~J5J!.                     ..::^^~~!77??JJJJJJJJJ?7:                     
-                        ^JY?~                                          ...::~#7                     
-                        YB7~~^:..                                           JG.                     
-                         ^~!7?JJJJJJ?7!~^::.                                5P                      
-                                 .::^~!7?JJJJJJ?7!~^^:.                     ^B?                     
-                                            ..:^~!7??JJYJJ?7!~^:..           :5P!.                  
-                                                       ..:^~!7?JJYJJ??7!~^:.   ^?YJ~.               
-                                                                  .:^^~7??JJJJJ?77J5P5^             
-                                                                            ..:^~!7?JY:             
-                                                     
-            """,
-
-
-
-            "barcelona": """
-    [bold cyan]  Circuit de Barcelona-Catalunya  [/]
-    [dim]Barcelona | 4.66 km | 66 Laps[/]
-
-                 &##BB##&&                                                                          
-               &BGGGBBGPPGGBB##&&                                                                   
-              &PGG&       #BBGGGGGGBB#&&                                                            
-              GPP              &&##BGGGGGGBB##&&                                                    
-             BGGG&   &GGGG#           &&##BBGGGGGBB##&&                                             
-              #GGP&  BGPGGGG#                &&&#BBGGGGGGBB#&&&                                     
-              BPGB   #PP# #GGG#                      &&##BBGGGGGBB##&&                              
-             #GPB    &GGG&  #GGG#                           &&##BBGGGGPGBB#&&                       
-             GGGB&    #BGGG&  #GGG#                                      GGGGGBB                    
-              #BGGGB&   &GGG    #GGGB                    &GGG##BGGGG       &&BGGB                   
-                &#GPGGB#BGGB      #PPG#                 #GGG&      &#BGG     BPP#                   
-                   &#BGGBB#         #GGG#            &#GGGB&          &BGP   GGG#                   
-                                      #GGG#&      &#BPPB#&              &GG    GGGB#                
-                                        #GGGB&&&#BGGGB&    &#BGGGGBB##&&  &BG   #BPPG#              
-                                          #BGGGGGGB&      BGGB       PPGGBBBGGG   &BGG#             
-                                             &&&&        BGG#        &&&#BBBBB&     GGG             
-                                                         #GGGB#&&                  #GGG             
-                                                          &#BGGGGGGGG##&&       &#BGGB              
-                                                               &&##BGGGGGGGBBBGGGGGB&               
-                                                                      &&&##BBB##&&                                                                                                               
-                                                      
-            """,
-
-
-
-            "montreal": """
-    [bold cyan]  Canadian Grand Prix  [/]
-    [dim]Montreal | 4.361 km | 70 Laps[/]
-
-                                          ::::::::                                                  
-                                     !JPGBBBBBBBBBBGPPYJ?!~:                                        
-                                    J&&GJ????777???JY5PGB###BPY?!^                                  
-                          :^!77!!~^^P&#^                :^~7J5G#&#G~                                
-                        !5B&########&&P:                       :!&@P~^:                             
-                     ^7P&&5!^:::^^~~!~:                          !5B&#BPY?!^:                       
-              ~J5Y??P#&BY~                                         :^!J5GB###BG5YJJ??JY5PGGPY^      
-           :!P&&GG##GJ~                                                  :^~7?Y5PGGGGGPP5YJ#@B:     
-         ^?B&#Y~  ::                                                             :^~7YPGGGB&#?      
-        J#@G?:                                                           :^~!?YPG####B5J???!:       
-       5@&?                          ::^^:                 ::^^~~!77?JY5GB###BG5J7!~:               
-      J&&7:7J?7!~^:::::^^~!!7?JY55PGBB####Y^^^~~!7?JJY5PPGBB#######BBGP5Y?!~::                      
-      B@B?#@#B##############BBGGP5YJ?77~7B&#######BBGPP5YJ?77!~~^^::                                
-      ~5GBG?: :^~!!777!!~^^:::           :!!!~^^:::                                                                                                                                                                
-                                                      
-            """,
-
-
-
-            "miami": """
-    [bold cyan]  Miami Grand Prix  [/]
-    [dim]Miami | 5.41 km | 57 Laps[/]
-
-                                    .:~7?JYY555YJ?7!^:                                              
-                              .^7JPB&&&&#BGGPPPPGB##&#BPJ!:.                                        
-                        .^7YP#&@&#PY7~:.    :~7JY5PPPGGB#&&#BGPGGGGGBBBBBBBBBBBGP5J7~::::^^:        
-                   .~?5B&@&BPJ7^.        ~5#@&#BGPPGB#&&BPYJJYYYYYYYJJJJJJ????JY5GB&&&&&&&&&G~      
-               ^7YB&@&B57~.             J@@P!:.      .^7P#@#P?^            .^!!~:  .^~~~~:^#@#      
-           :75#@@B5?^.                  #@B              .~JG&@#57:     ^?G&@&#&@B7      :J@@Y      
-          ~@@@P!:                      ^#@G                  :!YB@@B55P#@&GJ^..:J&@#Y??YB@@B7       
-          .5#@#5~                   .7G&@B~                      ^7YPP5J!:       .75B##G5?^         
-             ^P@@!                  J@@G~                                                           
-        ~J555YB@#^                  ^P#&#GJ!:                                                       
-      :P@&GPPP5?:                     .~?P#@@#PJ~:                                                  
-      G@@J                                 :!YG#@&B5?~:                                             
-      !&@G                                     .^7YG&@&B5?^.        .~JPB##BGY~.                    
-      J@@?.:.......                                  ^7YG&&#G5YJJY5G#@&GJ??JP&@#Y^                  
-      Y&@&&&&&&######BBBBGGGGPPPP555YYYJJJ???7777!!!~~^^^~?YGB###BGPJ!:      .!G@&P~                
-       :^~~~!!!!777???JJJJYYY555PPPGGGGBBBB######&&&&&&&&&&##&&&&########BBBBGGG@@@B                
-                                              ......:::::^^^^~~~~!!!777????JJJYYYY?:                
-                                                     
-            """,
-
-
-            "qatar": """
-    [bold cyan]  Qatar Grand Prix  [/]
-    [dim]Lusail International Circuit | 5.41 km | 57 Laps[/]
-
-                               :?PGBG57:                                                            
-                              !#@P?7JB@G^                              :~7????????7!^               
-                              G@P    :G@P                            ~5##BGGGGGGGGB#&P^             
-          :^!?YPGG57:        ^#@?     ?@&~                          ?&&Y^:         ^5@#!            
-        !5B##BPY?JG@#7       7@&~      5@B^                        7&&7              J&&7           
-       Y@#?~:      ?@&!      5@G       :5@#7                      !&@?                7&@J          
-      :B@Y          Y@#^    :B@Y         7B@BJ^                  ^#@Y                  ~B@P:        
-       ?@#~         :G@P    !&&!          :!P&&Y:               :G@P:                   :B@Y        
-        P@B:         ~&@?   Y@B:             ^P@B:             :P@G:                    ?&@?        
-        ^B@Y          J@#^  G@5               ?@#^             5@B^                   !G@G!         
-         !&&7         :G@G:~&@7              ~#@J            :5@B~                  ~P@#?:          
-          Y@#^         ^P&##&P:              P@G            7B@P^                 ^5&&J:            
-          :G@P           ^77~               7&&~         :7G@B?                 :J&&5^              
-           ~#@J                            :B@5       :!Y#&G7:                :?#@P~                
-            ?@&!                           ^#@Y^^^!?YG#&BY~                  !B@G!                  
-             5@B:                           !G#####BPY7^                    ^#@Y                    
-             :G@P^                            ^^~^:                         :B@5:                   
-              ^5&&PJ~:                                                       ^P@B~                  
-                ^75B&#PJ~:                                                     J&&?                 
-                    ^?5B&#P?:                                                   !B@P:               
-                       :^7G@G^                                                   ^P@B!              
-                          ~&@7                                                     ?&&J             
-                       :~JB@P:                                                      ~B@P^           
-                   :~?P#&B5!                                                         :5@#7          
-               :~JP#&B5?~:                                                             7#@5^        
-              JB&B5?~:                                                                  ^5@#7       
-             J@#!                                                                         7#@Y      
-             J@#~                                                                          P@G      
-             :Y#&GYYYYYYJJJJJJJJJJJJJJ????????????????????JJJJJJJJJJJJJJJYYYYYYYYYYYYYYYY5B&G~      
-               ^7Y5PPPPPPPPPPPPPPPPPGGGGGGGGGGGGGGGGGGGGGGGGPPPPPPPPPPPPPPPPPPP55555555555J!:                                                                                                        
-                                                     
-            """,
-
-
-            "lasvegas": """
-    [bold cyan]  Las Vegas Grand Prix  [/]
-    [dim]Las Vegas | 6.201 km | 60 Laps[/]
-
-                                                          ?J!^                                      
-                                                          ?@5J5J7:                                  
-                                                           7G?^~7Y5J!:                              
-                                                            :?Y5J^.~?55J~                           
-                                                               .7#~   .!5P^                         
-                                                                :&7      J#^                        
-                                                              :7GJ        ?#^                       
-                                                          :~?55J:          ?#~                      
-                                                      :!J55J!:              7#~                     
-                                                  :!J55J~:                   7#~                    
-                 :!JYYYYY?^                   :!J55?~:                        !#!                   
-               .YP?~:. .:7PP:             :!J5Y?~.                             !#!                  
-              .G5.         YB:        ^7J5Y?~.                                  ~#7                 
-              !&:           JB^  .^7Y5Y?~.                                       ~#7                
-              :#J            7BJY5Y7^.                                            ~#?               
-               ^#?            :~^.                                                 ^#?              
-                ^#J                                                                 ^BJ             
-                 ^#J                                                                 5G             
-                  :BY                                                              .~BG.            
-                   ^&~                                                         :~?Y5J!:             
-                   ^&~                                                     :!J55J!:                 
-                  ^BY                                                 .^7Y5Y?~.                     
-                :YG!                                              .~?Y5Y7^.                         
-               ?G?.                                           :~?Y5J7^.                             
-             .5P:                                         :!J55J!:                                  
-             ?#                                      .^7J55?~:                                      
-             ~&~                                 .^7Y5Y7^.                                          
-              PP.:::.                        :~?Y5Y7^.                                              
-              ^5YJJYYYYYJJJ????77777!777??JYYYJ!:                                                   
-                     ..::^^^~~~~!!!!!!!!~~^:.                                                                 
-                                                     
-            """,
-
-
-
-            "suzuka": """
-    [bold cyan]  Japanese Grand Prix  [/]
-    [dim]Suzuka | 5.807 km | 53 Laps[/]
-
-       ^7YPPPPY7:                                                                                   
-      ?#@#GPPG&@B7                                                                                  
-     :B@&!    ^B@&!                     ~!!^                                                        
-      7#@#Y~   ~#@#7                  !G&&&#!                                                       
-       :JB@&G?^ ^5&@G?^              7&@BB&@7                                                       
-          !5#@&P?~!YB&&GJ!:        :Y&@GP&&Y             ^7?!~JPGGP5J!^                             
-            :75B&&B5JYPB&&#G5J???JP#@#J^#&B:           ~5#@&&&&B55PB&@&P!                           
-               :~?5B#&##BB#######BG57^ :B&#^        :7G&&G?75GY!^:  :7P@@P!                         
-                    ^~?YPB#&&#G5J!^     5@&7      ^JB@#G5PB&&##&&#GY~  !G@&5^                       
-                         :^!?YGB&&&#G5?~Y&@J  :^75#@B55#@#57~^^~7JG@&P:  7B@#J:                     
-                               :^!?YPB&&&&&B5PB&&#P7?B@&J:         5@@?   :J#@B7                    
-                                     :^~?#&&BG5J7^~P@@P^          ^B&&~     ^5&@G!                  
-                                         J&@######&@B7            G@&7        !G@&5^                
-                                          !JJ????77!:             P@&J^^^^:     ?B@#J:              
-                                                                  :5#&&&&&#P7    :J&@B7             
-                                                                    :~!777P@&J     ^5&@G!           
-                                                                          :B@&~      !G@&5^         
-                                                                           !#@#5YJ?~   ?B@#J:       
-                                                                            ^JPBB#@&P~  :Y&@B~      
-                                                                                 :!B@#?   !&@B:     
-                                                                                   ^P@@5: ~&@B:     
-                                                                                     J&@BP#@#!      
-                                                                                      ~JPGPJ^       
-                        
-            """,
-
-
-
-            "singapore": """
-    [bold cyan]  Singapore Grand Prix  [/]
-    [dim]Singapore | 4.927 km | 62 Laps[/]
-
-                                                                          :!7~:                     
-                                                                         !B&&@BYY?^                 
-                                                                        :B@P^75GB&#!                
-                                                                        ^&@Y     P@#:               
-                                                                         5@#~    7&@?               
-                                    ~!~^                                 :P@B~   :B@G               
-                                  !G&&##B57^                              :P@B^   Y@&~              
-                     !5GPJ~      !&@P^^!YG##GY!:                           :G@G:  ~&@J              
-                   :5@@PP&&P!   !#@5      ^75B&#P?~:                        7&@7   G@B:             
-                  ^P@#7  ^J#@BY5&@Y          :~JP#&#G5J77!!!!!!!!7777??????7P@&~   ?@&!             
-                 ~B@G^                           :~7YPGBBBBBBBBBBBBB####&&##B5!    ^#@Y             
-                7&@5:                                   ::::::::::::::::^^::        P@B:            
-               J&&?          ?#@G5B&&GJ~                                            !&&7            
-             :P@#!          7&@5:  ^?P&&BJ~:::              ::                       P@G            
-            ^B@B~          ^#@G:      ^75B#BBBBG?         ~PBBBGGPY?~                Y@&^           
-           :G@G^           J@&!           :~!7J@@7::::   ~#@P7?JY5G@&J             ~5&&J            
-           ~&@Y           :B@G                 5&&##BBBBB#@B^     :5&&BBBBBBBBBBBGG&&P~             
-           :P@&5~         ~&@J                  ~!??JJJJ?7!:        ^!7???????JJYYJ7^               
-             !5&&5:       7&&!                                                                      
-               ^#@P       J@#:                                                                      
-                P@&J^     P@G                                                                       
-                :?P&&P7: ^#@5                                                                       
-                   ^?G@#55@@7                                                                       
-                      !5B#B?     
-            """,
-        }
-        return tracks.get(track_name.lower().replace(" ", ""), None)
+        return TRACKS.get(track_name)
 
+    @command("map", usage="map <name>", summary="Show Track Layout (eg: map monza)")
     def cmd_map(self, track_name):
         """Displays track layout."""
         if not track_name:
             console.print("[yellow]Engineer:[/ yellow] Which track? Usage: map <name>")
             console.print("[dim]Available: [/]")
-            console.print(""" 
-                abudhabi
-                monza
-                silverstone
-                spa
-                monaco
-                mexico
-                imola
-                interlagos
-                sakhir
-                baku
-                buddh
-                barcelona
-                montreal
-                miami
-                qatar
-                lasvegas
-                suzuka
-                singapore
-            """)
-            return
+            try:
+                RENDER_CACHE.show("map", None, lambda: Text("\n".join(f"                {name}" for name in TRACKS.names())))
+            except (OSError, ValueError):
+                console.print("[bold red]NO DATA:[/] Track database (tracks.txt) is missing.")
+            return COMMAND_FAILED
 
-        # Get the art
-        art = self.get_track_ascii(track_name)
-        
-        if art:
+        def build():
+            # Get the art
+            art = self.get_track_ascii(track_name)
+            if not art:
+                return None
             # Display inside a panel
-            console.print(Panel(
+            return Panel(
                 Align.center(art),
                 title=f"[bold]{track_name.upper()}[/]",
                 border_style="green",
                 padding=(1, 2)
-            ))
-        else:
+            )
+
+        try:
+            shown = RENDER_CACHE.show("map", track_name, build)
+        except (OSError, ValueError):
+            console.print("[bold red]NO DATA:[/] Track database (tracks.txt) is missing.")
+            return COMMAND_FAILED
+
+        if not shown:
             console.print(f"[bold red]NO DATA:[/] Track '{track_name}' not in simulation database.")
+            return COMMAND_FAILED
 
 
     def get_prompt(self):
         """Standard prompt string (No HTML/PromptToolkit)."""
-        tyre_colors = {"SOFT": "red", "MEDIUM": "yellow", "HARD": "white", "INTER": "green"}
-        t_col = tyre_colors.get(self.tyre_compound, "white")
+        t_col = TYRE_COLORS.get(self.tyre_compound, "white")
+        running = len(self.garage.running())
+        garage = f"[black on magenta] {running} IN GARAGE [/]" if running else ""
         
-        return f"[bold white on black] L{self.lap_count} [/][black on {t_col}] {self.tyre_compound} [/] [bold cyan]{self.user}[/] :: [bold green]{self.current_dir}[/] > "
+        return f"[bold white on black] L{self.lap_count} [/][black on {t_col}] {self.tyre_compound} [/]{garage} [bold cyan]{self.user}[/] :: [bold green]{self.current_dir}[/] > "
 
+    @command("grid", "ls", "dir", usage="grid [dir]", summary="List files (Current or Specific)",
+             options="--all, --reverse, --sort size|mtime|name, --top N, --glob, --regex")
+    @fit_parts("rich.live:Live", "concurrent.futures:ThreadPoolExecutor,as_completed")
     def cmd_grid(self, target_path=None):
-        """Lists files. Can handle a specific target path."""
+        """Lists files. Can handle a specific target path.
+
+        Streams the directory with os.scandir: only the visible page is
+        stat'ed and rendered, the rest is just counted. `grid --all` keeps
+        going page by page instead of stopping at the first 20 cars.
+        Directory sizes are filled in by DIR_SIZES as they arrive.
+
+        --glob/--regex filter names while streaming, --sort size|mtime|name
+        keeps only the top N (--top, default one page) on a bounded heap.
+        """
+        flags, target_path = parse_flags(target_path, switches=("--all", "--reverse"),
+                                         options=("--sort", "--top", "--glob", "--regex"))
+
+        sort = (flags["--sort"] or "").lower() or None
+        if sort and sort not in GRID_SORTS:
+            console.print(f"[yellow]Engineer:[/ yellow] Sort by {', '.join(GRID_SORTS)}. Usage: grid --sort size [dir]")
+            return COMMAND_FAILED
+        try:
+            top = int(flags["--top"]) if flags["--top"] else GRID_PAGE_SIZE
+            match = name_filter(*(flags[f] and flags[f].strip('"').strip("'") for f in ("--glob", "--regex")))
+        except ValueError:
+            console.print(f"[yellow]Engineer:[/ yellow] --top needs a number of cars, got '{flags['--top']}'.")
+            return COMMAND_FAILED
+        except re.error as e:
+            console.print(f"[bold red]BAD REGEX:[/] {e}")
+            return COMMAND_FAILED
+
         # Determine which folder to look at
         search_dir = self.current_dir
         
@@ -870,46 +3058,202 @@ B##!                                     J&#5             ^G##GG#&#P!     !P&&P!
             search_dir = os.path.join(self.current_dir, clean_target)
 
         try:
-            files = os.listdir(search_dir)
+            entries = os.scandir(search_dir)
         except FileNotFoundError:
             console.print(f"[bold red]SECTOR ERROR:[/] '{target_path}' not found on track map.")
-            return
+            return COMMAND_FAILED
+        except NotADirectoryError:
+            console.print(f"[bold red]SECTOR ERROR:[/] '{target_path}' is not a sector (directory).")
+            return COMMAND_FAILED
         except PermissionError:
             console.print("[bold red]RED FLAG:[/] Access Denied.")
-            return
+            return COMMAND_FAILED
 
         display_name = os.path.basename(search_dir) or search_dir
-        table = Table(title=f"TRACK LIMITS ({display_name})", show_header=True, header_style="bold magenta")
-        table.add_column("Pos", style="dim", width=4)
-        table.add_column("Driver (File)", min_width=25)
-        table.add_column("Type", justify="right")
-        table.add_column("Load (Size)", justify="right")
-
-        for idx, file in enumerate(files):
-            if idx > 19:
-                table.add_row("...", f"+ {len(files) - 20} more", "", "")
-                break
-            
-            full_path = os.path.join(search_dir, file)
+        if sort:
+            display_name += f", by {sort}"
+        show_mtime = sort == "mtime"
+
+        def new_table(first_page):
+            table = Table(title=f"TRACK LIMITS ({display_name})" if first_page else None,
+                          show_header=first_page, header_style="bold magenta")
+            table.add_column("Pos", style="dim", width=4 if not flags["--all"] else None, min_width=4)
+            table.add_column("Driver (File)", min_width=25)
+            table.add_column("Type", justify="right")
+            table.add_column("Load (Size)", justify="right")
+            if show_mtime:
+                table.add_column("Last Lap (Modified)", justify="right", style="dim")
+            return table
+
+        page_size = GRID_PAGE_SIZE
+        if flags["--all"] and not sort:
+            page_size = max(GRID_PAGE_SIZE, console.height - 6)
+
+        rows = []
+        first_page = True
+        more = 0
+        with entries:
+            stream = entries if match is None else (e for e in entries if match(e.name))
+
+            if sort:
+                ranked, more = self.grid_ranked(stream, sort, top, flags["--reverse"])
+                for idx, entry in enumerate(ranked):
+                    row = self.grid_row(idx, entry, show_mtime)
+                    if row is not None:
+                        rows.append(row)
+            else:
+                for idx, entry in enumerate(stream):
+                    if not flags["--all"] and idx >= top:
+                        more += 1  # Just count the backmarkers, don't keep them
+                        continue
+
+                    row = self.grid_row(idx, entry)
+                    if row is None:
+                        continue
+                    rows.append(row)
+
+                    if flags["--all"] and len(rows) >= page_size:
+                        self.show_grid_page(functools.partial(new_table, first_page), rows)
+                        if not self.next_page():
+                            return
+                        rows = []
+                        first_page = False
+
+        if more:
+            rows.append([["...", f"+ {more} more", "", ""] + [""] * show_mtime, None, None])
+        if rows or first_page:
+            self.show_grid_page(functools.partial(new_table, first_page), rows)
+
+    def grid_ranked(self, stream, sort, top, reverse=False):
+        """Top `top` entries of the stream by size/mtime (biggest/newest first)
+        or name (A-Z). Runs on a bounded heap, so only `top` DirEntries are
+        ever held. Returns (ranked entries, how many more there were).
+
+        By size, directories count with their recursive total from
+        DIR_SIZES (the number the table shows), measured in parallel while
+        the files stream past. At most 2 scans per DIR_SIZES worker are in
+        flight; each goes into the heap as it finishes and is let go."""
+        seen = 0
+        stop = threading.Event()
+        done = deque()  # (seen, DirEntry, Future) of finished directory scans
+        finished = threading.Semaphore(0)
+        in_flight = 0
+
+        def landed(future, order, entry):  # On the DIR_SIZES thread
+            done.append((order, entry, future))
+            finished.release()
+
+        def measured():
+            nonlocal in_flight
+            finished.acquire()
+            order, entry, future = done.popleft()
+            in_flight -= 1
+            size = future.result()
+            return (-1 if size is None else size), order, entry
+
+        def keyed():
+            nonlocal seen, in_flight
+            for entry in stream:
+                seen += 1
+                try:
+                    if sort == "size":
+                        if entry.is_dir():
+                            if in_flight >= 2 * DIR_SIZES.workers:
+                                yield measured()
+                            future = DIR_SIZES.submit(entry.path, stop)
+                            in_flight += 1
+                            future.add_done_callback(functools.partial(landed, order=seen, entry=entry))
+                            continue
+                        key = entry.stat().st_size
+                    elif sort == "mtime":
+                        key = entry.stat().st_mtime
+                    else:
+                        key = entry.name.lower()
+                except OSError:
+                    continue
+                yield key, seen, entry
+            while in_flight:
+                yield measured()
+
+        largest_first = sort != "name"
+        if reverse:
+            largest_first = not largest_first
+        pick = heapq.nlargest if largest_first else heapq.nsmallest
+        try:
+            ranked = [entry for _, _, entry in pick(top, keyed())]
+        except KeyboardInterrupt:
+            stop.set()
+            raise
+        return ranked, max(0, seen - len(ranked))
+
+    def grid_row(self, idx, entry, show_mtime=False):
+        """One grid row from a DirEntry (reuses its cached type/stat data).
+
+        Rows are [cells, style, dir path]. Directories get their size cell
+        filled in later by show_grid_page."""
+        try:
+            extra = []
+            if show_mtime:
+                extra = [datetime.fromtimestamp(entry.stat().st_mtime).strftime("%d %b %Y %H:%M")]
+            if entry.is_dir():
+                return [[str(idx + 1), entry.name, "DIR", "[dim]measuring…[/]"] + extra, "bold blue", entry.path]
+            size = entry.stat().st_size
+        except OSError:
+            return None
+        return [[str(idx + 1), entry.name, "FILE", format_size(size)] + extra, "white", None]
+
+    def show_grid_page(self, new_table, rows):
+        """Prints a page of grid rows, measuring its directories in the background."""
+        def fill():
+            table = new_table()
+            for cells, style, _ in rows:
+                table.add_row(*cells, style=style)
+            return table
+
+        stop = threading.Event()
+        pending = {DIR_SIZES.submit(row[2], stop): row for row in rows if row[2]}
+        if not pending:
+            console.print(fill())
+            return
+
+        if not console.is_terminal:
+            # Nobody to animate for (piped/batch) - just wait for the results
+            for future in as_completed(pending):
+                size = future.result()
+                pending[future][0][3] = format_size(size) if size is not None else "[dim]?[/]"
+            console.print(fill())
+            DIR_SIZES.save()
+            return
+
+        with Live(fill(), console=console, refresh_per_second=10) as live:
             try:
-                size = os.path.getsize(full_path)
-                ftype = "DIR" if os.path.isdir(full_path) else "FILE"
-                style = "bold blue" if ftype == "DIR" else "white"
-                
-                if size > 1024*1024: size_str = f"{round(size/(1024*1024), 1)} MB"
-                elif size > 1024: size_str = f"{round(size/1024, 1)} KB"
-                else: size_str = f"{size} B"
+                for future in as_completed(pending):
+                    size = future.result()
+                    pending[future][0][3] = format_size(size) if size is not None else "[dim]?[/]"
+                    live.update(fill())
+            except KeyboardInterrupt:
+                # Stop waiting, whatever was measured so far is still cached
+                stop.set()
+                for cells, _, _ in pending.values():
+                    if cells[3].startswith("[dim]measuring"):
+                        cells[3] = "[dim]?[/]"
+                live.update(fill())
+        DIR_SIZES.save()
 
-                table.add_row(str(idx + 1), file, ftype, size_str, style=style)
-            except: continue
-        console.print(table)
+    def next_page(self):
+        """Pauses between --all pages on a terminal. Returns False to stop."""
+        if not (console.is_terminal and sys.stdin.isatty()):
+            return True
+        answer = console.input("[dim]-- MORE (Enter: next page, q: box box) --[/] ")
+        return answer.strip().lower() not in ("q", "quit")
 
+    @command("quote", summary="Iconic Radio Messages in F1")
     def cmd_quote(self):
         """Plays a random famous team radio message."""
         if not hasattr(self, 'quotes'):
              # Fallback if init wasn't updated yet
              console.print("[red]No quotes database found. Please update __init__[/]")
-             return
+             return COMMAND_FAILED
 
         driver, team, quote = random.choice(self.quotes)
         
@@ -943,251 +3287,845 @@ B##!                                     J&#5             ^G##GG#&#P!     !P&&P!
             width=60
         ))
 
-    def cmd_drs(self):
+    @command("drs", usage="drs", summary="Network Speed Test",
+             options="--threads N, --duration SECONDS, --server URL (a speedtest-style server), "
+                     "--target HOST[:PORT] (another box running drs --serve [HOST:PORT])")
+    @fit_parts("rich.progress:Progress,SpinnerColumn,BarColumn,TextColumn")
+    def cmd_drs(self, arg_string=None):
         """Runs a network speed test (DRS Speed Trap)."""
+        flags, rest = parse_flags(arg_string, switches=("--serve",),
+                                  options=("--threads", "--duration", "--server", "--target"))
+        try:
+            threads = int(flags["--threads"]) if flags["--threads"] else DRS_THREADS
+            duration = float(flags["--duration"]) if flags["--duration"] else DRS_DURATION
+            if threads < 1 or duration <= 0:
+                raise ValueError
+            if flags["--serve"]:
+                serve_host, serve_port = parse_address(rest or "", "0.0.0.0", DRS_PORT)
+            if flags["--target"]:
+                target_host, target_port = parse_address(flags["--target"], default_port=DRS_PORT)
+        except ValueError:
+            console.print("[yellow]Engineer:[/ yellow] Usage: drs [--threads N] [--duration SECONDS] "
+                          "[--server URL | --target HOST[:PORT]]  |  drs --serve [HOST:PORT]")
+            return COMMAND_FAILED
+
+        if flags["--serve"]:
+            try:
+                serve_drs(serve_host, serve_port)
+            except OSError as e:
+                console.print(f"[bold red]DRS FAILURE:[/] Can't open the DRS zone: {e}")
+                return COMMAND_FAILED
+            return
         
         console.print("\n[bold cyan]INITIATING DRS PERFORMANCE TEST...[/]")
         
-        st = None
         try:
             # Phase 1: Finding Server (Reaction Time)
             with console.status("[bold yellow]CALIBRATING SENSORS (Finding Server)...[/]", spinner="dots"):
-                st = speedtest.Speedtest()
-                st.get_best_server()
-                ping = st.results.ping
+                if flags["--target"]:
+                    trap = LanTrap(target_host, target_port, threads=threads, duration=duration)
+                    ping = trap.latency()
+                elif flags["--server"]:
+                    trap = SpeedTrap(flags["--server"], threads=threads, duration=duration)
+                    ping = trap.latency()
+                else:
+                    load_part("speedtest")
+                    st = speedtest.Speedtest()
+                    best = st.get_best_server()
+                    ping = st.results.ping
+                    trap = SpeedTrap.from_server_url(best["url"], threads=threads, duration=duration)
             
-            console.print(f"[green]✓ REACTION TIME (Ping):[/] {ping:.1f} ms")
+            console.print(f"[green]✓ REACTION TIME (Ping):[/] {format_ms(ping)}")
 
             # Phase 2: Top Speed Run (Download) & ERS (Upload)
-            # We use a progress bar to simulate the test running
+            # The bar tracks the timed run; the readout is the live rate from the engine.
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[bold blue]{task.description}"),
                 BarColumn(bar_width=40, style="red", complete_style="green"),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TextColumn("[bold yellow]{task.fields[mbps]:>8.2f} Mbps"),
                 console=console
             ) as progress:
+                tasks = {
+                    "download": progress.add_task("MEASURING DOWNFORCE (Download)...", total=duration, mbps=0.0),
+                    "upload": progress.add_task("MEASURING THRUST (Upload)...", total=duration, mbps=0.0, start=False),
+                }
+
+                def on_progress(phase, transferred, elapsed):
+                    progress.update(tasks[phase], completed=elapsed,
+                                    mbps=transferred * 8 / max(elapsed, 1e-6) / 1_000_000)
+
+                download_speed = trap.download(on_progress) / 1_000_000  # Convert to Mbps
+                progress.update(tasks["download"], completed=duration, mbps=download_speed)
                 
-                # Download Test
-                task1 = progress.add_task("MEASURING DOWNFORCE (Download)...", total=100)
-                
-                # We can't get real-time progress from the simple speedtest API easily, 
-                # so we run it, but animate a 'fake' progress for the visual feel 
-                # or just hold the spinner. For a TUI, a spinner is safer if we can't callback.
-                # However, to keep it simple and blocking:
-                
-                download_speed = st.download() / 1_000_000  # Convert to Mbps
-                progress.update(task1, completed=100)
-                
-                # Upload Test
-                task2 = progress.add_task("MEASURING THRUST (Upload)...", total=100)
-                upload_speed = st.upload() / 1_000_000  # Convert to Mbps
-                progress.update(task2, completed=100)
+                progress.start_task(tasks["upload"])
+                upload_speed = trap.upload(on_progress) / 1_000_000  # Convert to Mbps
+                progress.update(tasks["upload"], completed=duration, mbps=upload_speed)
 
             # Phase 3: The Telemetry Board
+            extra_rows = ()
+            if isinstance(trap, LanTrap):
+                low, median, p95, high = trap.latency_percentiles()
+                extra_rows = (
+                    ("LATENCY p50 / p95", f"{format_ms(median)} / {format_ms(p95)}"),
+                    ("LATENCY min / max", f"{format_ms(low)} / {format_ms(high)}"),
+                    ("JITTER", format_ms(trap.jitter())),
+                    ("STREAMS", f"{threads} x {duration:g}s"),
+                )
             console.print("\n")
-            grid = Table.grid(expand=True, padding=(0, 2))
-            grid.add_column(style="bold white", justify="right")
-            grid.add_column(style="bold yellow")
-            
-            # Visualizing the speed as a 'Gear' or 'Speed'
-            # < 50 Mbps = F2 Engine, > 500 Mbps = Rocket Ship
-            engine_rating = "TRACTOR"
-            if download_speed > 50: engine_rating = "V6 HYBRID"
-            if download_speed > 200: engine_rating = "MERCEDES W11"
-            if download_speed > 800: engine_rating = "JET ENGINE"
-
-            grid.add_row("DOWNFORCE (Download)", f"{download_speed:.2f} Mbps")
-            grid.add_row("THRUST (Upload)", f"{upload_speed:.2f} Mbps")
-            grid.add_row("REACTION TIME (Ping)", f"{ping:.1f} ms")
-            grid.add_row("POWER UNIT RATING", f"[italic red]{engine_rating}[/]")
-            
-            console.print(Panel(
-                grid,
-                title="[bold white]AERODYNAMICS REPORT[/]",
-                border_style="magenta",
-                width=50
-            ))
+            console.print(self.aero_report(download_speed, upload_speed, ping, extra_rows))
 
+        except ImportError:
+            console.print("[bold red]DRS FAILURE:[/] Finding a server needs speedtest-cli "
+                          "([green]pip install speedtest-cli[/]) - or use [green]drs --server URL[/].")
+            return COMMAND_FAILED
         except Exception as e:
             console.print(f"[bold red]DRS FAILURE:[/] Could not connect to telemetry server.\n[dim]{e}[/]")
+            return COMMAND_FAILED
 
-    def cmd_news(self):
-        """Fetches latest F1 headlines via RSS."""
-        rss_url = "https://news.google.com/rss/search?q=Formula+1+racing&hl=en-US&gl=US&ceid=US:en"
+    def aero_report(self, download_speed, upload_speed, ping, extra_rows=()):
+        """The AERODYNAMICS REPORT panel (speeds in Mbps, ping in ms)."""
+        grid = Table.grid(expand=True, padding=(0, 2))
+        grid.add_column(style="bold white", justify="right")
+        grid.add_column(style="bold yellow")
         
-        # Show a loading spinner (Pit Crew working)
-        with console.status("[bold yellow]ESTABLISHING UPLINK TO PADDOCK...[/]", spinner="dots"):
-            try:
-                feed = feedparser.parse(rss_url)
-                
-                if not feed.entries:
-                    console.print("[bold red]CONNECTION LOST:[/] No news data received.")
-                    return
+        # Visualizing the speed as a 'Gear' or 'Speed'
+        # < 50 Mbps = F2 Engine, > 500 Mbps = Rocket Ship
+        engine_rating = "TRACTOR"
+        if download_speed > 50: engine_rating = "V6 HYBRID"
+        if download_speed > 200: engine_rating = "MERCEDES W11"
+        if download_speed > 800: engine_rating = "JET ENGINE"
+
+        grid.add_row("DOWNFORCE (Download)", f"{download_speed:.2f} Mbps")
+        grid.add_row("THRUST (Upload)", f"{upload_speed:.2f} Mbps")
+        grid.add_row("REACTION TIME (Ping)", format_ms(ping))
+        for label, value in extra_rows:
+            grid.add_row(label, value)
+        grid.add_row("POWER UNIT RATING", f"[italic red]{engine_rating}[/]")
+        
+        return Panel(
+            grid,
+            title="[bold white]AERODYNAMICS REPORT[/]",
+            border_style="magenta",
+            width=50
+        )
 
-                # Create the News Table
-                table = Table(title="PADDOCK RUMORS & HEADLINES", border_style="bold red")
-                table.add_column("Time", style="dim", width=12)
-                table.add_column("Headline", style="bold white")
-                table.add_column("Source", style="cyan")
+    @command("news", summary="Latest Paddock Headlines")
+    @fit_parts("rich.live:Live", "concurrent.futures:ThreadPoolExecutor,as_completed")
+    def cmd_news(self):
+        """Fetches latest F1 headlines from every configured feed at once.
 
-                # Limit to top 10 stories to fit the terminal
-                for entry in feed.entries[:10]:
-                    # Clean up the date (published format usually usually lengthy)
-                    try:
-                        # Extract simple time if possible, or just ignore format
-                        pub_date = entry.published_parsed
-                        time_str = f"{pub_date.tm_mon}/{pub_date.tm_mday} {pub_date.tm_hour:02d}:{pub_date.tm_min:02d}"
-                    except:
-                        time_str = "LIVE"
+        Feeds come back through NewsCache on a thread pool; the table is
+        drawn as soon as the first one lands and merged again as the rest
+        arrive, so one slow paddock doesn't hold up the others.
+        """
+        feeds = news_feeds()
+        results = {}   # url -> (record, state)
+        failures = {}  # url -> error
+
+        def build():
+            # Create the News Table
+            table = Table(title="PADDOCK RUMORS & HEADLINES", border_style="bold red")
+            table.add_column("Time", style="dim", width=12)
+            table.add_column("Headline", style="bold white")
+            table.add_column("Source", style="cyan")
+
+            # Limit to top 10 stories to fit the terminal
+            entry_lists = [record["entries"] for record, _ in results.values()]
+            for entry in merge_headlines(entry_lists, limit=10):
+                if entry["published"] is not None:
+                    pub_date = time.gmtime(entry["published"])
+                    time_str = f"{pub_date.tm_mon}/{pub_date.tm_mday} {pub_date.tm_hour:02d}:{pub_date.tm_min:02d}"
+                else:
+                    time_str = "LIVE"
 
-                    # The source is usually in the title or source tag
-                    title = entry.title
-                    source = entry.source.get('title', 'Unknown')
+                # Make title clickable in supported terminals
+                headline_link = f"[link={entry['link']}]{escape(entry['title'])}[/link]"
 
-                    # Make title clickable in supported terminals
-                    headline_link = f"[link={entry.link}]{title}[/link]"
-                    
-                    table.add_row(time_str, headline_link, source)
+                table.add_row(time_str, headline_link, entry["source"])
 
-                console.print(table)
-                console.print("[dim italic]Tip: Click headlines to open in browser (if terminal supports it)[/]")
+            pending = len(feeds) - len(results) - len(failures)
+            if pending:
+                table.caption = f"[dim]{pending} feed(s) still on the out lap...[/]"
+            return table
 
+        def land(future):
+            url = futures[future]
+            try:
+                results[url] = future.result()
             except Exception as e:
-                console.print(f"[bold red]COMMUNICATION FAILURE:[/] {e}")
-
-    def cmd_champions(self):
-        """Hall of Fame."""
-        champs = [
-            ("2025", "Lando Norris", "McLaren"),
-            ("2024", "Max Verstappen", "Red Bull"),
-            ("2023", "Max Verstappen", "Red Bull"),
-            ("2022", "Max Verstappen", "Red Bull"),
-            ("2021", "Max Verstappen", "Red Bull"),
-            ("2020", "Lewis Hamilton", "Mercedes"),
-            ("2019", "Lewis Hamilton", "Mercedes"),
-            ("2018", "Lewis Hamilton", "Mercedes"),
-            ("2017", "Lewis Hamilton", "Mercedes"),
-            ("2016", "Nico Rosberg", "Mercedes"),
-            ("2015", "Lewis Hamilton", "Mercedes"),
-            ("2014", "Lewis Hamilton", "Mercedes"),
-            ("2013", "Sebastian Vettel", "Red Bull"),
-            ("2012", "Sebastian Vettel", "Red Bull"),
-            ("2011", "Sebastian Vettel", "Red Bull"),
-            ("2010", "Sebastian Vettel", "Red Bull"),
-            ("2009", "Jenson Button", "Brawn"),
-            ("2008", "Lewis Hamilton", "McLaren"),
-            ("2007", "Kimi Raikkonen", "Ferrari"),
-            ("2006", "Fernando Alonso", "Renault"),
-            ("2005", "Fernando Alonso", "Renault"),
-            ("2004", "Michael Schumacher", "Ferrari"),
-            ("2003", "Michael Schumacher", "Ferrari"),
-            ("2002", "Michael Schumacher", "Ferrari"),
-            ("2001", "Michael Schumacher", "Ferrari"),
-            ("2000", "Michael Schumacher", "Ferrari"),
-            ("1999", "Mika Hakkinen", "McLaren"),
-            ("1998", "Mika Hakkinen", "McLaren"),
-            ("1997", "Jacques Villeneuve", "Williams"),
-            ("1996", "Damon Hill", "Williams"),
-            ("1995", "Michael Schumacher", "Benetton"),
-            ("1994", "Michael Schumacher", "Benetton"),
-            ("1993", "Alain Prost", "Williams"),
-            ("1992", "Nigel Mansell", "Williams"),
-            ("1991", "Ayrton Senna", "McLaren"),
-            ("1990", "Ayrton Senna", "McLaren"),
-            ("1989", "Alain Prost", "McLaren"),
-            ("1988", "Ayrton Senna", "McLaren"),
-            ("1987", "Nelson Piquet", "Williams"),
-            ("1986", "Alain Prost", "McLaren"),
-            ("1985", "Alain Prost", "McLaren"),
-            ("1984", "Niki Lauda", "McLaren"),
-            ("1983", "Nelson Piquet", "Brabham"),
-            ("1982", "Keke Rosberg", "Williams"),
-            ("1981", "Nelson Piquet", "Brabham"),
-            ("1980", "Alan Jones", "Williams"),
-            ("1979", "Jody Scheckter", "Ferrari"),
-            ("1978", "Mario Andretti", "Lotus"),
-            ("1977", "Niki Lauda", "Ferrari"),
-            ("1976", "James Hunt", "McLaren"),
-            ("1975", "Niki Lauda", "Ferrari"),
-            ("1974", "Emerson Fittipaldi", "McLaren"),
-            ("1973", "Jackie Stewart", "Tyrrell"),
-            ("1972", "Emerson Fittipaldi", "Lotus"),
-            ("1971", "Jackie Stewart", "Tyrrell"),
-            ("1970", "Jochen Rindt", "Lotus"),
-            ("1969", "Jackie Stewart", "Matra"),
-            ("1968", "Graham Hill", "Lotus"),
-            ("1967", "Denny Hulme", "Brabham"),
-            ("1966", "Jack Brabham", "Brabham"),
-            ("1965", "Jim Clark", "Lotus"),
-            ("1964", "John Surtees", "Ferrari"),
-            ("1963", "Jim Clark", "Lotus"),
-            ("1962", "Graham Hill", "BRM"),
-            ("1961", "Phil Hill", "Ferrari"),
-            ("1960", "Jack Brabham", "Cooper"),
-            ("1959", "Jack Brabham", "Cooper"),
-            ("1958", "Mike Hawthorn", "Ferrari"),
-            ("1957", "Juan Manuel Fangio", "Maserati"),
-            ("1956", "Juan Manuel Fangio", "Ferrari"),
-            ("1955", "Juan Manuel Fangio", "Mercedes"),
-            ("1954", "Juan Manuel Fangio", "Mercedes"),
-            ("1953", "Alberto Ascari", "Ferrari"),
-            ("1952", "Alberto Ascari", "Ferrari"),
-            ("1951", "Juan Manuel Fangio", "Alfa Romeo"),
-            ("1950", "Giuseppe Farina", "Alfa Romeo"),
-        ]
-        
+                failures[url] = e
+
+        pool = ThreadPoolExecutor(max_workers=len(feeds), thread_name_prefix="news")
+        futures = {pool.submit(NEWS.get, url, self.interactive): url for url in feeds}
+        try:
+            if console.is_terminal:
+                # Show a loading spinner (Pit Crew working) until the fastest feed is in
+                with console.status("[bold yellow]ESTABLISHING UPLINK TO PADDOCK...[/]", spinner="dots"):
+                    remaining = as_completed(futures)
+                    land(next(remaining))
+                with Live(build(), console=console, refresh_per_second=10) as live:
+                    for future in remaining:
+                        land(future)
+                        live.update(build())
+            else:
+                for future in as_completed(futures):
+                    land(future)
+                console.print(build())
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if not results:
+            error = next(iter(failures.values()), "no feeds configured")
+            console.print(f"[bold red]COMMUNICATION FAILURE:[/] {error}")
+            return COMMAND_FAILED
+
+        stale = [url for url, (_, state) in results.items() if state in ("stale", "cached")]
+        if stale:
+            oldest = min(results[url][0]["fetched"] for url in stale)
+            refreshing = any(results[url][1] == "stale" for url in stale)
+            console.print(f"[dim]Some headlines are {int((time.time() - oldest) // 60)} min old"
+                          f"{' - fresh ones are on their way in the background' if refreshing else ''}.[/]")
+        offline = failures.keys() | {url for url in stale if url in NEWS.errors}
+        for url in sorted(offline):
+            error = failures.get(url) or NEWS.errors.get(url)
+            console.print(f"[dim]OFFLINE: {url} ({error})[/]")
+        console.print("[dim italic]Tip: Click headlines to open in browser (if terminal supports it)[/]")
+
+    @command("champions", usage="champions", summary="Hall of Fame",
+             options="--driver NAME, --team NAME, --since YEAR, --decade YEAR, --titles")
+    def cmd_champions(self, arg_string=None):
+        """Hall of Fame. Filters narrow it down; --titles ranks drivers and teams."""
+        key = " ".join(arg_string.split()).lower() if arg_string else None
+        if not RENDER_CACHE.show("champions", key, lambda: self.build_champions_view(arg_string)):
+            return COMMAND_FAILED  # build_champions_view said why
+
+    def build_champions_view(self, arg_string=None):
+        flags, _ = parse_flags(arg_string, switches=("--titles",),
+                               options=("--driver", "--team", "--since", "--decade"))
+        try:
+            since = int(flags["--since"]) if flags["--since"] else None
+            decade = int(flags["--decade"].rstrip("s")) if flags["--decade"] else None
+        except ValueError:
+            console.print("[yellow]Engineer:[/ yellow] Usage: champions [--driver NAME] [--team NAME] "
+                          "[--since YEAR] [--decade YEAR] [--titles]")
+            return None
+
+        db = champions_db()
+        filtered = any((flags["--driver"], flags["--team"], since, decade is not None))
+        rows = db.query(flags["--driver"], flags["--team"], since, decade)
+        if not rows:
+            console.print("[bold red]NO RESULT:[/] No champion matches that.")
+            return None
+
+        if flags["--titles"]:
+            return self.build_titles_table(db, None if not filtered else rows)
+
+        views = [self.build_champions_table(db, rows)]
+        if flags["--driver"] or flags["--team"]:
+            index = "driver" if flags["--driver"] else "constructor"
+            for name, seasons in db.titles(index, rows):
+                streak, first, last = longest_streak(seasons)
+                plural = "s" if len(seasons) > 1 else ""
+                line = f"[bold white]{escape(name)}:[/] [gold1]{len(seasons)} title{plural}[/] ({season_ranges(seasons)})"
+                if streak > 1:
+                    line += f" [dim]- longest streak {streak}, {first}-{last}[/]"
+                views.append(line)
+        return Group(*views)
+
+    def build_champions_table(self, db=None, rows=None):
+        db = db or champions_db()
+        rows = range(len(db)) if rows is None else rows
         table = Table(title="HALL OF FAME (World Drivers' Champions)", border_style="gold1")
         table.add_column("Season", style="bold white", justify="center")
         table.add_column("Driver", style="bold cyan")
         table.add_column("Constructor", style="italic white")
-        
-        for year, driver, team in champs:
-            d_style = "bold cyan"
-            if driver in ["Michael Schumacher"]: d_style = "bold magenta"
-            elif driver in ["Lewis Hamilton"]: d_style = "bold red"
-            elif driver in ["Juan Manuel Fangio"]: d_style = "bold green"
-            elif driver in ["Max Verstappen", "Sebastian Vettel", "Ayrton Senna", "Niki Lauda"]: d_style = "bold yellow"  
-            table.add_row(year, f"[{d_style}]{driver}[/]", team)
 
-        console.print(table)
+        seasons = db.table.columns["season"]
+        drivers = db.table.columns["driver"]
+        driver_names = db.table.pools["driver"]
+        for row_id in reversed(rows):  # Newest first
+            code = drivers[row_id]
+            table.add_row(str(seasons[row_id]), f"[{db.styles[code]}]{driver_names[code]}[/]",
+                          db.table.value("constructor", row_id))
 
+        return table
 
-    def cmd_telemetry(self):
-        cpu_usage = psutil.cpu_percent(interval=0.1)
-        ram = psutil.virtual_memory()
-        
-        battery = psutil.sensors_battery()
-        fuel_level = battery.percent if battery else 100
-        charging = "⚡" if battery and battery.power_plugged else ""
-        
-        temp_str = "NO SENSOR"
-        if hasattr(psutil, "sensors_temperatures"):
+    def build_titles_table(self, db, rows=None):
+        """Title counts and best streaks for drivers and constructors side by side."""
+        def ranking(index, title):
+            table = Table(title=title, border_style="gold1", header_style="bold magenta")
+            table.add_column("Pos", justify="right", style="dim")
+            table.add_column("Name", style="bold white")
+            table.add_column("Titles", justify="right", style="gold1")
+            table.add_column("Best Streak", justify="right")
+            for pos, (name, seasons) in enumerate(db.titles(index, rows), 1):
+                streak, first, last = longest_streak(seasons)
+                table.add_row(str(pos), escape(name), str(len(seasons)),
+                              f"{streak} ({first}-{last})" if streak > 1 else "1")
+            return table
+        return Columns([ranking("driver", "DRIVERS"), ranking("constructor", "CONSTRUCTORS")])
+
+    @command("results", usage="results <season> [round|race]", summary="Race Archive",
+             options="--driver NAME, --import DIR|FILE")
+    def cmd_results(self, arg_string=None):
+        """Historical results from an imported Ergast dump."""
+        flags, rest = parse_flags(arg_string, options=("--driver", "--import"))
+        archive = results_archive()
+        if flags["--import"]:
+            source = os.path.expanduser(flags["--import"])
+            started = time.perf_counter()
             try:
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    first_key = next(iter(temps))
-                    t = temps[first_key][0].current
-                    temp_str = f"{t}°C"
-            except: pass
+                with console.status(f"[bold yellow]LOADING ARCHIVE FROM {escape(source)}...[/]", spinner="dots"):
+                    counts = archive.import_dump(source)
+            except (OSError, KeyError, ValueError) as e:
+                console.print(f"[bold red]SECTOR ERROR:[/] Could not import {escape(source)}: {escape(str(e))}")
+                return COMMAND_FAILED
+            tally = ", ".join(f"{rows:,} {name}" for name, rows in counts.items())
+            console.print(f"[green]Archive loaded:[/] {tally} in {time.perf_counter() - started:.1f}s")
+            return
+
+        if not archive.ready:
+            console.print("[yellow]Engineer:[/ yellow] No archive yet. Import an Ergast dump once with "
+                          "results --import <dir|file.json>")
+            return COMMAND_FAILED
+
+        season, _, race = (rest or "").partition(" ")
+        if season and not season.isdigit():
+            console.print("[yellow]Engineer:[/ yellow] Usage: results <season> \\[round|race] | results --driver NAME \\[season]")
+            return COMMAND_FAILED
+        season = int(season) if season else None
+
+        if flags["--driver"]:
+            return self.show_driver_results(archive, flags["--driver"], season)
+        elif season is None:
+            first, last = archive.seasons()
+            counts = ", ".join(f"{len(t):,} {name}" for name, t in archive.tables.items())
+            console.print(f"[bold white]Archive:[/] {first}-{last}, {counts} [dim]({escape(archive.manifest['source'])})[/]")
+        elif not race.strip():
+            return self.show_season_results(archive, season)
+        else:
+            round_number = archive.find_round(season, race.strip())
+            rows = archive.race("results", season, round_number) if round_number else range(0)
+            if not rows:
+                console.print(f"[bold red]NO RESULT:[/] No race '{escape(race.strip())}' in {season}.")
+                return COMMAND_FAILED
+            self.show_race_results(archive, rows)
+
+    def show_season_results(self, archive, season):
+        t = archive.tables["results"]
+        rows = archive.race("results", season)
+        if not rows:
+            console.print(f"[bold red]NO RESULT:[/] {season} is not in the archive.")
+            return COMMAND_FAILED
+        table = Table(title=f"{season} SEASON", border_style="red")
+        table.add_column("Rd", justify="right", style="dim")
+        table.add_column("Grand Prix", style="bold white")
+        table.add_column("Winner", style="bold cyan")
+        table.add_column("Constructor", style="italic white")
+        table.add_column("Time", justify="right")
+        positions = t.columns["position"]
+        for row_id in rows:
+            if positions[row_id] == 1:
+                millis = t.columns["millis"][row_id]
+                table.add_row(str(t.columns["round"][row_id]), t.value("race", row_id), t.value("driver", row_id),
+                              t.value("constructor", row_id), race_time(millis) if millis >= 0 else "-")
+        console.print(table)
+
+    def show_race_results(self, archive, rows):
+        t = archive.tables["results"]
+        first = rows[0]
+        table = Table(title=f"{t.columns['season'][first]} {t.value('race', first).upper()}", border_style="red")
+        table.add_column("Pos", justify="right", style="bold white")
+        table.add_column("Driver", style="bold cyan")
+        table.add_column("Constructor", style="italic white")
+        table.add_column("Grid", justify="right", style="dim")
+        table.add_column("Laps", justify="right")
+        table.add_column("Time / Status", justify="right")
+        table.add_column("Pts", justify="right", style="gold1")
+        c = t.columns
+        leader = c["millis"][first]
+        for row_id in rows:
+            millis = c["millis"][row_id]
+            if millis < 0:
+                finish = t.value("status", row_id)
+            elif row_id == first or leader < 0:
+                finish = race_time(millis)
+            else:
+                finish = f"+{(millis - leader) / 1000:.3f}s"
+            table.add_row(str(c["position"][row_id] or "NC"), t.value("driver", row_id), t.value("constructor", row_id),
+                          str(c["grid"][row_id] or "PL"), str(c["laps"][row_id]), finish, f"{c['points'][row_id]:g}")
+        console.print(table)
+
+    def show_driver_results(self, archive, name, season=None):
+        t = archive.tables["results"]
+        rows = archive.driver_rows("results", name, archive.race("results", season) if season else None)
+        if not rows:
+            console.print(f"[bold red]NO RESULT:[/] No results for '{escape(name)}'" + (f" in {season}." if season else "."))
+            return COMMAND_FAILED
+        c = t.columns
+        positions = [c["position"][row_id] for row_id in rows]
+        drivers = sorted({t.value("driver", row_id) for row_id in rows})
+        summary = (f"[bold white]{escape(', '.join(drivers))}:[/] {len(rows)} starts, "
+                   f"[gold1]{positions.count(1)} wins[/], {sum(1 for p in positions if 1 <= p <= 3)} podiums, "
+                   f"{sum(c['points'][row_id] for row_id in rows):g} points")
+        if season is None:
+            # Career view: one line per season
+            table = Table(title="CAREER", border_style="red")
+            for column, justify in (("Season", "center"), ("Team", "left"), ("Starts", "right"),
+                                    ("Wins", "right"), ("Podiums", "right"), ("Points", "right")):
+                table.add_column(column, justify=justify)
+            for year, group in itertools.groupby(rows, key=lambda row_id: c["season"][row_id]):
+                group = list(group)
+                finishes = [c["position"][row_id] for row_id in group]
+                teams = dict.fromkeys(t.value("constructor", row_id) for row_id in group)
+                table.add_row(str(year), ", ".join(teams), str(len(group)), str(finishes.count(1)),
+                              str(sum(1 for p in finishes if 1 <= p <= 3)),
+                              f"{sum(c['points'][row_id] for row_id in group):g}")
+        else:
+            table = Table(title=f"{season} RACE BY RACE", border_style="red")
+            for column, justify in (("Rd", "right"), ("Grand Prix", "left"), ("Team", "left"),
+                                    ("Grid", "right"), ("Finish", "right"), ("Pts", "right")):
+                table.add_column(column, justify=justify)
+            for row_id in rows:
+                position = c["position"][row_id]
+                table.add_row(str(c["round"][row_id]), t.value("race", row_id), t.value("constructor", row_id),
+                              str(c["grid"][row_id] or "PL"), str(position) if position else t.value("status", row_id),
+                              f"{c['points'][row_id]:g}")
+        console.print(table)
+        console.print(summary)
+
+
+    @command("pace", usage="pace <driver> [season] [round|race]", summary="Lap Time Analysis")
+    def cmd_pace(self, arg_string=None):
+        """Stints, tyre wear, gaps and pace percentiles from the archive's lap times."""
+        driver, _, rest = (arg_string or "").strip().partition(" ")
+        season, _, race = rest.strip().partition(" ")
+        if season and not season.isdigit():
+            season, race = "", rest.strip()
+        if not driver:
+            console.print("[yellow]Engineer:[/ yellow] Usage: pace <driver> \\[season] \\[round|race]")
+            return COMMAND_FAILED
+        try:
+            load_part("numpy")
+        except ImportError:
+            console.print("[bold red]PACE FAILURE:[/] Lap analytics need numpy ([green]pip install numpy[/]).")
+            return COMMAND_FAILED
+
+        archive = results_archive()
+        if "laps" not in archive.tables:
+            console.print("[yellow]Engineer:[/ yellow] No lap times in the archive. Import a dump that has them "
+                          "(lap_times.csv) with results --import <dir>")
+            return COMMAND_FAILED
+        seasons = archive.tables["laps"].columns["season"]
+        season = int(season) if season else seasons[len(seasons) - 1]
+
+        if not race.strip():
+            return self.show_season_pace(archive, season, driver)
+        round_number = archive.find_round(season, race.strip())
+        if not round_number or not archive.race("laps", season, round_number):
+            console.print(f"[bold red]NO RESULT:[/] No lap times for '{escape(race.strip())}' in {season}.")
+            return COMMAND_FAILED
+
+        started = time.perf_counter()
+        pace = RacePace(archive, season, round_number)
+        rows = pace.rows_for(driver)
+        if len(rows) != 1:
+            names = ", ".join(pace.names[code] for code in pace.codes[rows])
+            console.print(f"[bold red]NO RESULT:[/] '{escape(driver)}' didn't race there."
+                          if not len(rows) else f"[yellow]Engineer:[/ yellow] Which one? {escape(names)}")
+            return COMMAND_FAILED
+        row = rows[0]
+        self.show_race_pace(archive, pace, row, season, round_number, time.perf_counter() - started)
+
+    def race_name(self, archive, season, round_number):
+        rows = archive.race("results", season, round_number) if archive.ready else range(0)
+        return archive.tables["results"].value("race", rows[0]) if rows else f"Round {round_number}"
+
+    def show_race_pace(self, archive, pace, row, season, round_number, elapsed):
+        name = pace.names[pace.codes[row]]
+        stints = Table(title=f"{name.upper()} - {season} {self.race_name(archive, season, round_number).upper()}",
+                       border_style="red")
+        stints.add_column("Stint", justify="right", style="dim")
+        stints.add_column("Laps", justify="center")
+        stints.add_column("Tyre (est.)")
+        stints.add_column("Clean", justify="right", style="dim")
+        stints.add_column("Avg Lap", justify="right", style="bold white")
+        stints.add_column("Wear", justify="right")
+        stints.add_column("", no_wrap=True)
+        for number, (first, last, clean, mean, slope, compound) in enumerate(pace.stints(row), 1):
+            stints.add_row(str(number), f"{first}-{last}",
+                           f"[{TYRE_COLORS[compound]}]{compound}[/]" if compound else "[dim]?[/]", str(clean),
+                           race_time(int(mean * 1000)) if clean else "-",
+                           f"{slope:+.3f}s/lap" if slope is not None else "-",
+                           self.make_bar(slope / 0.15 * 100) if slope is not None else "")
+
+        own, beaten = pace.percentiles(row)
+        if numpy.isfinite(own).all():
+            spread = " / ".join(race_time(int(q * 1000)) for q in own)
+            pace_line = (f"[bold white]Clean laps p10/p50/p90:[/] {spread}   "
+                         f"[bold white]Faster than {beaten:.0f}% of the field[/] {self.make_bar(100 - beaten, 10)}")
+        else:
+            pace_line = "[dim]No clean laps to rank.[/]"
+
+        trace = Table(title="GAP TO LEADER", border_style="dim", header_style="bold magenta")
+        trace.add_column("Lap", justify="right", style="dim")
+        trace.add_column("Pos", justify="right")
+        trace.add_column("Gap", justify="right", style="bold white")
+        trace.add_column("", no_wrap=True)
+        gaps = pace.gaps(row)
+        ran = numpy.flatnonzero(numpy.isfinite(gaps))
+        if len(ran):
+            step = max(1, len(ran) // 15)
+            marks = numpy.unique(numpy.r_[ran[::step], ran[-1]])
+            worst = max(float(numpy.nanmax(gaps[marks])), 1.0)
+            for lap in marks:
+                gap = float(gaps[lap])
+                trace.add_row(str(lap + 1), str(pace.positions[row, lap] or "-"),
+                              "LEADER" if gap <= 0 else f"+{gap:.1f}s", self.make_bar(gap / worst * 100))
+
+        console.print(stints)
+        console.print(pace_line)
+        console.print(trace)
+        neutral = int(pace.neutral.sum())
+        console.print(f"[dim]{pace.laps} laps, {len(pace.codes)} cars"
+                      f"{f', {neutral} neutralised' if neutral else ''} - analysed in {elapsed * 1000:.1f} ms[/]")
+
+    def show_season_pace(self, archive, season, driver):
+        started = time.perf_counter()
+        rounds = season_pace(archive, season, driver)
+        elapsed = time.perf_counter() - started
+        if not rounds:
+            console.print(f"[bold red]NO RESULT:[/] No clean laps for '{escape(driver)}' in {season}.")
+            return COMMAND_FAILED
+        table = Table(title=f"{season} PACE - {escape(driver).upper()}", border_style="red")
+        table.add_column("Rd", justify="right", style="dim")
+        table.add_column("Grand Prix", style="bold white")
+        table.add_column("Clean Laps", justify="right", style="dim")
+        table.add_column("vs Lap Best", justify="right")
+        table.add_column("Field Beaten", justify="right")
+        table.add_column("", no_wrap=True)
+        for round_number, clean, delta, beaten in rounds:
+            table.add_row(str(round_number), self.race_name(archive, season, round_number), str(clean),
+                          f"+{delta:.2f}%", f"{beaten:.0f}%", self.make_bar(100 - beaten, 10))
+        console.print(table)
+        console.print(f"[dim]{len(rounds)} races analysed in {elapsed * 1000:.1f} ms[/]")
+
+    @command("strategy", usage="strategy <circuit>", summary="Race Strategy Simulator",
+             options="--sims N, --seed N, --workers N, --laps N")
+    def cmd_strategy(self, arg_string=None):
+        """Monte Carlo over one- and two-stop plans for a circuit."""
+        flags, circuit = parse_flags(arg_string, options=("--sims", "--seed", "--workers", "--laps"))
+        try:
+            sims = int(flags["--sims"] or STRATEGY_SIMS)
+            seed = int(flags["--seed"] or STRATEGY_SEED)
+            workers = int(flags["--workers"]) if flags["--workers"] else None
+            laps = int(flags["--laps"]) if flags["--laps"] else None
+            if sims <= 0 or (workers is not None and workers <= 0) or (laps is not None and laps < 3 * MIN_STINT):
+                raise ValueError
+        except ValueError:
+            circuit = None
+        if not circuit:
+            console.print("[yellow]Engineer:[/ yellow] Usage: strategy <circuit> [--sims N] [--seed N] "
+                          "[--workers N] [--laps N]")
+            return COMMAND_FAILED
+
+        try:
+            specs = TRACKS.specs(circuit)
+            if specs is None:  # 'british', 'Albert Park'... via the calendar
+                weekend = race_calendar().find(circuit)
+                specs = TRACKS.specs(weekend.circuit) if weekend else None
+        except (OSError, ValueError):
+            specs = None
+        if specs is None and laps is None:
+            console.print(f"[bold red]NO DATA:[/] No lap count for '{escape(circuit)}'. Try a circuit from "
+                          "[green]map[/], or give one with --laps N.")
+            return COMMAND_FAILED
+        name, km, track_laps = specs or (circuit, None, laps)
+        laps = laps or track_laps
+        profile = CIRCUIT_PROFILES.get(name, DEFAULT_PROFILE)
+
+        started = time.perf_counter()
+        try:
+            with console.status(f"[bold yellow]SIMULATING {sims:,} RACES AT {escape(name.upper())}...[/]",
+                                spinner="dots"):
+                plans, results, races, workers = run_strategy(laps, profile, sims, seed, workers)
+        except ImportError:
+            console.print("[bold red]STRATEGY FAILURE:[/] The simulator needs numpy ([green]pip install numpy[/]).")
+            return COMMAND_FAILED
+        elapsed = time.perf_counter() - started
+
+        best = min(result["sum"] for result in results) / races
+        ranked = sorted(((best + gap, ci, plan, result)
+                         for (gap, ci), plan, result in zip(paired_gaps(results, races), plans, results)),
+                        key=lambda entry: entry[0])
 
+        pit_loss, sc_chance, _ = profile
+        table = Table(title=f"STRATEGY - {name.upper().replace('_', ' ')} ({laps} laps, pit loss {pit_loss}s, "
+                            f"safety car {sc_chance:.0%})", border_style="red")
+        table.add_column("#", justify="right", style="dim")
+        table.add_column("Plan")
+        table.add_column("Stop Window (lap, 90%)")
+        table.add_column("vs Best (paired 95% CI)", justify="right")
+        table.add_column("Wins", justify="right")
+        table.add_column("", no_wrap=True)
+        for pos, (mean, ci, plan, result) in enumerate(ranked[:8], 1):
+            windows = []
+            for counts in result["stops"]:
+                low, median, high = histogram_percentiles(counts)
+                windows.append(f"[bold white]{median}[/] [dim]({low}-{high})[/]")
+            share = 100.0 * result["wins"] / races
+            table.add_row(str(pos), " > ".join(f"[{TYRE_COLORS[c]}]{c}[/]" for c in plan), ", ".join(windows),
+                          "BEST" if pos == 1 else f"+{mean - best:.1f}s ±{ci:.2f}", f"{share:.1f}%",
+                          self.make_bar(share, 10))
+        console.print(table)
+
+        headline = f" - about {race_time(int((best + laps * km / LAP_SPEED * 3600) * 1000))} race time" if km else ""
+        console.print(f"[dim]{races:,} races on {workers} process{'es' if workers > 1 else ''} in {elapsed:.1f}s "
+                      f"({races / elapsed:,.0f}/s), seed {seed}{headline}[/]")
+        self.tyre_compound = ranked[0][2][0]
+        console.print(f"[dim italic]Fitted {self.tyre_compound} tyres for the start.[/]")
+
+    @command("telemetry", summary="System Status",
+             options="--live, --rate HZ, --fps N, --history 1h, --top N")
+    @fit_parts("psutil", "platform", "rich.live:Live")
+    def cmd_telemetry(self, arg_string=None):
+        """Car status. `telemetry --live [--rate HZ] [--fps N]` keeps it on screen."""
+        flags, _ = parse_flags(arg_string, switches=("--live",), options=("--rate", "--fps", "--history", "--top"))
+        try:
+            rate = float(flags["--rate"] or TELEMETRY_RATE)
+            fps = float(flags["--fps"] or TELEMETRY_FPS)
+            history = parse_duration(flags["--history"]) if flags["--history"] else TELEMETRY_HISTORY
+            top = int(flags["--top"] or TOP_PROCESSES)
+            if rate <= 0 or fps <= 0 or history <= 0 or top < 0:
+                raise ValueError
+        except ValueError:
+            console.print("[yellow]Engineer:[/ yellow] Usage: telemetry [--top N] [--live [--rate HZ] [--fps N] [--history 2h]]")
+            return COMMAND_FAILED
+
+        if not flags["--live"]:
+            scanner = ProcessScanner(top)
+            scanner.scan()  # Baseline - the 0.1 s CPU window below is the delta
+            snapshot = read_telemetry(cpu_interval=0.1)
+            snapshot["top"] = scanner.scan()
+            console.print(self.telemetry_panel(self.telemetry_rows(snapshot), frame=self.engine_map_rows(snapshot)))
+            return
+
+        # Sampling runs on its own thread; drawing only happens at `fps` and
+        # only when a value on screen actually changed.
+        sampler = TelemetrySampler(rate, history, top)
+        sampler.start()
+        subtitle = f"LIVE {rate:g} Hz | Ctrl-C to box"
+        shown = None
+        try:
+            with Live(console=console, auto_refresh=False) as live:
+                while True:
+                    time.sleep(1.0 / fps)
+                    if sampler.latest is None:
+                        continue
+                    rows = self.telemetry_rows(sampler.latest) + self.trace_rows(sampler.history)
+                    frame = self.engine_map_rows(sampler.latest)
+                    if (rows, frame) != shown:
+                        live.update(self.telemetry_panel(rows, subtitle, frame), refresh=True)
+                        shown = (rows, frame)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            sampler.stop()
+
+    def telemetry_rows(self, snapshot):
+        """(label, value) pairs for the telemetry panel."""
+        cpu_usage = snapshot["cpu"]
+        fuel_level = snapshot["battery"] if snapshot["battery"] is not None else 100
+        charging = "⚡" if snapshot["plugged"] else ""
+        temp_str = f"{snapshot['temp']}°C" if snapshot["temp"] is not None else "NO SENSOR"
+        fuel_color = "green" if fuel_level > 20 else "red blink"
+
+        return [
+            ("Engine Map (CPU)", f"{self.make_bar(cpu_usage)} {cpu_usage}%"),
+            ("ERS Store (RAM)", f"{self.make_bar(snapshot['ram_percent'])} {round(snapshot['ram_used'] / (1024**3), 1)}GB"),
+            ("Fuel Cell (BAT)", f"[{fuel_color}]{fuel_level}% {charging}[/]"),
+            ("Oil Temp", f"[cyan]{temp_str}[/]"),
+        ]
+
+    def trace_rows(self, history, width=30):
+        """Sparklines and p50/p95/p99 from the sampler's ring buffers."""
+        rows = [("", "")]
+        traces = [("Engine Map", history.cpu, "%"), ("ERS Store", history.ram, "%"), ("Oil Temp", history.temp, "°C")]
+        for label, series, unit in traces:
+            if not series.count:
+                continue
+            p50, p95, p99 = series.percentiles()
+            rows.append((f"{label} trace", f"[green]{series.sparkline(width)}[/]"))
+            rows.append(("  p50 / p95 / p99", f"[dim]{p50:.1f} / {p95:.1f} / {p99:.1f} {unit}[/]"))
+
+        shown = history.cores[:8]
+        for number, series in enumerate(shown):
+            rows.append((f"Cylinder {number}", f"[cyan]{series.sparkline(width)}[/]"))
+        if len(history.cores) > len(shown):
+            rows.append(("", f"[dim]+ {len(history.cores) - len(shown)} more cylinders[/]"))
+        return rows
+
+    def engine_map_rows(self, snapshot, per_row=2):
+        """Per-core bars (`per_row` cores a line) and the top process rows."""
+        cells = [f"[dim]C{number:02d}[/] {self.make_bar(load, 10)} {load:5.1f}%"
+                 for number, load in enumerate(snapshot["cores"])]
+        cores = [tuple(cells[i:i + per_row]) for i in range(0, len(cells), per_row)]
+        processes = [(str(pid), name, f"{load:.1f}%") for load, pid, name in snapshot.get("top", [])]
+        return cores, processes
+
+    def telemetry_panel(self, rows, subtitle=None, frame=None):
         grid = Table.grid(expand=True, padding=(0, 2))
         grid.add_column(style="bold white")
         grid.add_column(justify="right")
-        
-        grid.add_row("Engine Map (CPU)", f"{self.make_bar(cpu_usage)} {cpu_usage}%")
-        grid.add_row("ERS Store (RAM)", f"{self.make_bar(ram.percent)} {round(ram.used / (1024**3), 1)}GB")
-        fuel_color = "green" if fuel_level > 20 else "red blink"
-        grid.add_row("Fuel Cell (BAT)", f"[{fuel_color}]{fuel_level}% {charging}[/]")
-        grid.add_row("Oil Temp", f"[cyan]{temp_str}[/]")
+        for label, value in rows:
+            grid.add_row(label, value)
+
+        parts = [grid]
+        if frame is not None:
+            cores, processes = frame
+            engine_map = Table.grid(expand=True, padding=(0, 2))
+            for row in cores:
+                engine_map.add_row(*row)
+            parts += [Text(""), Text("ENGINE MAP (per core)", style="bold white"), engine_map]
+            if processes:
+                table = Table(expand=True, box=None, header_style="bold magenta", padding=(0, 1))
+                table.add_column("PID", style="dim", justify="right")
+                table.add_column("Driver (Process)", style="bold white")
+                table.add_column("CPU", justify="right", style="yellow")
+                for row in processes:
+                    table.add_row(*row)
+                parts += [Text(""), table]
+
+        chassis = f"Chassis: {platform.system()}"
+        return Panel(Group(*parts), title="[bold italic]VF-24 TELEMETRY[/]",
+                     subtitle=f"{chassis} | {subtitle}" if subtitle else chassis,
+                     border_style="cyan", width=60)
+
+    @command("radio", "help", summary="This briefing", background=False)
+    def cmd_radio(self):
+        """Race engineer briefing (help), built from the command registry."""
+        def build():
+            briefing = Table.grid(padding=(0, 2))
+            briefing.add_column(style="green", no_wrap=True)
+            briefing.add_column()
+            for spec in COMMANDS.help_entries():
+                aliases = f" [dim]({', '.join(spec.aliases)})[/]" if spec.aliases else ""
+                briefing.add_row(escape(spec.usage), f"- {escape(spec.summary)}{aliases}")
+                if spec.options:
+                    briefing.add_row("", f"[dim]{escape(spec.options)}[/]")
+            return Panel(Align.center(briefing), title="RACE ENGINEER", border_style="green", padding=(1, 2))
+        RENDER_CACHE.show("radio", None, build)
+
+    @command("clear", summary="Clear Screen", background=False)
+    def cmd_clear(self):
+        console.clear()
+        console.print("[yellow]SAFETY CAR DEPLOYED[/]")
+
+    @command("flag", "exit", "quit", "q", summary="End Session (Exit)", background=False)
+    def cmd_flag(self):
+        console.print(Panel("[bold white]CHECKERED FLAG[/]\n[dim]P1. Great Drive. Session Ended.[/]", style="bold green"))
+        self.garage.shutdown()
+        self.shell.close()
+        if self.last_capture:
+            self.last_capture.discard()
+        self.running = False
+
+    def to_garage(self, command_line, spec):
+        """Starts `command_line` (sans '&') as a background job."""
+        if spec is not None and not spec.background:
+            console.print(f"[yellow]Engineer:[/ yellow] '{spec.name}' can't run in the garage.")
+            return
+        job = self.garage.launch(command_line, job_argv(command_line, spec is not None), self.current_dir)
+        console.print(f"[magenta][{job.number}][/] {escape(command_line)} [dim]- in the garage. "
+                      f"'fg {job.number}' to watch, 'kill %{job.number}' to stop.[/]")
+
+    def announce_jobs(self):
+        for job in self.garage.newly_finished():
+            style = "green" if job.state == "Done" else "red"
+            console.print(f"[magenta][{job.number}][/] [{style}]{job.state}[/]  {escape(job.command)}")
+
+    @command("jobs", summary="Background jobs ('<command> &' starts one)", background=False)
+    def cmd_jobs(self):
+        if not self.garage.jobs:
+            console.print("[dim]Garage is empty. End a command with '&' to run it in the background.[/]")
+            return
+        table = Table(title="THE GARAGE", header_style="bold magenta")
+        table.add_column("Job", justify="right", style="bold magenta")
+        table.add_column("State")
+        table.add_column("Time", justify="right")
+        table.add_column("Output", justify="right", style="dim")
+        table.add_column("Command", style="bold white")
+        now = time.time()
+        for job in self.garage.jobs.values():
+            style = "yellow" if job.running else ("green" if job.state == "Done" else "red")
+            elapsed = (job.finished or now) - job.started
+            table.add_row(str(job.number), f"[{style}]{job.state}[/]", f"{elapsed:.1f}s",
+                          format_size(job.capture.bytes), escape(job.command))
+        console.print(table)
+
+    @command("fg", usage="fg [job]", summary="Watch a job's output (Ctrl-C leaves it running)", background=False)
+    def cmd_fg(self, arg_string=None):
+        job = self.garage.find(arg_string)
+        if job is None:
+            console.print("[bold red]SECTOR ERROR:[/] No such job. See [green]jobs[/].")
+            return COMMAND_FAILED
+
+        out = sys.stdout.buffer if hasattr(sys.stdout, "buffer") else None
+        def show(chunk):
+            if out is not None:
+                out.write(chunk)
+                out.flush()
+            else:
+                sys.stdout.write(chunk.decode("utf-8", "replace"))
 
-        panel = Panel(grid, title="[bold italic]VF-24 TELEMETRY[/]", subtitle=f"Chassis: {self.platform_os}", border_style="cyan", width=60)
-        console.print(panel)
+        console.print(f"[magenta][{job.number}][/] [dim]{escape(job.command)}[/]")
+        sys.stdout.flush()
+        job.attach(show)
+        try:
+            while job.running:
+                time.sleep(0.05)
+        except KeyboardInterrupt:
+            job.detach()
+            console.print(f"\n[magenta][{job.number}][/] [dim]Back in the garage, still running.[/]")
+            return
+        job.detach()
+        job.reported = True
+        style = "green" if job.state == "Done" else "red"
+        console.print(f"[magenta][{job.number}][/] [{style}]{job.state}[/]")
+        # Watched to the end - its output moves to the onboard camera for paging/--grep
+        self.garage.jobs.pop(job.number, None)
+        if self.last_capture:
+            self.last_capture.discard()
+        self.last_capture = job.capture
+
+    @command("kill", usage="kill %<job>", summary="Stop a background job (PIDs and signals go to the shell)",
+             background=False)
+    def cmd_kill(self, arg_string=None):
+        ref = (arg_string or "").strip()
+        if ref and not ref.startswith("%"):
+            return self.relay(f"kill {ref}")  # A PID or signal, as in any shell - jobs are %N
+        job = self.garage.find(ref) if ref else None
+        if job is None:
+            console.print("[yellow]Engineer:[/ yellow] Usage: kill %<job>   (see [green]jobs[/])")
+            return COMMAND_FAILED
+        if not job.running:
+            console.print(f"[magenta][{job.number}][/] [dim]already {job.state.lower()}.[/]")
+            self.garage.remove(job)
+            return
+        self.garage.kill(job)
+        try:
+            job.future.result(timeout=5)
+        except Exception:
+            pass
+        console.print(f"[magenta][{job.number}][/] [red]{job.state}[/]  {escape(job.command)}")
+        job.reported = True
 
+    @command("box", "cd", usage="box <dir>", summary="Change directory", background=False)
     def cmd_box(self, target_path):
         if not target_path:
             console.print("[yellow]Engineer:[/ yellow] Usage: box <directory>")
-            return
+            return COMMAND_FAILED
         
         # Strip quotes just in case
         clean_path = target_path.strip('"').strip("'")
@@ -1204,15 +4142,163 @@ B##!                                     J&#5             ^G##GG#&#P!     !P&&P!
             
         except FileNotFoundError:
             console.print("[bold red]GRAVEL TRAP![/] Directory not found.")
+            return COMMAND_FAILED
         except PermissionError:
             console.print("[bold red]BLACK FLAG![/] Permission denied.")
+            return COMMAND_FAILED
+
+    def relay(self, command, on_output=None):
+        """Passes a command through to the system shell (kept alive between laps).
+        With `on_output` the output is captured in chunks instead of shown."""
+        console.print(f"[dim]Relaying to Race Control...[/]")
+        sys.stdout.flush()
+
+        if sys.platform == "win32":
+            try:
+                if on_output is None:
+                    return subprocess.run(command, shell=True, cwd=self.current_dir).returncode
+                proc = subprocess.Popen(command, shell=True, cwd=self.current_dir,
+                                        stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+                with proc.stdout:
+                    for chunk in iter(lambda: proc.stdout.read1(65536), b""):
+                        on_output(chunk)
+                return proc.wait()
+            except OSError:
+                console.print("[bold red]MECHANICAL FAILURE[/]")
+                return COMMAND_FAILED
+
+        try:
+            status, shell_dir = self.shell.run(command, self.current_dir, on_output)
+        except OSError:
+            console.print("[bold red]MECHANICAL FAILURE[/]")
+            return COMMAND_FAILED
+
+        if status is None:
+            console.print("[dim]Race Control closed the channel. A fresh shell will be fitted next lap.[/]")
+        elif shell_dir and shell_dir != self.current_dir and os.path.isdir(shell_dir):
+            # e.g. pushd / "cd x && make" - follow the shell to its new sector
+            os.chdir(shell_dir)
+            self.current_dir = shell_dir
+        return status
+
+    @command("onboard", usage="onboard <cmd>", summary="Run a command with captured, pageable output",
+             background=False)
+    @fit_parts("rich.live:Live")
+    def cmd_onboard(self, arg_string):
+        """Runs a command with its output captured: a throttled live tail while
+        it runs, then paging (`onboard`) and search (`onboard --grep <re>`)."""
+        if arg_string and arg_string.startswith("--grep"):
+            flags, _ = parse_flags(arg_string, options=("--grep",))
+            return self.search_capture(flags["--grep"])
+        if not arg_string:
+            return self.page_capture()
+
+        if self.last_capture:
+            self.last_capture.discard()
+        capture = self.last_capture = OnboardCapture(arg_string)
+        height = max(console.height - 6, 5)
+        last_frame = 0.0
+
+        with Live(capture.render(height), console=console, auto_refresh=False, transient=True) as live:
+            def on_output(chunk):
+                nonlocal last_frame
+                capture.feed(chunk)
+                now = time.monotonic()
+                if now - last_frame >= 1 / ONBOARD_FPS:
+                    last_frame = now
+                    live.update(capture.render(height), refresh=True)
+            try:
+                status = self.relay(arg_string, on_output)
+            finally:
+                capture.finish()
+
+        if capture.in_memory and capture.lines <= height:
+            with capture.open() as fh:
+                console.print(Text.from_ansi(fh.read().decode("utf-8", "replace").rstrip("\n")))
+        else:
+            console.print(Text.from_ansi("\n".join(list(capture.tail)[-10:])))
+            console.print(f"[cyan]ONBOARD:[/] {capture.lines} lines ({format_size(capture.bytes)}) captured. "
+                          "[green]onboard[/] to page it, [green]onboard --grep <pattern>[/] to search.")
+        if status:
+            console.print(f"[dim]Exit status {status}[/]")
+        return status
+
+    def page_capture(self):
+        capture = self.last_capture
+        if capture is None:
+            console.print("[yellow]Engineer:[/ yellow] Nothing recorded yet. Usage: onboard <command>")
+            return COMMAND_FAILED
+        if capture.in_memory:
+            with capture.open() as fh, console.pager(styles=True):
+                console.print(Text.from_ansi(fh.read().decode("utf-8", "replace")))
+            return
+        pager = os.environ.get("PAGER") or ("less -R" if shutil.which("less") else None)
+        if not pager:
+            console.print("[bold red]NO PAGER:[/] Set $PAGER, or use onboard --grep <pattern>.")
+            return COMMAND_FAILED
+        subprocess.run(f"{pager} {shlex.quote(capture.spill_path)}", shell=True)
+
+    def search_capture(self, pattern, limit=200):
+        """Streams the last capture line by line and prints the matches."""
+        capture = self.last_capture
+        if capture is None or not pattern:
+            console.print("[yellow]Engineer:[/ yellow] Usage: onboard --grep <pattern> (after onboard <command>)")
+            return COMMAND_FAILED
+        try:
+            search = re.compile(pattern.strip('"').strip("'")).search
+        except re.error as e:
+            console.print(f"[bold red]BAD REGEX:[/] {e}")
+            return COMMAND_FAILED
+
+        hits = 0
+        with capture.open() as fh:
+            for number, raw in enumerate(fh, 1):
+                line = raw.decode("utf-8", "replace").rstrip("\r\n")
+                if not search(line):
+                    continue
+                hits += 1
+                if hits <= limit:
+                    console.print(Text.assemble((f"{number:>7} ", "dim"), Text.from_ansi(line)))
+        if hits > limit:
+            console.print(f"[dim]... + {hits - limit} more matches[/]")
+        console.print(f"[cyan]ONBOARD:[/] {hits} matching lines.")
+
+    def dispatch(self, user_input, on_output=None):
+        """Runs one command line. Returns its exit status: a relayed line's
+        from the system shell (its output goes to `on_output` if given), a
+        command's own (COMMAND_FAILED if it failed), None for success.
+        'flag' clears self.running."""
+        # --- MANUAL PARSING FOR ROBUSTNESS ---
+        # We strip the command, and take the rest as the raw argument string
+        # This perfectly handles spaces: "box My Folder Name" -> "My Folder Name"
+        parts = user_input.split(" ", 1)
+        arg_string = parts[1] if len(parts) > 1 else None
+
+        spec = COMMANDS.lookup(parts[0].lower())
+        if self.interactive and BACKGROUND_MARK.search(user_input):
+            self.to_garage(BACKGROUND_MARK.sub("", user_input).strip(), spec)
+            return None
+        if spec is None:
+            # Pass through to system shell
+            return self.relay(user_input, on_output=on_output)
+
+        try:
+            handler = COMMANDS.resolve(spec)
+        except Exception as e:
+            console.print(f"[bold red]SECTOR ERROR:[/] Plugin '{spec.name}' failed to load: {e}")
+            return COMMAND_FAILED
+        status = handler(self, arg_string) if spec.takes_arg else handler(self)
+        return status if isinstance(status, int) else None  # Plugins may return anything
 
     def run(self):
         self.boot_sequence()
+        stopwatch_lap()
+        self.interactive = True
         
-        while True:
+        while self.running:
             try:
                 self.lap_count += 1
+                self.announce_jobs()
                 
                 # Standard Python Input
                 user_input = console.input(self.get_prompt())
@@ -1220,79 +4306,242 @@ B##!                                     J&#5             ^G##GG#&#P!     !P&&P!
                 if not user_input.strip():
                     continue
 
-                # --- MANUAL PARSING FOR ROBUSTNESS ---
-                # We strip the command, and take the rest as the raw argument string
-                # This perfectly handles spaces: "box My Folder Name" -> "My Folder Name"
-                parts = user_input.split(" ", 1)
-                command = parts[0].lower()
-                arg_string = parts[1] if len(parts) > 1 else None
-
-                # --- COMMANDS ---
-                if command in ["flag", "exit", "quit", "q"]:
-                    console.print(Panel("[bold white]CHECKERED FLAG[/]\n[dim]P1. Great Drive. Session Ended.[/]", style="bold green"))
-                    break
-                
-                elif command == "clear":
-                    console.clear()
-                    console.print("[yellow]SAFETY CAR DEPLOYED[/]")
-                    
-                elif command in ["grid","ls","dir"]: 
-                    # Passes the raw argument string (e.g., "Folder Name")
-                    self.cmd_grid(arg_string)
-                    
-                elif command in ["box","cd"]: 
-                    self.cmd_box(arg_string)
-                    
-                elif command == "telemetry": 
-                    self.cmd_telemetry()
-                    
-                elif command == "champions":
-                    self.cmd_champions()
-
-                elif command == "map":
-                    self.cmd_map(arg_string)
-
-                elif command == "next":
-                    self.cmd_next()
-
-                elif command == "news":
-                    self.cmd_news()
-
-                elif command == "drs":
-                    self.cmd_drs()
-                
-                elif command == "quote":
-                    self.cmd_quote()
-                    
-                elif command in ["radio","help"]: 
-                    console.print(Panel(
-                        """
-                        [green]grid[/]         - List files (Current or Specific)
-                        [green]box <dir>[/]    - Change directory
-                        [green]telemetry[/]    - Status
-                        [green]champions[/]    - Hall of Fame
-                        [green]clear[/]        - Clear Screen
-                        [green]flag[/]         - End Session (Exit)
-                        [green]map <name>[/]   - Show Track Layout (eg: map monza)
-                        [green]next[/]         - Next Race Countdown
-                        [green]news[/]         - Latest Paddock Headlines
-                        [green]drs[/]          - Network Speed Test
-                        [green]quote[/]        - Iconic Radio Messages in F1
-                        """,
-                        title="RACE ENGINEER", border_style="green"
-                    ))
-                
-                else:
-                    # Pass through to system shell
-                    console.print(f"[dim]Relaying to Race Control...[/]")
-                    try: os.system(user_input)
-                    except: console.print("[bold red]MECHANICAL FAILURE[/]")
+                self.dispatch(user_input)
 
             except KeyboardInterrupt:
                 console.print("\n[bold red]RED FLAG![/] (Type 'flag' to exit)")
             except Exception as e:
                 console.print(f"[bold red]CRITICAL FAILURE:[/] {e}")
 
+    def run_batch(self, commands, output_format="text"):
+        """Runs commands without the start sequence or prompt. Returns the
+        process exit code: 1 if any command failed or exited non-zero.
+
+        "text" prints each command's screen as usual. "json" writes one JSON
+        object per command (command, ok, exit, seconds, output) - the output
+        is the plain text of what the command printed, shell output included.
+        """
+        stopwatch_lap()
+        self.shell.detached = True
+        failed = False
+        out = sys.stdout
+        screen = console.file
+        try:
+            for user_input in commands:
+                if not self.running:
+                    break
+                self.lap_count += 1
+                started = time.perf_counter()
+                status, error = None, None
+
+                if output_format == "json":
+                    buffer = io.StringIO()
+                    shell_output = bytearray()
+                    console.file = buffer
+                    try:
+                        status = self.dispatch(user_input, on_output=shell_output.extend)
+                    except Exception as e:
+                        error = e
+                    finally:
+                        console.file = screen
+                    text = ANSI_ESCAPE.sub("", buffer.getvalue())
+                    if shell_output:
+                        text += shell_output.decode("utf-8", "replace")
+                    record = {"command": user_input, "ok": error is None and not status,
+                              "exit": status, "seconds": round(time.perf_counter() - started, 6),
+                              "output": text}
+                    if error is not None:
+                        record["error"] = str(error)
+                    out.write(json.dumps(record) + "\n")
+                else:
+                    try:
+                        status = self.dispatch(user_input)
+                    except Exception as e:
+                        error = e
+                        console.print(f"[bold red]CRITICAL FAILURE:[/] {e}")
+                failed = failed or error is not None or bool(status)
+        except KeyboardInterrupt:
+            console.file = screen
+            console.print("[bold red]RED FLAG![/] Batch stopped.")
+            failed = True
+        finally:
+            out.flush()
+            if self.running:
+                self.shell.close()
+                if self.last_capture:
+                    self.last_capture.discard()
+        return 1 if failed else 0
+
+def stopwatch_lap():
+    """Reports time-since-launch on stderr once, when F1_PROMPT_STOPWATCH asks."""
+    global PROMPT_STOPWATCH
+    if PROMPT_STOPWATCH:
+        sys.stderr.write(f"{PROMPT_STOPWATCH} {time.perf_counter() - LAUNCH_CLOCK}\n")
+        sys.stderr.flush()
+        PROMPT_STOPWATCH = None
+
+PROMPT_STOPWATCH = os.environ.get("F1_PROMPT_STOPWATCH")
+
+def startup_profile():
+    """Prints an import-time breakdown of launch, plus what each lazy part costs."""
+    if getattr(sys, 'frozen', False):
+        console.print("[bold red]NO TELEMETRY:[/] Startup profile needs the source build.")
+        return
+
+    module_name = os.path.splitext(os.path.basename(__file__))[0]
+    marker = "@@PITLANE"
+    script = (
+        "import sys, time\n"
+        f"sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})\n"
+        f"sys.stderr.write('{marker} startup\\n')\n"
+        "t0 = time.perf_counter()\n"
+        f"import {module_name} as f1\n"
+        "t1 = time.perf_counter()\n"
+        "f1.PitWallOS()\n"
+        "t2 = time.perf_counter()\n"
+        f"sys.stderr.write(f'{marker} deferred {{t1 - t0}} {{t2 - t1}}\\n')\n"
+        "for deps in f1.COMMAND_DEPS.values():\n"
+        "    for spec in deps:\n"
+        f"        sys.stderr.write(f'{marker} part {{spec}}\\n')\n"
+        "        f1.load_part(spec)\n"
+    )
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                            capture_output=True, text=True)
+
+    # "import time: self | cumulative | name" - nesting depth is the name's indent.
+    # Startup rows are what f1 itself pulls in (depth 1), parts are top level.
+    phase, part = None, None
+    startup, deferred = [], {}
+    import_time, init_time = 0.0, 0.0
+    for line in result.stderr.splitlines():
+        if line.startswith(marker):
+            fields = line.split()
+            phase = fields[1]
+            if phase == "deferred":
+                import_time, init_time = float(fields[2]), float(fields[3])
+            elif phase == "part":
+                part = fields[2]
+            continue
+        if not line.startswith("import time:") or phase is None:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        self_us, cumulative_us, name = fields
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        row = (name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000)
+        if phase == "startup" and depth == 1:
+            startup.append(row)
+        elif phase == "part" and depth == 0:
+            deferred.setdefault(part, []).append(row)
+
+    table = Table(title="PIT LANE STOPWATCH (Startup Imports)", header_style="bold magenta")
+    table.add_column("Module", style="bold white")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Cumulative (ms)", justify="right", style="yellow")
+    for name, self_ms, cumulative_ms in sorted(startup, key=lambda r: r[2], reverse=True)[:15]:
+        table.add_row(name, f"{self_ms:.1f}", f"{cumulative_ms:.1f}")
+    console.print(table)
+
+    table = Table(title="PARTS BIN (Loaded On Demand)", header_style="bold magenta")
+    table.add_column("Command", style="bold cyan")
+    table.add_column("Part", style="bold white")
+    table.add_column("Cost (ms)", justify="right", style="yellow")
+    for command, specs in COMMAND_DEPS.items():
+        for spec in specs:
+            cost = sum(r[2] for r in deferred.get(spec, []))
+            table.add_row(command, spec, f"{cost:.1f}" if cost else "[dim]already fitted[/]")
+    console.print(table)
+
+    console.print(f"[bold white]import {module_name}:[/] {import_time * 1000:.1f} ms   "
+                  f"[bold white]PitWallOS():[/] {init_time * 1000:.1f} ms")
+    return time_to_prompt()
+
+def time_to_prompt(budget=STARTUP_BUDGET):
+    """Launches a real session, times process start -> ready for the first
+    command against the budget and returns True if it made it."""
+    marker = "@@PROMPT"
+    env = dict(os.environ, F1_PROMPT_STOPWATCH=marker)
+    started = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--no-boot", "-c", "flag"],
+                            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True, env=env)
+    elapsed, in_process = None, None
+    for line in proc.stderr:
+        if line.startswith(marker):
+            elapsed = time.perf_counter() - started
+            in_process = float(line.split()[1])
+            break
+    proc.communicate()
+
+    if elapsed is None:
+        console.print("[bold red]SECTOR ERROR:[/] The session never reached the prompt.")
+        return False
+    made_it = elapsed <= budget
+    verdict = "[bold green]INSIDE BUDGET[/]" if made_it else "[bold red]OVER BUDGET[/]"
+    console.print(f"[bold white]Time to first prompt:[/] {elapsed * 1000:.0f} ms "
+                  f"[dim](interpreter {(elapsed - in_process) * 1000:.0f} ms + f1 {in_process * 1000:.0f} ms)[/]  "
+                  f"{verdict} [dim]budget {budget * 1000:.0f} ms[/]")
+    return made_it
+
+
+def main(argv=None):
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+        multiprocessing.freeze_support()  # Bundled builds start strategy workers through main()
+    import argparse
+    parser = argparse.ArgumentParser(prog="f1", description="Formula1_OS - an F1 pit wall for your terminal.")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print an import-time breakdown of launch, time to first prompt, and exit "
+                             "(non-zero if over the startup budget)")
+    parser.add_argument("-c", "--command", action="append", metavar="COMMANDS",
+                        help='batch: run commands and exit, e.g. -c "next; champions; map monza"')
+    parser.add_argument("script", nargs="?", metavar="SCRIPT",
+                        help="batch: run commands from a file, one per line ('-' for stdin). "
+                             "Piped stdin is read as a script too")
+    parser.add_argument("--format", choices=("text", "json"), default="text",
+                        help="batch output: the usual screens or one JSON object per command")
+    boot = parser.add_mutually_exclusive_group()
+    boot.add_argument("--no-boot", dest="boot", action="store_const", const="off",
+                      help="skip the start sequence (or set F1_BOOT=off)")
+    boot.add_argument("--fast-boot", dest="boot", action="store_const", const="fast",
+                      help="a quick start sequence (or set F1_BOOT=fast)")
+    parser.add_argument("--serve-telemetry", nargs="?", const="127.0.0.1:9101", metavar="HOST:PORT",
+                        help="headless: serve telemetry on HTTP (/metrics, /snapshot.json), default 127.0.0.1:9101")
+    parser.add_argument("--telemetry-jsonl", metavar="FILE",
+                        help="headless: append one JSON line per telemetry sample to FILE ('-' for stdout)")
+    parser.add_argument("--telemetry-rate", type=float, default=TELEMETRY_RATE, metavar="HZ",
+                        help=f"headless: samples per second (default {TELEMETRY_RATE:g})")
+    args = parser.parse_args(argv)
+
+    if args.startup_profile:
+        if startup_profile() is False:
+            sys.exit(1)
+        return
+
+    if args.serve_telemetry or args.telemetry_jsonl:
+        if args.telemetry_rate <= 0:
+            parser.error("--telemetry-rate must be positive")
+        serve_telemetry(args.serve_telemetry, args.telemetry_jsonl, args.telemetry_rate)
+        return
+
+    os_sim = PitWallOS(boot_mode=args.boot or BOOT_MODE)
+    if args.command or args.script or not sys.stdin.isatty():
+        if args.script and args.script != "-":
+            try:
+                with open(args.script, encoding="utf-8") as fh:
+                    script = fh.read()
+            except OSError as e:
+                parser.error(f"can't read script: {e}")
+        elif args.command and not args.script:
+            script = "\n".join(args.command)
+        else:
+            script = sys.stdin.read()
+        if args.command and args.script:
+            script = "\n".join(args.command) + "\n" + script
+        sys.exit(os_sim.run_batch(split_commands(script), args.format))
+    os_sim.run()
+
+
 if __name__ == "__main__":
-    os_sim = PitWallOS()
-    os_sim.run()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# f1.py is a single script, not a package: make it importable as `f1`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
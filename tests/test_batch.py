@@ -0,0 +1,25 @@
+import json
+import subprocess
+import sys
+
+import f1
+
+def batch(commands, *extra):
+    return subprocess.run([sys.executable, f1.__file__, "--no-boot", "-c", commands, *extra],
+                          stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=60)
+
+def test_failed_builtin_is_reported_and_sets_the_exit_code():
+    result = batch("map monza; map nowhere; season 1800; true", "--format", "json")
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [(r["command"], r["ok"]) for r in records] == [
+        ("map monza", True), ("map nowhere", False), ("season 1800", False), ("true", True)]
+    assert records[1]["exit"] == f1.COMMAND_FAILED
+    assert "not in simulation database" in records[1]["output"]
+    assert result.returncode == 1
+
+def test_clean_batch_exits_zero():
+    assert batch("map monza; champions --driver senna").returncode == 0
+
+def test_text_mode_exits_nonzero_on_failure():
+    assert batch("false").returncode == 1
+    assert batch("champions --driver nobody").returncode == 1
@@ -0,0 +1,16 @@
+import f1
+
+def test_only_race_starts_are_taken_as_published():
+    calendar = f1.RaceCalendar()
+    for weekend in calendar.weekends:
+        assert weekend.sessions[-1][0] == "Race"
+        assert "Race" not in weekend.estimated
+        assert weekend.estimated == {name for name, _ in weekend.sessions[:-1]}
+
+def test_next_session_skips_to_the_soonest_start():
+    calendar = f1.RaceCalendar()
+    weekend = calendar.weekends[0]
+    (first, first_start), (second, second_start) = weekend.sessions[:2]
+    assert calendar.next_session(first_start - 1) == (weekend, first, first_start)
+    assert calendar.next_session(first_start) == (weekend, second, second_start)
+    assert calendar.next_session(calendar.race_starts[-1]) is None
@@ -0,0 +1,25 @@
+import pytest
+
+import f1
+
+NAMES = ["Kimi Räikkönen", "Lewis Hamilton", "Nico Hülkenberg", "Max Verstappen", "Jean-Éric Vergne", ""]
+
+@pytest.mark.parametrize("text", ["raik", "RÄIK", "ham", "n", "", "s h", "ver", "éric", "zz", "n hulk"])
+def test_pool_search_matches_a_scan(text):
+    pool = f1.StringPool(NAMES)
+    needle = f1.fold_accents(text)
+    assert pool.search(text) == [code for code, name in enumerate(NAMES) if needle in f1.fold_accents(name)]
+
+def test_pool_search_sees_values_interned_later():
+    pool = f1.StringPool(NAMES)
+    assert pool.search("leclerc") == []
+    code = pool.intern("Charles Leclerc")
+    assert pool.search("leclerc") == [code]
+
+def test_champions_query_filters():
+    db = f1.ChampionsDB()
+    t = db.table
+    rows = db.query(driver="schumacher", team="ferrari", since=2001)
+    assert [t.columns["season"][r] for r in rows] == [2001, 2002, 2003, 2004]
+    assert {t.value("driver", r) for r in db.query(driver="RÄIKKÖNEN")} == {"Kimi Raikkonen"}
+    assert all(t.columns["season"][r] // 10 == 195 for r in db.query(decade=1957))
@@ -0,0 +1,111 @@
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import f1
+
+IMAGE = b"\xff" * (256 * 1024)
+
+class SpeedtestStandIn(BaseHTTPRequestHandler):
+    """latency.txt, the download image and upload.php, as a speedtest.net server has them."""
+    uploaded = 0
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        body = {"/latency.txt": b"test=test\n", f"/{f1.DRS_DOWNLOAD_FILE}": IMAGE}.get(path)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path.split("?", 1)[0] != "/upload.php":
+            self.send_error(404)
+            return
+        remaining = int(self.headers["Content-Length"])
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, 65536)))
+        body = f"size={self.headers['Content-Length']}".encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def speedtest_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SpeedtestStandIn)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+def test_speed_trap_counts_bytes_and_reports_progress(speedtest_server):
+    trap = f1.SpeedTrap(speedtest_server, threads=2, duration=0.6)
+    assert trap.latency() > 0
+
+    progress = []
+    def on_progress(phase, transferred, elapsed):
+        progress.append((phase, transferred, elapsed))
+
+    down = trap.download(on_progress)
+    up = trap.upload(on_progress)
+    assert down > 0 and up > 0
+    for phase, rate in (("download", down), ("upload", up)):
+        reports = [(moved, elapsed) for name, moved, elapsed in progress if name == phase]
+        assert len(reports) >= 2
+        assert [moved for moved, _ in reports] == sorted(moved for moved, _ in reports)
+        assert all(0 < elapsed <= 0.6 for _, elapsed in reports)
+        moved, elapsed = reports[-1]
+        assert moved > 0
+        assert rate == pytest.approx(moved * 8 / elapsed, rel=0.5)
+
+def test_server_url_is_the_upload_url_directory():
+    trap = f1.SpeedTrap.from_server_url("http://speed.example:8080/speedtest/upload.php")
+    assert trap.base_url == "http://speed.example:8080/speedtest/"
+
+def test_drs_server_renders_the_report(speedtest_server):
+    result = subprocess.run(
+        [sys.executable, f1.__file__, "--no-boot", "-c",
+         f"drs --server {speedtest_server} --threads 2 --duration 0.5"],
+        stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=60)
+    assert "AERODYNAMICS REPORT" in result.stdout, result.stdout + result.stderr
+    assert "DRS FAILURE" not in result.stdout
+    for label in ("DOWNFORCE (Download)", "THRUST (Upload)", "REACTION TIME (Ping)"):
+        assert label in result.stdout
+
+@pytest.fixture
+def drs_zone():
+    ready = threading.Event()
+    servers = []
+
+    def on_ready(server):
+        servers.append(server)
+        ready.set()
+    thread = threading.Thread(target=f1.serve_drs, args=("127.0.0.1", 0, on_ready), daemon=True)
+    thread.start()
+    assert ready.wait(10), "the DRS zone never opened"
+    yield servers[0].server_address[1]
+    servers[0].shutdown()
+    thread.join(5)
+
+def test_lan_trap_over_loopback(drs_zone):
+    trap = f1.LanTrap("127.0.0.1", drs_zone, threads=2, duration=0.5)
+    median = trap.latency(samples=20)
+    assert len(trap.rtts) == 20
+    low, p50, p95, high = trap.latency_percentiles()
+    assert 0 < low <= p50 <= p95 <= high
+    assert p50 == median
+    assert trap.jitter() >= 0
+    assert trap.download() > 0
+    assert trap.upload() > 0
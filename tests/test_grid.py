@@ -0,0 +1,61 @@
+import os
+import threading
+
+import f1
+
+def test_size_ranking_bounds_directory_scans(tmp_path, monkeypatch):
+    for n in range(30):
+        folder = tmp_path / f"dir{n:02}" / "inner"
+        folder.mkdir(parents=True)
+        (folder / "data").write_bytes(b"x" * (n * 100))
+    (tmp_path / "file").write_bytes(b"x" * 1450)
+
+    engine = f1.DirSizeEngine(path=str(tmp_path / "dirsizes.json"), workers=2)
+    lock = threading.Lock()
+    in_flight = peak = 0
+    submit = engine.submit
+
+    def counted(path, stop):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        future = submit(path, stop)
+
+        def landed(_):
+            nonlocal in_flight
+            with lock:
+                in_flight -= 1
+        future.add_done_callback(landed)
+        return future
+    engine.submit = counted
+    monkeypatch.setattr(f1, "DIR_SIZES", engine)
+    f1.load_part("concurrent.futures:ThreadPoolExecutor,as_completed")
+
+    with os.scandir(tmp_path) as stream:
+        ranked, more = f1.PitWallOS.grid_ranked(None, stream, "size", 3)
+    assert [entry.name for entry in ranked] == ["dir29", "dir28", "dir27"]
+    assert more == 28
+    assert peak <= 2 * engine.workers
+
+    with os.scandir(tmp_path) as stream:
+        ranked, _ = f1.PitWallOS.grid_ranked(None, stream, "size", 3, reverse=True)
+    assert [entry.name for entry in ranked] == ["dir00", "dir01", "dir02"]
+
+def test_dir_size_cache_keeps_the_most_recently_used(tmp_path):
+    for name in "abcd":
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "data").write_bytes(b"x" * 10)
+    cache = str(tmp_path / "dirsizes.json")
+    stop = threading.Event()
+
+    engine = f1.DirSizeEngine(path=cache, limit=3)
+    engine._load()
+    for name in "abcd":
+        assert engine.size_of(str(tmp_path / name), stop) == 10
+    assert engine.size_of(str(tmp_path / "a"), stop) == 10  # A hit makes it the newest
+    engine.save()
+
+    reloaded = f1.DirSizeEngine(path=cache, limit=3)
+    reloaded._load()
+    assert list(reloaded._entries) == [str(tmp_path / name) for name in "cda"]
@@ -0,0 +1,144 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import f1
+
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Paddock Stand-in</title>
+<item><title>Pole for the home hero</title><link>http://paddock.test/pole</link>
+<pubDate>Sat, 05 Jul 2025 15:00:00 GMT</pubDate></item>
+<item><title>Upgrades arrive for the sprint</title><link>http://paddock.test/upgrades</link>
+<pubDate>Fri, 04 Jul 2025 09:00:00 GMT</pubDate></item>
+</channel></rss>"""
+ETAG = '"lap-1"'
+
+class FeedStandIn(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(FEED)))
+        self.end_headers()
+        self.wfile.write(FEED)
+
+    def log_message(self, *args):
+        pass
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def paddock():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FeedStandIn)
+    server.requests = []  # If-None-Match of every request
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return f1.NewsCache(path=str(tmp_path / "news.json"), ttl=600, timeout=5, clock=clock)
+
+def url_of(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/feed.xml"
+
+def test_first_fetch_keeps_entries_and_etag(paddock, cache, clock):
+    record, state = cache.get(url_of(paddock))
+    assert state == "live"
+    assert record["etag"] == ETAG
+    assert record["fetched"] == clock.now
+    assert [entry["title"] for entry in record["entries"]] == [
+        "Pole for the home hero", "Upgrades arrive for the sprint"]
+    assert record["entries"][0]["source"] == "Paddock Stand-in"
+    assert paddock.requests == [None]
+
+def test_within_the_ttl_the_cache_answers_alone(paddock, cache, clock):
+    cache.get(url_of(paddock))
+    clock.now += 599
+    record, state = cache.get(url_of(paddock))
+    assert state == "fresh"
+    assert paddock.requests == [None]
+
+def test_expired_feed_revalidates_with_a_conditional_get(paddock, cache, clock):
+    first, _ = cache.get(url_of(paddock))
+    clock.now += 601
+    record, state = cache.get(url_of(paddock), background=False)
+    assert state == "live"
+    assert paddock.requests == [None, ETAG]  # Answered 304
+    assert record["entries"] == first["entries"]
+    assert record["fetched"] == clock.now
+
+def test_expired_feed_is_served_stale_while_it_refreshes(paddock, cache, clock):
+    cache.get(url_of(paddock))
+    clock.now += 601
+    record, state = cache.get(url_of(paddock))
+    assert state == "stale"
+    assert record["entries"]
+    deadline = time.monotonic() + 5
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert paddock.requests == [None, ETAG]
+    record, state = cache.get(url_of(paddock))
+    assert state == "fresh"
+    assert record["fetched"] == clock.now
+
+def test_a_new_cache_reads_the_file_back(paddock, cache, tmp_path, clock):
+    cache.get(url_of(paddock))
+    reopened = f1.NewsCache(path=cache.path, ttl=600, clock=clock)
+    record, state = reopened.get(url_of(paddock))
+    assert state == "fresh"
+    assert len(record["entries"]) == 2
+
+def test_dead_feed_falls_back_to_cached_headlines(paddock, cache, clock):
+    url = url_of(paddock)
+    cache.get(url)
+    paddock.shutdown()
+    paddock.server_close()
+    clock.now += 601
+    record, state = cache.get(url, background=False)
+    assert state == "cached"
+    assert len(record["entries"]) == 2
+    assert url in cache.errors
+
+def test_dead_feed_with_nothing_cached_raises(paddock, cache):
+    url = url_of(paddock)
+    paddock.shutdown()
+    paddock.server_close()
+    with pytest.raises(OSError):
+        cache.get(url)
+
+def test_news_shows_a_dead_feed_as_offline(paddock, tmp_path, clock):
+    url = url_of(paddock)
+    clock.now = time.time() - 3600  # Cached an hour ago
+    f1.NewsCache(path=str(tmp_path / "news.json"), clock=clock).get(url)
+    paddock.shutdown()
+    paddock.server_close()
+
+    env = dict(os.environ, F1_CACHE_DIR=str(tmp_path), F1_NEWS_FEEDS=url, COLUMNS="200")
+    result = subprocess.run([sys.executable, f1.__file__, "--no-boot", "-c", "news"], env=env,
+                            stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=60)
+    assert "Pole for the home hero" in result.stdout, result.stdout + result.stderr
+    assert f"OFFLINE: {url}" in result.stdout
+    assert "60 min old" in result.stdout
+    assert "on their way" not in result.stdout
@@ -0,0 +1,9 @@
+import f1
+
+def test_time_to_prompt_within_budget():
+    # Best of three: the first launch may still be writing .pyc files, and a
+    # real regression is over budget every time
+    assert any(f1.time_to_prompt() for _ in range(3)), f"over the {f1.STARTUP_BUDGET:.1f}s startup budget"
+
+def test_time_to_prompt_reports_a_blown_budget():
+    assert f1.time_to_prompt(budget=0.0) is False
@@ -0,0 +1,29 @@
+import numpy
+import pytest
+
+import f1
+
+def test_paired_gaps_match_the_per_race_difference():
+    rng = numpy.random.default_rng(7)
+    common = rng.normal(5400, 30, size=(2000, 1))  # Race-to-race swing every plan shares
+    times = common + rng.normal([0.0, 1.5, 4.0], [1.0, 1.2, 2.0], size=(2000, 3))
+    gaps = times - times.min(axis=1, keepdims=True)
+    cross = gaps.T @ gaps
+    results = [{"sum": float(times[:, i].sum()), "cross": cross[i]} for i in range(3)]
+
+    paired = f1.paired_gaps(results, len(times))
+    for i, (gap, ci) in enumerate(paired):
+        diff = times[:, i] - times[:, 0]
+        assert gap == pytest.approx(diff.mean(), abs=1e-6)
+        assert ci == pytest.approx(1.96 * diff.std(ddof=1) / len(diff) ** 0.5, rel=1e-6, abs=1e-9)
+    # Far tighter than the plans' own spread, which the shared swing dominates
+    assert paired[1][1] < 1.96 * times[:, 1].std() / len(times) ** 0.5 / 10
+
+def test_strategy_batches_merge():
+    f1.load_part("numpy")
+    plans, results, races, workers = f1.run_strategy(60, f1.DEFAULT_PROFILE, sims=2000, seed=1, workers=1)
+    assert races == 2000 and len(results) == len(plans)
+    assert sum(result["wins"] for result in results) == races
+    gaps = f1.paired_gaps(results, races)
+    assert min(gap for gap, _ in gaps) == 0.0
+    assert all(ci >= 0 for _, ci in gaps)
@@ -0,0 +1,60 @@
+import numpy
+import pytest
+
+import f1
+
+@pytest.mark.parametrize("values", [
+    [5.0] * 40,
+    [0.0] + [5.0] * 39,       # psutil's first reading is always 0.0
+    [0.0, 5.0],
+    [float(i % 97) for i in range(500)],
+    [12.5, 12.5, 87.25, 3.0, 3.0, 3.0, 99.5],
+])
+def test_ring_percentiles_interpolate_like_numpy(values):
+    ring = f1.RingSeries(len(values))
+    for value in values:
+        ring.append(value)
+    assert ring.percentiles() == pytest.approx(numpy.percentile(values, (50, 95, 99)), abs=1e-6)
+
+def test_ring_percentiles_forget_overwritten_samples():
+    ring = f1.RingSeries(10)
+    for value in [90.0] * 10 + [5.0] * 10:
+        ring.append(value)
+    assert ring.percentiles() == pytest.approx([5.0, 5.0, 5.0])
+
+@pytest.fixture
+def exporter():
+    f1.load_part("psutil")
+    sampler = f1.TelemetrySampler(rate=1.0, history=60)
+    sampler.latest = {"time": 0.0, "cpu": 5.0, "cores": [5.0], "ram_percent": 40.0, "ram_used": 1 << 30,
+                      "battery": None, "plugged": None, "temp": None, "top": []}
+    for _ in range(20):
+        sampler.history.cpu.append(5.0)
+    sampler.ticks = 20
+    return f1.TelemetryExporter(sampler)
+
+def samples(text):
+    return dict(line.rsplit(" ", 1) for line in text.splitlines() if line and not line.startswith("#"))
+
+def test_metrics_quantiles_report_the_samples(exporter):
+    metrics = samples(exporter.bodies()["metrics"].decode())
+    for q in ("0.5", "0.95", "0.99"):
+        assert float(metrics[f'f1os_cpu_percent_quantile{{quantile="{q}"}}']) == 5.0
+
+def test_counter_declared_under_the_name_it_is_sampled_as(exporter):
+    metrics = exporter.bodies()["metrics"].decode().splitlines()
+    assert "# TYPE f1os_samples_total counter" in metrics
+    assert "f1os_samples_total 20" in metrics
+    # Every sample line belongs to the metric declared just above it
+    declared = None
+    for line in metrics:
+        if line.startswith("# TYPE "):
+            declared = line.split()[2]
+        elif not line.startswith("#"):
+            assert line.split("{")[0].split(" ")[0] == declared
+
+def test_openmetrics_declares_the_counter_family(exporter):
+    lines = exporter.bodies()["openmetrics"].decode().splitlines()
+    assert "# TYPE f1os_samples counter" in lines
+    assert "f1os_samples_total 20" in lines
+    assert lines[-1] == "# EOF"
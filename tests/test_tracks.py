@@ -0,0 +1,41 @@
+import hashlib
+
+import pytest
+
+import f1
+
+# sha256 of each circuit's art as it was written inline in get_track_ascii
+# before it moved to tracks.txt. The art must come back byte for byte -
+# a dropped leading space shears the whole drawing.
+ORIGINAL_ART = {
+    "monza": "c79afc7975e2a0538a5520d4e7303f72874c11c5a5e8ead837d25cd9bfd8197c",
+    "silverstone": "b1dedea5afad729001ed44088e413ec2d33246d3920872f6d9621b7375ea8174",
+    "spa": "7432567f5cab24aac9c22ab5003b993ff99c3e7843b391cfc5c009472d3906f3",
+    "monaco": "a3eee02282b69f46eaf319598ac6e0b71597d761517e746dbe27d8b1dbe4f1d7",
+    "abudhabi": "dc13d7dff0b286dab292a96ae6b0f855ec979c8105716c9d8c5651cf426439a8",
+    "mexico": "cc3a0ebe2a04583aff4236ba777944c62622213f65e1efc8b68fb05c062dcec1",
+    "imola": "89d02f0f641c77992e1915f96da91cc8b90143091e0dcd2e38c5c0d1a5fee09b",
+    "interlagos": "eba5c42b6b1a36510cafcf2dd38d7e785b24b49ef564e1fd6f5abc8e72e6a6c9",
+    "sakhir": "24c7bb2bcec78b4eca01108b8df63ce41f1aa2beb663aa9acc4f2b440a9e3890",
+    "baku": "a1092c8ac0efaa17d2ccb04b4be4bb719fd77e6aba792470cc032baee07dd4fa",
+    "buddh": "3091290f95575402443890160d44a4004324b1524ebbe0ae4945cb0cefa0fb04",
+    "barcelona": "f0c51a1f5fa1fc7ea7eafc9132c56f43d297cd9ecf65c10e4162c6be5353f48c",
+    "montreal": "08560735c51be60c2f39c3a050ee3057d4068af979925d71d1239a4e2eca24ff",
+    "miami": "4b3225451b9d30407708e992f58ce55a6c641d80853d90ce2c26c7b83224f792",
+    "qatar": "25deebad0829d10b93ea981deef03894f4ac40433cdcdd9c05d4e8c09256a1ab",
+    "lasvegas": "86e07c5f833ad05e05df9c740a84cbdc4a40101b6269c80482e9833b2fa8d1ca",
+    "suzuka": "0221cffc2c613e1595dea445994645bae934f6add9f2262f528edb9b34b11620",
+    "singapore": "f30d03f82a3f620c1f49806cd05afc62fc431dae37741e742ba2ac72521a2787",
+}
+
+
+@pytest.mark.parametrize("name", sorted(ORIGINAL_ART))
+def test_track_art_matches_original(name):
+    art = f1.TRACKS.get(name)
+    assert art is not None
+    assert hashlib.sha256(art.encode("utf-8")).hexdigest() == ORIGINAL_ART[name]
+
+
+def test_every_circuit_is_covered():
+    covered = {f1.TRACKS._primary[f1.TRACKS.normalize(name)] for name in ORIGINAL_ART}
+    assert covered == set(f1.TRACKS.names())